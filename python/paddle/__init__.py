@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
 
 import typing
 
@@ -84,12 +85,19 @@ else:
     Tensor = framework.core.eager.Tensor
     Tensor.__qualname__ = 'Tensor'
 
+if typing.TYPE_CHECKING:
+    from paddle import (  # noqa: F401
+        audio,
+        onnx,
+        quantization,
+        sparse,
+        text,
+        vision,
+    )
+
 import paddle.distributed.fleet
-import paddle.text
-import paddle.vision
 from paddle import (  # noqa: F401
     amp,
-    audio,
     autograd,
     dataset,
     decomposition,
@@ -103,15 +111,11 @@ from paddle import (  # noqa: F401
     jit,
     metric,
     nn,
-    onnx,
     optimizer,
-    quantization,
     reader,
     regularizer,
-    sparse,
     static,
     sysconfig,
-    vision,
 )
 
 # high-level api
@@ -749,6 +753,26 @@ from .pir_utils import IrGuard
 ir_guard = IrGuard()
 ir_guard._switch_to_pir()
 
+# Subpackages that are not needed to create and run tensors are imported on
+# first attribute access (PEP 562), so that short-lived processes such as
+# DataLoader workers and inference jobs do not pay for them in ``import paddle``.
+_LAZY_SUBMODULES = frozenset(
+    ['audio', 'onnx', 'quantization', 'sparse', 'text', 'vision']
+)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
+
+
 __all__ = [
     'block_diag',
     'iinfo',
@@ -14,18 +14,55 @@
 # Modified from librosa(https://github.com/librosa/librosa)
 from __future__ import annotations
 
+import functools
 import math
 from typing import TYPE_CHECKING, Literal, TypeVar
 
 import paddle
 from paddle import Tensor
-from paddle.base.framework import Variable
+from paddle.base.framework import Variable, _current_expected_place
 from paddle.pir import Value
 
 if TYPE_CHECKING:
     _TensorOrFloat = TypeVar("_TensorOrFloat", Tensor, float)
 
 
+def _tensor_lru_cache(maxsize=32):
+    """
+    Cache the tensor returned by the decorated function in dynamic mode, keyed
+    by the arguments and the current place. A copy of the cached tensor is
+    returned, so the result can be modified inplace, e.g. as the buffer of a
+    layer, without changing the cache.
+    """
+
+    def decorator(func):
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(place, *args, **kwargs):
+            with paddle.no_grad():
+                return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # tensors are hashed by id, which can not be used as the key
+            if not paddle.in_dynamic_mode() or any(
+                isinstance(arg, (Tensor, Variable, Value))
+                for arg in (*args, *kwargs.values())
+            ):
+                return func(*args, **kwargs)
+            try:
+                hash((args, tuple(kwargs.items())))
+            except TypeError:  # unhashable arguments, e.g. a list
+                return func(*args, **kwargs)
+            place = str(_current_expected_place())
+            return cached(place, *args, **kwargs).clone()
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
 def hz_to_mel(freq: _TensorOrFloat, htk: bool = False) -> _TensorOrFloat:
     """Convert Hz to Mels.
 
@@ -186,6 +223,7 @@ def fft_frequencies(sr: int, n_fft: int, dtype: str = 'float32') -> Tensor:
     return paddle.linspace(0, float(sr) / 2, int(1 + n_fft // 2), dtype=dtype)
 
 
+@_tensor_lru_cache()
 def compute_fbank_matrix(
     sr: int,
     n_fft: int,
@@ -224,9 +262,6 @@ def compute_fbank_matrix(
     if f_max is None:
         f_max = float(sr) / 2
 
-    # Initialize the weights
-    weights = paddle.zeros((n_mels, int(1 + n_fft // 2)), dtype=dtype)
-
     # Center freqs of each FFT bin
     fftfreqs = fft_frequencies(sr=sr, n_fft=n_fft, dtype=dtype)
 
@@ -239,15 +274,14 @@ def compute_fbank_matrix(
     ramps = mel_f.unsqueeze(1) - fftfreqs.unsqueeze(0)
     # ramps = np.subtract.outer(mel_f, fftfreqs)
 
-    for i in range(n_mels):
-        # lower and upper slopes for all bins
-        lower = -ramps[i] / fdiff[i]
-        upper = ramps[i + 2] / fdiff[i + 1]
+    # lower and upper slopes for all bins of all mel bands
+    lower = -ramps[:n_mels] / fdiff[:n_mels].unsqueeze(1)
+    upper = ramps[2 : n_mels + 2] / fdiff[1 : n_mels + 1].unsqueeze(1)
 
-        # .. then intersect them with each other and zero
-        weights[i] = paddle.maximum(
-            paddle.zeros_like(lower), paddle.minimum(lower, upper)
-        )
+    # .. then intersect them with each other and zero
+    weights = paddle.maximum(
+        paddle.zeros_like(lower), paddle.minimum(lower, upper)
+    )
 
     # Slaney-style mel is scaled to be approx constant energy per channel
     if norm == 'slaney':
@@ -303,6 +337,7 @@ def power_to_db(
     return log_spec
 
 
+@_tensor_lru_cache()
 def create_dct(
     n_mfcc: int,
     n_mels: int,
@@ -19,6 +19,8 @@ import numpy as np
 
 import paddle
 
+from .functional import _tensor_lru_cache
+
 if TYPE_CHECKING:
     from paddle import Tensor
 
@@ -338,6 +340,7 @@ def _cosine(M: int, sym: bool = True, dtype: str = 'float64') -> Tensor:
     return _truncate(w, needs_trunc)
 
 
+@_tensor_lru_cache()
 def get_window(
     window: _WindowLiteral | tuple[_WindowLiteral, float],
     win_length: int,
@@ -19,8 +19,8 @@ import logging
 import os
 import sys
 import warnings
-from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Literal, overload
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, overload
 
 import numpy as np
 
@@ -808,6 +808,37 @@ def _can_use_interpreter_core(program, place):
     return True
 
 
+def _set_sequential_run_flags(program):
+    """
+    Turn on the serial run flags of the standalone executor if the program is
+    compiled with :code:`build_strategy.sequential_run`, and return the values
+    to be restored after running.
+    """
+    stored_flag = {}
+    if isinstance(program, compiler.CompiledProgram) or isinstance(
+        program._graph, compiler.CompiledProgram
+    ):
+        compiled_program = (
+            program
+            if isinstance(program, compiler.CompiledProgram)
+            else program._graph
+        )
+        build_strategy = compiled_program._build_strategy
+        if build_strategy is not None and build_strategy.sequential_run:
+            schedule_flag = [
+                'FLAGS_new_executor_serial_run',
+                'FLAGS_new_executor_sequential_run',
+            ]
+            for flag in schedule_flag:
+                value = os.getenv(flag, False)
+                if isinstance(value, str):
+                    value = value.lower()
+                    value = True if value == 'true' else False
+                stored_flag[flag] = bool(value)
+            set_flags({f: True for f in schedule_flag})
+    return stored_flag
+
+
 @lru_cache
 def _warning_once(msg):
     logging.warning(msg)
@@ -887,6 +918,13 @@ class _StandaloneExecutor:
         return new_exe
 
 
+class ExecutorCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
 class _ExecutorCache:
     class _CachedData:
         def __init__(
@@ -942,19 +980,42 @@ class _ExecutorCache:
         def __hash__(self):
             return self.key
 
-    def __init__(self):
+    def __init__(self, maxsize=None):
+        if maxsize is None:
+            maxsize = int(os.getenv("FLAGS_executor_cache_size", 8))
+        self.resize(maxsize)
+
+    def resize(self, maxsize):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(
+                f"The size of executor cache should be None or a non-negative integer, but received {maxsize}."
+            )
+        self.maxsize = maxsize
         # NOTE(Ruibiao): Wrap the lru_cache in constructor so that the cache is local to
         # the _ExecutorCache instance, otherwise a global cache may not be released after
         # the Executor instance deleted
-        self._get_cached_program_and_executor = lru_cache(maxsize=8)(
+        self._get_cached_program_and_executor = lru_cache(maxsize=maxsize)(
             self._get_program_and_executor
         )
-        self._get_cached_program_and_executor_pir_mode = lru_cache(maxsize=8)(
-            self._get_pir_program_and_executor
-        )
+        self._get_cached_program_and_executor_pir_mode = lru_cache(
+            maxsize=maxsize
+        )(self._get_pir_program_and_executor)
 
     def clear(self):
         self._get_cached_program_and_executor.cache_clear()
+        self._get_cached_program_and_executor_pir_mode.cache_clear()
+
+    def cache_info(self):
+        infos = [
+            self._get_cached_program_and_executor.cache_info(),
+            self._get_cached_program_and_executor_pir_mode.cache_info(),
+        ]
+        return ExecutorCacheInfo(
+            hits=sum(info.hits for info in infos),
+            misses=sum(info.misses for info in infos),
+            maxsize=self.maxsize,
+            currsize=sum(info.currsize for info in infos),
+        )
 
     def get_program_and_executor(
         self,
@@ -1236,6 +1297,117 @@ class _ExecutorCache:
         return program, new_exe, data_op_infos
 
 
+class _PreparedProgram:
+    """
+    A program whose feed and fetch targets have been resolved by
+    :code:`Executor.prepare`. Running it skips the program cache lookup and
+    the scan of feed operators that :code:`Executor.run` does on every call.
+    """
+
+    def __init__(
+        self,
+        executor,
+        origin_program,
+        program,
+        new_exe,
+        scope,
+        feed_names,
+        feed_targets,
+        feed_var_name,
+        return_numpy,
+        pir_mode,
+    ):
+        self._executor = executor
+        self._origin_program = origin_program
+        self._program = program
+        self._new_exe = new_exe
+        self._scope = scope
+        self._feed_names = feed_names
+        # list of (name, col, dtype, checker), in the order of feed_names
+        self._feed_targets = feed_targets
+        self._feed_var_name = feed_var_name
+        self._return_numpy = return_numpy
+        self._pir_mode = pir_mode
+
+    @property
+    def feed_names(self):
+        return list(self._feed_names)
+
+    @property
+    def program(self):
+        return self._program
+
+    def run(self, feed=None, return_numpy=None):
+        """
+        Args:
+            feed(dict|list|tuple): The input data, either a dict keyed by feed
+                names, or a list in the same order as :code:`feed_names`.
+            return_numpy(bool|None): Whether to convert the fetched Tensors to
+                numpy.ndarray. If None, use the value given to
+                :code:`Executor.prepare`. The default is None.
+
+        Returns:
+            List: The fetched result list.
+        """
+        executor = self._executor
+        if executor._closed:
+            raise RuntimeError("Attempted to use a closed Executor")
+        if return_numpy is None:
+            return_numpy = self._return_numpy
+
+        if feed is None:
+            feed = {}
+        if isinstance(feed, dict):
+            missing = [name for name in self._feed_names if name not in feed]
+            if missing:
+                raise ValueError(
+                    f"The prepared program requires feed data for {missing}."
+                )
+            values = [feed[name] for name in self._feed_names]
+        elif isinstance(feed, (list, tuple)):
+            if len(feed) != len(self._feed_names):
+                raise ValueError(
+                    f"The prepared program requires {len(self._feed_names)} feed data "
+                    f"for {self._feed_names}, but received {len(feed)}."
+                )
+            values = feed
+        else:
+            raise TypeError(
+                f"feed requires dict, list or tuple as its Parameter. But you passed in {type(feed)}"
+            )
+
+        for (name, col, dtype, checker), value in zip(
+            self._feed_targets, values
+        ):
+            if dtype is not None:
+                if not isinstance(value, core.LoDTensor):
+                    value = _as_lodtensor(value, executor.place, dtype)
+                checker(value)
+            core.set_feed_variable(
+                self._scope,
+                value,
+                name if self._feed_var_name is None else self._feed_var_name,
+                col,
+            )
+
+        if self._pir_mode:
+            executor._pir_feed_lr_scheduler(self._program)
+            return self._new_exe.run(self._feed_names, return_numpy)
+
+        executor._feed_lr_scheduler(self._program, self._scope)
+        stored_flag = _set_sequential_run_flags(self._origin_program)
+        ret = self._new_exe.run(
+            self._feed_names,
+            return_numpy,
+            executor.enable_job_schedule_profiler,
+        )
+        set_flags(stored_flag)
+        core.update_autotune_status()
+        return ret
+
+    __call__ = run
+
+
 class Executor:
     """
     :api_attr: Static Graph
@@ -1922,6 +2094,254 @@ class Executor:
             core.update_autotune_status()
         return res
 
+    def prepare(
+        self,
+        program=None,
+        feed_names=None,
+        fetch_list=None,
+        feed_var_name='feed',
+        fetch_var_name='fetch',
+        scope=None,
+        return_numpy=True,
+    ):
+        """
+        Prepare a :code:`Program` or :code:`CompiledProgram` to be run many times
+        with the same feed and fetch targets. The program is compiled and the feed
+        and fetch targets are resolved only once, so that running the returned
+        handle costs less than calling :code:`Executor.run` every time, which is
+        useful for serving small models at high QPS.
+
+        Programs with pipeline or heter pipeline options and programs that can not
+        be run by the standalone executor are not supported, please use
+        :code:`Executor.run` for them.
+
+        Args:
+            program(Program|CompiledProgram): The program to be prepared. If None,
+                :code:`paddle.static.default_main_program()` is used. The default is None.
+            feed_names(list|tuple|str|None): The names of the input Tensors. The
+                default is None, which means there is no input.
+            fetch_list(list): The Tensors that need to be returned after the model
+                runs. The default is None.
+            feed_var_name(str): The name of the input Tensor of the feed operator.
+                The default is "feed".
+            fetch_var_name(str): The name of the output Tensor of the fetch operator.
+                The default is "fetch".
+            scope(Scope): The scope used to run the program. If None,
+                :code:`paddle.static.global_scope()` is used. The default is None.
+            return_numpy(bool): Whether to convert the fetched Tensors to
+                numpy.ndarray by default. The default is True.
+
+        Returns:
+            A handle whose :code:`run(feed)` method runs the program, where
+            :code:`feed` is a dict keyed by feed names or a list in the order of
+            :code:`feed_names`.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import numpy
+                >>> import paddle
+
+                >>> paddle.enable_static()
+                >>> exe = paddle.static.Executor(paddle.CPUPlace())
+
+                >>> data = paddle.static.data(name='X', shape=[None, 1], dtype='float32')
+                >>> hidden = paddle.static.nn.fc(data, 10)
+                >>> loss = paddle.mean(hidden)
+                >>> exe.run(paddle.static.default_startup_program())
+
+                >>> prepared = exe.prepare(feed_names=['X'], fetch_list=[loss])
+                >>> for _ in range(3):
+                ...     x = numpy.random.random(size=(10, 1)).astype('float32')
+                ...     loss_data, = prepared.run([x])
+        """
+        if self._closed:
+            raise RuntimeError("Attempted to use a closed Executor")
+
+        pir_mode = in_pir_mode()
+        if program is None:
+            program = (
+                pir.core.default_main_program()
+                if pir_mode
+                else default_main_program()
+            )
+        if scope is None:
+            scope = global_scope()
+        if feed_names is None:
+            feed_names = []
+        elif isinstance(feed_names, str):
+            feed_names = [feed_names]
+        fetch_list = self._check_fetch_list(fetch_list)
+        feed = dict.fromkeys(feed_names)
+
+        if pir_mode:
+            if self.plan is not None:
+                raise ValueError(
+                    "Executor.prepare does not support the executor with a plan."
+                )
+            (
+                program,
+                new_exe,
+                data_op_infos,
+            ) = self._executor_cache.get_pir_program_and_executor(
+                program,
+                feed,
+                fetch_list,
+                feed_var_name,
+                fetch_var_name,
+                self.place,
+                scope,
+                self.plan,
+            )
+            feed_targets = {}
+            for name, var_type, var_shape, is_persistable in data_op_infos:
+                if name not in feed and not is_persistable:
+                    raise ValueError(f"Need feed data for value {name}")
+                feed_targets[name] = (
+                    name,
+                    0,
+                    var_type,
+                    partial(
+                        pir_check_feed_shape_type,
+                        name=name,
+                        target_shape=var_shape,
+                        dtype=var_type,
+                    ),
+                )
+            for name in feed_names:
+                if name not in feed_targets:
+                    warnings.warn(
+                        f"The value {name} is not found in program. It is not declared or is pruned."
+                    )
+            feed_names = [name for name in feed_names if name in feed_targets]
+            return _PreparedProgram(
+                self,
+                program,
+                program,
+                new_exe,
+                scope,
+                feed_names,
+                [feed_targets[name] for name in feed_names],
+                None,
+                return_numpy,
+                pir_mode,
+            )
+
+        from paddle.distributed.auto_parallel.static.utils import (
+            use_new_executor,
+        )
+
+        if isinstance(program, Program) and (
+            (program._pipeline_opt and not use_new_executor())
+            or program._heter_pipeline_opt
+        ):
+            raise ValueError(
+                "Executor.prepare does not support the program with pipeline options, please use Executor.run instead."
+            )
+        if not _can_use_interpreter_core(program, self.place):
+            raise ValueError(
+                "Executor.prepare only supports the program that can be run by the standalone executor, please use Executor.run instead."
+            )
+
+        feed = self._update_feed(program, feed)
+        origin_program = program
+        program, new_exe = self._executor_cache.get_program_and_executor(
+            program,
+            feed,
+            fetch_list,
+            feed_var_name,
+            fetch_var_name,
+            self.place,
+            scope,
+        )
+        if (
+            program._pipeline_opt
+            and "standalone_opt" in program._pipeline_opt
+            and program._pipeline_opt["standalone_opt"]["num_micro_batches"] > 1
+        ):
+            raise ValueError(
+                "Executor.prepare does not support running with micro batches, please use Executor.run instead."
+            )
+
+        feed_targets = {}
+        global_block = program.global_block()
+        for op in global_block.ops:
+            if op.desc.type() != 'feed':
+                break
+            name = op.desc.output('Out')[0]
+            var = global_block.var(name)
+            feed_targets[name] = (
+                name,
+                op.desc.attr('col'),
+                (
+                    var.dtype
+                    if var.dtype != core.VarDesc.VarType.STRINGS
+                    else None
+                ),
+                partial(check_feed_shape_type, var),
+            )
+        feed_names = list(feed.keys())
+        pir_flag_name = 'FLAGS_enable_pir_in_executor'
+        return _PreparedProgram(
+            self,
+            origin_program,
+            program,
+            new_exe,
+            scope,
+            feed_names,
+            [feed_targets[name] for name in feed_names],
+            None if get_flags(pir_flag_name)[pir_flag_name] else feed_var_name,
+            return_numpy,
+            pir_mode,
+        )
+
+    def set_cache_size(self, size: int | None) -> None:
+        """
+        Set the max number of programs compiled for the standalone executor that
+        are cached by this executor. The cached programs are released. The default
+        size is 8, which can also be set by the environment variable
+        :code:`FLAGS_executor_cache_size`.
+
+        Args:
+            size(int|None): The max number of cached programs. None means the
+                cache can grow without bound.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import paddle
+
+                >>> paddle.enable_static()
+                >>> exe = paddle.static.Executor(paddle.CPUPlace())
+                >>> exe.set_cache_size(32)
+        """
+        self._executor_cache.clear()
+        self._executor_cache.resize(size)
+
+    def cache_info(self) -> ExecutorCacheInfo:
+        """
+        Get the statistics of the program cache used by :code:`Executor.run`.
+
+        Returns:
+            ExecutorCacheInfo: A named tuple of :code:`hits`, :code:`misses`,
+            :code:`maxsize` and :code:`currsize`.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import paddle
+
+                >>> paddle.enable_static()
+                >>> exe = paddle.static.Executor(paddle.CPUPlace())
+                >>> info = exe.cache_info()
+                >>> print(info.hits, info.misses)
+                0 0
+        """
+        return self._executor_cache.cache_info()
+
     def _run_impl(
         self,
         program,
@@ -2055,28 +2475,7 @@ class Executor:
                 )
             feed = self._update_feed(program, feed)
 
-            stored_flag = {}
-            if isinstance(program, compiler.CompiledProgram) or isinstance(
-                program._graph, compiler.CompiledProgram
-            ):
-                compiled_program = (
-                    program
-                    if isinstance(program, compiler.CompiledProgram)
-                    else program._graph
-                )
-                build_strategy = compiled_program._build_strategy
-                if build_strategy is not None and build_strategy.sequential_run:
-                    schedule_flag = [
-                        'FLAGS_new_executor_serial_run',
-                        'FLAGS_new_executor_sequential_run',
-                    ]
-                    for flag in schedule_flag:
-                        value = os.getenv(flag, False)
-                        if isinstance(value, str):
-                            value = value.lower()
-                            value = True if value == 'true' else False
-                        stored_flag[flag] = bool(value)
-                    set_flags({f: True for f in schedule_flag})
+            stored_flag = _set_sequential_run_flags(program)
 
             program, new_exe = self._executor_cache.get_program_and_executor(
                 program,
@@ -2089,29 +2488,7 @@ class Executor:
             )
 
             self._feed_data(program, feed, feed_var_name, scope)
-            if hasattr(program, 'lr_scheduler'):
-                from paddle.optimizer.lr import LRScheduler
-
-                assert isinstance(
-                    program.lr_scheduler, LRScheduler
-                ), "must be LRScheduler"
-                lr_scheduler = program.lr_scheduler
-                lr_value = lr_scheduler()
-                lr_var = program.global_block().vars[lr_scheduler._var_name]
-                data = np.array([lr_value]).astype(convert_dtype(lr_var.dtype))
-                tensor = core.get_variable_tensor(scope, lr_scheduler._var_name)
-                # NOTE(dev): `tensor.set(data, self.place)` always call TensorCopySync that is a blocking behavior. So we use `_copy_from` to replace it.
-                cpu_tensor = _as_lodtensor(data, core.CPUPlace())
-                if core.is_cuda_graph_capturing():
-                    warnings.warn(
-                        "Caution!!! When capturing CUDA Graph, the learning rate scheduler would not "
-                        "take any effect! Please set the learning rate manually before each batch!"
-                    )
-                elif core.is_compiled_with_ipu():
-                    # for ipu, tensor is allocated on cpu
-                    tensor._copy_from(cpu_tensor, tensor._place())
-                else:
-                    tensor._copy_from(cpu_tensor, self.place)
+            self._feed_lr_scheduler(program, scope)
 
             ret = new_exe.run(
                 list(feed.keys()),
@@ -2217,35 +2594,51 @@ class Executor:
             self.plan,
         )
         self._pir_feed_data(program, feed, scope, data_op_infos)
+        self._pir_feed_lr_scheduler(program)
 
-        if hasattr(program, 'lr_scheduler'):
-            from paddle.optimizer.lr import LRScheduler
+        ret = new_exe.run(list(feed.keys()), return_numpy)
+        return ret
 
-            assert isinstance(
-                program.lr_scheduler, LRScheduler
-            ), "must be LRScheduler"
+    def _set_lr_tensor(self, tensor, lr_value, dtype):
+        data = np.array([lr_value]).astype(convert_dtype(dtype))
+        # NOTE(dev): `tensor.set(data, self.place)` always call TensorCopySync that is a blocking behavior. So we use `_copy_from` to replace it.
+        cpu_tensor = _as_lodtensor(data, core.CPUPlace())
+        if core.is_cuda_graph_capturing():
+            warnings.warn(
+                "Caution!!! When capturing CUDA Graph, the learning rate scheduler would not "
+                "take any effect! Please set the learning rate manually before each batch!"
+            )
+        elif core.is_compiled_with_ipu():
+            # for ipu, tensor is allocated on cpu
+            tensor._copy_from(cpu_tensor, tensor._place())
+        else:
+            tensor._copy_from(cpu_tensor, self.place)
 
-            lr_scheduler = program.lr_scheduler
-            lr_value = lr_scheduler()
-            lr_var = program.get_parameter_value_by_name(program.lr_name)
+    def _feed_lr_scheduler(self, program, scope):
+        if not hasattr(program, 'lr_scheduler'):
+            return
+        from paddle.optimizer.lr import LRScheduler
 
-            data = np.array([lr_value]).astype(convert_dtype(lr_var.dtype))
-            tensor = core.get_variable_tensor(global_scope(), program.lr_name)
-            # NOTE(dev): `tensor.set(data, self.place)` always call TensorCopySync that is a blocking behavior. So we use `_copy_from` to replace it.
-            cpu_tensor = _as_lodtensor(data, core.CPUPlace())
-            if core.is_cuda_graph_capturing():
-                warnings.warn(
-                    "Caution!!! When capturing CUDA Graph, the learning rate scheduler would not "
-                    "take any effect! Please set the learning rate manually before each batch!"
-                )
-            elif core.is_compiled_with_ipu():
-                # for ipu, tensor is allocated on cpu
-                tensor._copy_from(cpu_tensor, tensor._place())
-            else:
-                tensor._copy_from(cpu_tensor, self.place)
+        assert isinstance(
+            program.lr_scheduler, LRScheduler
+        ), "must be LRScheduler"
+        lr_scheduler = program.lr_scheduler
+        lr_var = program.global_block().vars[lr_scheduler._var_name]
+        tensor = core.get_variable_tensor(scope, lr_scheduler._var_name)
+        self._set_lr_tensor(tensor, lr_scheduler(), lr_var.dtype)
 
-        ret = new_exe.run(list(feed.keys()), return_numpy)
-        return ret
+    def _pir_feed_lr_scheduler(self, program):
+        if not hasattr(program, 'lr_scheduler'):
+            return
+        from paddle.optimizer.lr import LRScheduler
+
+        assert isinstance(
+            program.lr_scheduler, LRScheduler
+        ), "must be LRScheduler"
+        lr_scheduler = program.lr_scheduler
+        lr_var = program.get_parameter_value_by_name(program.lr_name)
+        tensor = core.get_variable_tensor(global_scope(), program.lr_name)
+        self._set_lr_tensor(tensor, lr_scheduler(), lr_var.dtype)
 
     def _run_inference(self, exe, feed):
         return exe.run(feed)
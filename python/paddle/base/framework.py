@@ -7745,6 +7745,9 @@ class EagerParamBase(core.eager.Tensor):
 
     @dygraph_only
     def initialize(self):
+        if self._init_func is None and self._is_initialized():
+            # e.g. loaded by set_state_dict under LazyGuard
+            return
         assert (
             self._init_func is not None
         ), "Required self._init_func is not None, but received None."
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import functools
+
 import numpy as np
 
 import paddle
@@ -22,11 +24,11 @@ from . import core, unique_name
 MAX_INTEGER = 2**31 - 1
 
 
-def replace_ellipsis(var, item):
+def replace_ellipsis(shape, item):
     from .framework import Variable
 
     # Use slice(None) to replace Ellipsis.
-    # For var, var.shape = [3,4,5,6]
+    # For var, shape = [3,4,5,6]
     #
     #   var[..., 1:2] -> var[:, :, :, 1:2]
     #   var[0, ...] -> var[0]
@@ -53,7 +55,7 @@ def replace_ellipsis(var, item):
         return item[:-1]
     else:
         item[ell_idx : ell_idx + 1] = [slice(None)] * (
-            len(var.shape) - len(item) + item.count(None) + 1
+            len(shape) - len(item) + item.count(None) + 1
         )
 
     return item
@@ -256,11 +258,65 @@ def is_tensor_array_type(value):
         )
 
 
+def _basic_index_key(indices):
+    """
+    Return a hashable key of the index if it only contains python int, slice
+    of python int, None and Ellipsis, otherwise return None. Slice is not
+    hashable before python 3.12, so it is recorded as a tuple.
+    """
+    key = []
+    for item in indices:
+        # NOTE: bool is a subclass of int but means advanced indexing
+        if type(item) is int or item is None or item is Ellipsis:
+            key.append(item)
+        elif type(item) is slice:
+            start, stop, step = item.start, item.stop, item.step
+            if not (
+                (start is None or type(start) is int)
+                and (stop is None or type(stop) is int)
+                and (step is None or type(step) is int)
+            ):
+                return None
+            key.append((start, stop, step))
+        else:
+            return None
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_basic_index(shape, is_tensor_array, key):
+    indices = tuple(
+        slice(*item) if isinstance(item, tuple) else item for item in key
+    )
+    return _parse_index(list(shape), is_tensor_array, indices)
+
+
 def parse_index(x, indices):
     is_tensor_array = is_tensor_array_type(x)
 
+    if not isinstance(indices, tuple):
+        indices = (indices,)
+
+    # the shape of a tensor array is not used, and reading it raises for a
+    # DenseTensorArrayType Value
+    if is_tensor_array:
+        return _parse_index(None, is_tensor_array, indices)
+
+    # Basic indexing with python scalars, like x[:, :, :n] or x[..., ::2],
+    # only depends on the shape of x, so the parsed result is cached.
+    key = _basic_index_key(indices)
+    if key is not None:
+        parsed = _parse_basic_index(tuple(x.shape), is_tensor_array, key)
+        # the lists are modified in place by callers, copy them
+        return tuple(
+            list(item) if isinstance(item, list) else item for item in parsed
+        )
+    return _parse_index(x.shape, is_tensor_array, indices)
+
+
+def _parse_index(shape, is_tensor_array, indices):
     advanced_index = (
-        [] if is_tensor_array else [None] * 2 * len(x.shape)
+        [] if is_tensor_array else [None] * 2 * len(shape)
     )  # content is (dim, index)
     # for set_value / slice / strided_slice OP
     decrease_axes = []
@@ -271,11 +327,8 @@ def parse_index(x, indices):
     use_strided_slice = False
     has_advanced_index = False
 
-    if not isinstance(indices, tuple):
-        indices = (indices,)
-
     indices = replace_ndarray_and_range(indices)
-    indices = replace_ellipsis(x, indices)
+    indices = replace_ellipsis(shape, indices)
     indices, none_axes = replace_none(indices)
 
     estimated_dim = 0
@@ -285,9 +338,9 @@ def parse_index(x, indices):
         if type(slice_item) is int:
             if (
                 not is_tensor_array
-                and x.shape[dim] is not None
-                and x.shape[dim] >= 0
-                and slice_item >= x.shape[dim]
+                and shape[dim] is not None
+                and shape[dim] >= 0
+                and slice_item >= shape[dim]
             ):
                 # For python, if users write a, b = var, the __getitem__
                 # method will iterate through 0, 1, 2 ... until __getitem__
@@ -297,7 +350,7 @@ def parse_index(x, indices):
                 # We raises IndexError here to support grammar like `a, b = var`
                 raise IndexError(
                     "slice_item %d at dim %d should be >= 0 and < x.shape[%d]: %d"
-                    % (slice_item, dim, dim, x.shape[dim])
+                    % (slice_item, dim, dim, shape[dim])
                 )
             # not calculate result to reduce call times for slice OP.
             decrease_axes.append(dim)
@@ -342,7 +395,7 @@ def parse_index(x, indices):
                 or isinstance(end, (paddle.base.Variable, paddle.pir.Value))
                 or isinstance(step, (paddle.base.Variable, paddle.pir.Value))
             ):
-                if x.shape[dim] != -1 and end >= x.shape[dim]:
+                if shape[dim] != -1 and end >= shape[dim]:
                     end = MAX_INTEGER if step > 0 else -1
             estimated_dim += 1
             dim += 1
@@ -355,10 +408,10 @@ def parse_index(x, indices):
 
             if (
                 advanced_index[estimated_dim][1].dtype == paddle.bool
-                and len(slice_item) != x.shape[dim]
+                and len(slice_item) != shape[dim]
             ):
                 raise IndexError(
-                    f"The shape of boolean index {len(slice_item)} did not match indexed tensor {x.shape[dim]} along axis {dim}"
+                    f"The shape of boolean index {len(slice_item)} did not match indexed tensor {shape[dim]} along axis {dim}"
                 )
 
             has_advanced_index = True
@@ -374,9 +427,9 @@ def parse_index(x, indices):
                     # 0-D bool Tensor, same as single PY-bool.
                     none_axes.append(dim)
 
-                elif slice_item.shape[0] != x.shape[dim]:
+                elif slice_item.shape[0] != shape[dim]:
                     raise IndexError(
-                        f"The shape of boolean index {slice_item.shape[0]} did not match indexed tensor {x.shape[dim]} along axis {dim}"
+                        f"The shape of boolean index {slice_item.shape[0]} did not match indexed tensor {shape[dim]} along axis {dim}"
                     )
             advanced_index[estimated_dim] = (estimated_dim, slice_item)
             has_advanced_index = True
@@ -389,9 +442,9 @@ def parse_index(x, indices):
                     # 0-D bool Tensor, same as single PY-bool.
                     none_axes.append(dim)
 
-                elif slice_item.shape[0] != x.shape[dim]:
+                elif slice_item.shape[0] != shape[dim]:
                     raise IndexError(
-                        f"The shape of boolean index {slice_item.shape[0]} did not match indexed tensor {x.shape[dim]} along axis {dim}"
+                        f"The shape of boolean index {slice_item.shape[0]} did not match indexed tensor {shape[dim]} along axis {dim}"
                     )
             advanced_index[estimated_dim] = (estimated_dim, slice_item)
             has_advanced_index = True
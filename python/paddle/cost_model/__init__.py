@@ -13,5 +13,12 @@
 # limitations under the License.
 
 from .cost_model import CostModel
+from .estimator import LatencyTable, OpCost, ProgramCost, estimate_cost
 
-__all__ = ['CostModel']
+__all__ = [
+    'CostModel',
+    'LatencyTable',
+    'OpCost',
+    'ProgramCost',
+    'estimate_cost',
+]
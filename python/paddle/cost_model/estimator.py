@@ -0,0 +1,579 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+import paddle
+from paddle.base import core
+from paddle.base.framework import paddle_type_to_proto_type
+from paddle.utils.flops import flops as op_flops
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from paddle.nn import Layer
+    from paddle.static import InputSpec, Program
+
+__all__ = []
+
+# The FLOPs of these PIR ops are registered in paddle.utils.flops under the
+# types of the legacy ops.
+_LEGACY_OP_TYPES = {
+    'add': 'elementwise_add',
+    'multiply': 'elementwise_mul',
+    'divide': 'elementwise_div',
+    'reshape': 'reshape2',
+    'transpose': 'transpose2',
+    'pool2d': 'pool',
+}
+
+# The ops which feed or fetch values without running a kernel.
+_FEED_FETCH_OP_TYPES = {'data', 'feed', 'fetch', 'shadow_feed'}
+
+# overhead (s), time per FLOP (s) and time per byte (s) of a typical CPU core
+_DEFAULT_CPU_COEFFICIENTS = (5e-6, 1 / 50e9, 1 / 10e9)
+
+
+class _TensorInfo(NamedTuple):
+    key: str
+    shape: list[int]
+    nbytes: int
+    persistable: bool
+
+
+class _OpInfo(NamedTuple):
+    op_type: str
+    inputs: dict[str, list[_TensorInfo]]
+    outputs: list[_TensorInfo]
+    attrs: dict
+    inplace: bool
+
+
+class OpCost(NamedTuple):
+    """
+    The estimated cost of an op.
+    """
+
+    op_type: str
+    flops: int
+    # the bytes of the inputs read and the outputs written by the op
+    memory_traffic: int
+    # the bytes of the outputs allocated by the op
+    output_memory: int
+    # the estimated latency in seconds
+    latency: float
+
+
+def _tensor_info(key, shape, dtype, persistable, batch_size):
+    # the unknown dimensions, e.g. the batch dimension of InputSpec, are taken
+    # as batch_size
+    shape = [batch_size if d < 0 else d for d in shape]
+    if isinstance(dtype, core.DataType):
+        dtype = paddle_type_to_proto_type[dtype]
+    nbytes = int(np.prod(shape, dtype='int64')) * core.size_of_dtype(dtype)
+    return _TensorInfo(key, shape, nbytes, persistable)
+
+
+def _pir_tensors(value, batch_size, from_combine):
+    # A vector of tensors is built by builtin.combine and split to tensors by
+    # builtin.split, which are not kernels, so the tensors are taken instead.
+    if not value.initialized():
+        return []
+    if value.is_combine():
+        if from_combine:
+            values = value.get_defining_op().operands_source()
+        else:
+            values = [
+                result
+                for op in value.all_used_ops()
+                if op.name() == 'builtin.split'
+                for result in op.results()
+            ]
+        return [
+            info
+            for v in values
+            for info in _pir_tensors(v, batch_size, from_combine)
+        ]
+    try:
+        shape, dtype = value.shape, value.dtype
+    except Exception:
+        # e.g. the tensor arrays, whose size is unknown
+        return []
+    return [_tensor_info(value.id, shape, dtype, value.persistable, batch_size)]
+
+
+def _pir_ops(program, batch_size):
+    for op in program.global_block().ops:
+        dialect, op_type = op.name().split('.', 1)
+        if dialect == 'builtin':
+            continue
+        try:
+            input_names = op.get_input_names()
+        except Exception:
+            input_names = [f'input{i}' for i in range(op.num_operands())]
+        inputs = {
+            name: _pir_tensors(value, batch_size, from_combine=True)
+            for name, value in zip(input_names, op.operands_source())
+        }
+        outputs = [
+            info
+            for value in op.results()
+            for info in _pir_tensors(value, batch_size, from_combine=False)
+        ]
+        inplace = op_type.endswith('_')
+        yield _OpInfo(
+            op_type[:-1] if inplace else op_type,
+            inputs,
+            outputs,
+            op.attrs(),
+            inplace,
+        )
+
+
+def _legacy_ops(program, batch_size):
+    block = program.global_block()
+
+    def tensors(names):
+        infos = []
+        for name in names:
+            var = block._var_recursive(name)
+            try:
+                infos.append(
+                    _tensor_info(
+                        name, var.shape, var.dtype, var.persistable, batch_size
+                    )
+                )
+            except Exception:
+                # e.g. the readers and the tensor arrays
+                continue
+        return infos
+
+    for op in block.ops:
+        inputs = {name: tensors(op.input(name)) for name in op.input_names}
+        outputs = [
+            info
+            for name in op.output_names
+            for info in tensors(op.output(name))
+        ]
+        # the inplace outputs share the variable names with the inputs
+        yield _OpInfo(op.type, inputs, outputs, op.all_attrs(), False)
+
+
+def _flops(op):
+    input_shapes = {}
+    for name, infos in op.inputs.items():
+        shapes = [info.shape for info in infos]
+        input_shapes[name] = shapes
+        # the inputs of PIR ops are named in lower case, e.g. x and filter
+        input_shapes.setdefault(name[:1].upper() + name[1:], shapes)
+    op_type = _LEGACY_OP_TYPES.get(op.op_type, op.op_type)
+    return op_flops(op_type, input_shapes, op.attrs)
+
+
+class LatencyTable:
+    r"""
+    A table of the coefficients to estimate the latency of ops, which is
+
+    .. math::
+
+        latency = overhead + flops \times time\_per\_flop
+                  + memory\_traffic \times time\_per\_byte
+
+    The ops which are not in the table use the default coefficients, which are
+    taken from a typical CPU core unless they are calibrated.
+
+    Args:
+        coefficients (dict[str, Sequence[float]]|None, optional): The
+            coefficients ``(overhead, time_per_flop, time_per_byte)`` in
+            seconds of each op type. Default is None.
+        default (Sequence[float]|None, optional): The default coefficients.
+            Default is None, which means the coefficients of a typical CPU core.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from paddle.cost_model import LatencyTable
+
+            >>> table = LatencyTable({'matmul': (1e-5, 1e-11, 0.0)})
+            >>> print(round(table.latency('matmul', 10**9, 0), 6))
+            0.01001
+    """
+
+    def __init__(
+        self,
+        coefficients: dict[str, Sequence[float]] | None = None,
+        default: Sequence[float] | None = None,
+    ) -> None:
+        self.coefficients = {
+            op_type: tuple(coef)
+            for op_type, coef in (coefficients or {}).items()
+        }
+        self.default = tuple(default or _DEFAULT_CPU_COEFFICIENTS)
+
+    def latency(self, op_type: str, flops: int, memory_traffic: int) -> float:
+        """
+        Estimate the latency in seconds of an op.
+        """
+        overhead, time_per_flop, time_per_byte = self.coefficients.get(
+            op_type, self.default
+        )
+        return overhead + flops * time_per_flop + memory_traffic * time_per_byte
+
+    def fit(
+        self, samples: Iterable[tuple[str, int, int, float]]
+    ) -> LatencyTable:
+        """
+        Fit the coefficients by the measured latencies of ops with least
+        squares. The op types with samples are fitted separately, and the
+        default coefficients are fitted by all the samples.
+
+        Args:
+            samples (Iterable[tuple[str, int, int, float]]): The measured
+                ``(op_type, flops, memory_traffic, latency)`` of ops, where
+                latency is in seconds.
+
+        Returns:
+            LatencyTable: The table itself.
+        """
+        samples = list(samples)
+        if len(samples) == 0:
+            raise ValueError("samples should not be empty.")
+        by_type = {}
+        for op_type, flops, memory_traffic, latency in samples:
+            by_type.setdefault(op_type, []).append(
+                (flops, memory_traffic, latency)
+            )
+        for op_type, rows in by_type.items():
+            self.coefficients[op_type] = _fit_coefficients(rows)
+        self.default = _fit_coefficients([sample[1:] for sample in samples])
+        return self
+
+    def calibrate(self, repeat: int = 10) -> LatencyTable:
+        """
+        Calibrate the table by measuring matmul, conv2d and elementwise ops of
+        a few sizes on CPU in dynamic mode.
+
+        Args:
+            repeat (int, optional): The number of runs of each measurement, the
+                fastest one is taken. Default is 10.
+
+        Returns:
+            LatencyTable: The table itself.
+        """
+        samples = []
+        with paddle.base.dygraph.guard(paddle.CPUPlace()):
+            for op_types, func, input_shapes, attrs in _calibration_cases():
+                inputs = {
+                    name: [paddle.rand(shape) for shape in shapes]
+                    for name, shapes in input_shapes.items()
+                }
+                args = [t for tensors in inputs.values() for t in tensors]
+                out = func(*args)
+                latency = float('inf')
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    func(*args)
+                    latency = min(latency, time.perf_counter() - start)
+                flops = op_flops(op_types[-1], input_shapes, attrs)
+                memory_traffic = sum(t.numel().item() * 4 for t in args)
+                memory_traffic += out.numel().item() * 4
+                for op_type in op_types:
+                    samples.append((op_type, flops, memory_traffic, latency))
+        return self.fit(samples)
+
+    def save(self, path: str) -> None:
+        """
+        Save the table to a json file.
+        """
+        with open(path, 'w') as f:
+            json.dump(
+                {'default': self.default, 'coefficients': self.coefficients},
+                f,
+                indent=2,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> LatencyTable:
+        """
+        Load a table saved by :code:`save`.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['coefficients'], data['default'])
+
+
+def _fit_coefficients(rows):
+    rows = np.asarray(rows, dtype='float64')
+    features = np.concatenate([np.ones([len(rows), 1]), rows[:, :2]], axis=1)
+    # scale the features to the same range for the numerical stability
+    scale = np.abs(features).max(axis=0)
+    scale[scale == 0] = 1.0
+    coef, *_ = np.linalg.lstsq(features / scale, rows[:, 2], rcond=None)
+    coef = np.maximum(coef / scale, 0.0)
+    return tuple(float(c) for c in coef)
+
+
+def _calibration_cases():
+    # (op types of PIR and legacy ops, function, input shapes, attrs)
+    for n in [64, 128, 256, 512]:
+        yield (
+            ('matmul_v2', 'matmul'),
+            paddle.matmul,
+            {'X': [[n, n]], 'Y': [[n, n]]},
+            {},
+        )
+    for c in [8, 32, 64]:
+        yield (
+            ('conv2d',),
+            lambda x, w: paddle.nn.functional.conv2d(x, w, padding=1),
+            {'Input': [[1, c, 56, 56]], 'Filter': [[c, c, 3, 3]]},
+            {
+                'paddings': [1, 1],
+                'strides': [1, 1],
+                'dilations': [1, 1],
+                'groups': 1,
+            },
+        )
+    for numel in [2**14, 2**18, 2**22]:
+        yield (
+            ('add', 'elementwise_add'),
+            paddle.add,
+            {'X': [[numel]], 'Y': [[numel]]},
+            {},
+        )
+        yield (('relu',), paddle.nn.functional.relu, {'X': [[numel]]}, {})
+        yield (
+            ('softmax',),
+            paddle.nn.functional.softmax,
+            {'X': [[numel // 1024, 1024]]},
+            {},
+        )
+
+
+class ProgramCost:
+    """
+    The estimated cost of a program, returned by :code:`estimate_cost` .
+
+    Attributes:
+        ops (list[OpCost]): The estimated costs of the ops in order.
+        peak_memory (int): The peak bytes of the activations, i.e. the
+            non-persistable tensors alive at the same time.
+        parameter_memory (int): The bytes of the persistable tensors, e.g. the
+            parameters.
+    """
+
+    def __init__(
+        self, ops: list[OpCost], peak_memory: int, parameter_memory: int
+    ) -> None:
+        self.ops = ops
+        self.peak_memory = peak_memory
+        self.parameter_memory = parameter_memory
+
+    @property
+    def flops(self) -> int:
+        return sum(op.flops for op in self.ops)
+
+    @property
+    def memory_traffic(self) -> int:
+        return sum(op.memory_traffic for op in self.ops)
+
+    @property
+    def latency(self) -> float:
+        return sum(op.latency for op in self.ops)
+
+    def by_op_type(self) -> dict[str, OpCost]:
+        """
+        Sum up the costs of the ops by op type, ordered by latency.
+        """
+        costs = {}
+        for op in self.ops:
+            cost = costs.get(op.op_type, OpCost(op.op_type, 0, 0, 0, 0.0))
+            costs[op.op_type] = OpCost(
+                op.op_type,
+                cost.flops + op.flops,
+                cost.memory_traffic + op.memory_traffic,
+                cost.output_memory + op.output_memory,
+                cost.latency + op.latency,
+            )
+        return dict(
+            sorted(
+                costs.items(), key=lambda item: item[1].latency, reverse=True
+            )
+        )
+
+    def summary(self) -> str:
+        """
+        Return a table of the costs by op type and the totals.
+        """
+        lines = [
+            f"{'op type':<24}{'GFLOPs':>12}"
+            f"{'traffic (MB)':>16}{'latency (ms)':>16}"
+        ]
+        for op_type, cost in self.by_op_type().items():
+            lines.append(
+                f"{op_type:<24}{cost.flops / 1e9:>12.4f}"
+                f"{cost.memory_traffic / 2**20:>16.2f}"
+                f"{cost.latency * 1e3:>16.4f}"
+            )
+        lines.append(
+            f"{'total':<24}{self.flops / 1e9:>12.4f}"
+            f"{self.memory_traffic / 2**20:>16.2f}"
+            f"{self.latency * 1e3:>16.4f}"
+        )
+        lines.append(
+            f"peak activation memory: {self.peak_memory / 2**20:.2f} MB"
+        )
+        lines.append(
+            f"parameter memory: {self.parameter_memory / 2**20:.2f} MB"
+        )
+        return '\n'.join(lines)
+
+
+def _build_program(layer, input_spec):
+    static_forward = paddle.jit.to_static(
+        layer.forward, input_spec=input_spec, full_graph=True
+    )
+    return static_forward.concrete_program_specify_input_spec().main_program
+
+
+def estimate_cost(
+    net: Layer | Program,
+    input_spec: Sequence[InputSpec] | None = None,
+    batch_size: int = 1,
+    latency_table: LatencyTable | None = None,
+) -> ProgramCost:
+    """
+    Estimate the FLOPs, the memory traffic, the peak activation memory and the
+    latency of a model without running it.
+
+    The model is traced into a program with ``input_spec`` if it is a Layer.
+    The ops of the program are walked in order, and the costs of each op are
+    computed from the shapes inferred when the program is built. The FLOPs of
+    the ops are counted by the formulas registered in ``paddle.utils.flops``,
+    and are 0 for the other ops. The latency is estimated by ``latency_table``.
+
+    Note:
+        Only the ops in the global block are counted, the ops in the blocks of
+        control flow ops, e.g. if and while, are not counted.
+
+    Args:
+        net (Layer|Program): The model, which is a Layer or a program of PIR or
+            the legacy static graph.
+        input_spec (Sequence[InputSpec]|None, optional): The specs of the
+            inputs of the Layer, which is required when ``net`` is a Layer.
+            Default is None.
+        batch_size (int, optional): The size of the unknown dimensions of the
+            shapes, e.g. None or -1 in ``input_spec``. Default is 1.
+        latency_table (LatencyTable|None, optional): The table to estimate the
+            latency of ops. Default is None, which means a
+            :code:`LatencyTable()` of a typical CPU core.
+
+    Returns:
+        ProgramCost: The estimated costs of the ops and the program.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.cost_model import estimate_cost
+            >>> from paddle.static import InputSpec
+
+            >>> net = paddle.vision.models.LeNet()
+            >>> cost = estimate_cost(
+            ...     net, [InputSpec([None, 1, 28, 28], 'float32')], batch_size=64
+            ... )
+            >>> print(cost.flops > 0, cost.peak_memory > 0)
+            True True
+    """
+    if batch_size <= 0:
+        raise ValueError(
+            f"batch_size should be greater than 0, but received {batch_size}."
+        )
+    if isinstance(net, paddle.nn.Layer):
+        if input_spec is None:
+            raise ValueError(
+                "input_spec is required to estimate the cost of a Layer."
+            )
+        program = _build_program(net, input_spec)
+    else:
+        program = net
+    latency_table = latency_table or LatencyTable()
+
+    if isinstance(program, paddle.pir.Program):
+        ops = list(_pir_ops(program, batch_size))
+    else:
+        ops = list(_legacy_ops(program, batch_size))
+
+    # the op index of the last use of each tensor
+    last_use = {}
+    for index, op in enumerate(ops):
+        for infos in op.inputs.values():
+            for info in infos:
+                last_use[info.key] = index
+
+    costs = []
+    sizes = {}
+    parameters = {}
+    live_memory = peak_memory = 0
+    for index, op in enumerate(ops):
+        inputs = [info for infos in op.inputs.values() for info in infos]
+        for info in inputs:
+            if info.persistable:
+                parameters[info.key] = info.nbytes
+            elif info.key not in sizes:
+                # the inputs of the program, e.g. the data fed
+                sizes[info.key] = info.nbytes
+                live_memory += info.nbytes
+
+        output_memory = 0
+        for info in op.outputs:
+            if info.persistable:
+                parameters[info.key] = info.nbytes
+            elif info.key not in sizes:
+                sizes[info.key] = info.nbytes
+                output_memory += info.nbytes
+        if op.inplace and op.outputs and inputs and inputs[0].key in sizes:
+            # the output shares the memory with the input
+            output_memory -= op.outputs[0].nbytes
+            sizes[op.outputs[0].key] = sizes[inputs[0].key]
+            sizes[inputs[0].key] = 0
+        live_memory += output_memory
+        peak_memory = max(peak_memory, live_memory)
+
+        for info in inputs + op.outputs:
+            if last_use.get(info.key, index) <= index and info.key in sizes:
+                live_memory -= sizes[info.key]
+                sizes[info.key] = 0
+
+        if op.op_type in _FEED_FETCH_OP_TYPES:
+            continue
+        flops = _flops(op)
+        memory_traffic = sum(info.nbytes for info in inputs + op.outputs)
+        costs.append(
+            OpCost(
+                op.op_type,
+                flops,
+                memory_traffic,
+                output_memory,
+                latency_table.latency(op.op_type, flops, memory_traffic),
+            )
+        )
+
+    return ProgramCost(costs, peak_memory, sum(parameters.values()))
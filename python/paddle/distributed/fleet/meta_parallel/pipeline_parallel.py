@@ -35,6 +35,7 @@ from ..utils.hybrid_parallel_util import (
 from ..utils.log_util import logger, sync_rotate_logger
 from .meta_parallel_base import MetaParallelBase
 from .parallel_layers.pp_layers import PipelineLayer
+from .zero_bubble_utils import WeightGradStore
 
 _use_four_directions = os.environ.get(
     'PADDLE_USE_FOUR_DIRECTIONS_P2P', paddle.base.core.is_compiled_with_xpu()
@@ -704,8 +705,9 @@ class PipelineParallel(MetaParallelBase):
                 batch_p2p_comm=self._use_batch_p2p_comm,
             )
 
+        cooldown_schedule = self._after_backward_steps(static_scheduler)
         if static_scheduler:
-            return schedule
+            return schedule + cooldown_schedule
 
         self._flush_records()
 
@@ -734,6 +736,11 @@ class PipelineParallel(MetaParallelBase):
         self.timer_printer()
         return train_loss
 
+    def _after_backward_steps(self, static_scheduler=False):
+        # run after the last backward step of forward_backward_pipeline,
+        # returns the schedule of the jobs it runs when static_scheduler
+        return ""
+
     def register_sharding_comm_overlap_hook(self, optimizer):
         """for delayed hook register until we get optimizer"""
         assert isinstance(
@@ -2200,3 +2207,81 @@ class PipelineParallelWithInterleaveFthenB(PipelineParallelWithInterleave):
 
         self.timer_printer()
         return train_loss
+
+
+class PipelineParallelZeroBubble(PipelineParallel):
+    # Zero bubble pipeline, the ZB-H1 schedule of
+    # https://arxiv.org/abs/2401.10241, with the same order of jobs as the
+    # static PipelineZeroBubblePipelinePass.
+    #
+    # Forward and backward passes run in the same order as 1F1B, but the
+    # backward pass is split into the input gradient part (B) and the weight
+    # gradient part (W). The first `stage_id` backward passes of a stage only
+    # run B, so that the input gradients reach the previous stages earlier,
+    # and their W runs after the last backward pass, in the bubble where the
+    # stage would otherwise wait for the previous stages to finish. Only the
+    # layers that split their backward pass through WeightGradStore, such as
+    # SplitBWLinear, defer W; other layers compute it within B.
+
+    def __init__(self, layers, hcg, strategy):
+        super().__init__(layers, hcg, strategy)
+        assert not self._comm_overlap, (
+            "zero bubble pipeline doesn't support dp_comm_overlap or "
+            "sharding_comm_overlap, since the gradient hooks of the comm "
+            "buffers are not triggered by deferred weight gradients."
+        )
+
+    def _num_deferred_steps(self):
+        # the weight gradients of the first backward passes are computed
+        # after the last backward pass
+        return min(self.stage_id, self.accumulate_steps - 1)
+
+    def _backward_step(
+        self, input_tensor, output_tensor, output_tensor_grad, step_id=None
+    ):
+        defer_weight_grad = (
+            step_id is not None and step_id < self._num_deferred_steps()
+        )
+        WeightGradStore.enabled = defer_weight_grad
+        try:
+            input_tensor_grad = super()._backward_step(
+                input_tensor, output_tensor, output_tensor_grad, step_id=step_id
+            )
+        finally:
+            WeightGradStore.enabled = False
+        if defer_weight_grad:
+            WeightGradStore.flush()
+        return input_tensor_grad
+
+    def _after_backward_steps(self, static_scheduler=False):
+        # fill the bubble before the end of the step with deferred weight
+        # gradients
+        schedule = ""
+        for i in range(self._num_deferred_steps()):
+            if static_scheduler:
+                schedule += f"w{i};"
+                logger.info(f"weight gradient step for micro step {i}")
+                continue
+            self._record_stamp("W", i, '"B"', self._backward_color)
+            WeightGradStore.pop()
+            self._record_stamp("W", i, '"E"', self._backward_color)
+        if not static_scheduler:
+            assert (
+                WeightGradStore.size() == 0
+            ), "all weight gradients should be computed"
+        return schedule
+
+    def forward_backward_pipeline(
+        self,
+        data,
+        scaler=None,
+        static_scheduler=False,
+        return_micro_batch_loss=False,
+    ):
+        WeightGradStore.clear()
+        return super().forward_backward_pipeline(
+            data,
+            scaler=scaler,
+            static_scheduler=static_scheduler,
+            return_micro_batch_loss=return_micro_batch_loss,
+        )
@@ -0,0 +1,130 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+
+import paddle
+from paddle import nn
+from paddle.autograd import PyLayer
+
+__all__ = []
+
+
+class WeightGradStore:
+    """
+    Deferred weight gradient computations of the zero bubble pipeline.
+
+    While `enabled`, layers that split their backward pass (e.g.
+    SplitBWLinear) compute the input gradient immediately and `put` the
+    weight gradient computation here instead of running it. `flush` closes
+    the computations of one micro step, and `pop` runs the computations of
+    the earliest flushed micro step.
+    """
+
+    enabled = False
+    cache = []
+    funcs_queue = deque()
+
+    @classmethod
+    def put(cls, func):
+        cls.cache.append(func)
+
+    @classmethod
+    def flush(cls):
+        cls.funcs_queue.append(cls.cache)
+        cls.cache = []
+
+    @classmethod
+    def pop(cls):
+        assert len(cls.funcs_queue) > 0, "Pop from an empty WeightGradStore."
+        funcs = cls.funcs_queue.popleft()
+        for func in funcs:
+            func()
+
+    @classmethod
+    def size(cls):
+        return len(cls.funcs_queue)
+
+    @classmethod
+    def clear(cls):
+        cls.enabled = False
+        cls.cache = []
+        cls.funcs_queue = deque()
+
+
+def _accumulate_grad(param, grad):
+    if hasattr(param, "main_grad"):
+        grad = grad.astype(paddle.float32)
+        if param.main_grad is None:
+            param.main_grad = grad
+        else:
+            param.main_grad.add_(grad)
+    else:
+        grad = grad.astype(param.dtype)
+        if param.grad is None:
+            param.grad = grad
+        else:
+            param.grad.add_(grad)
+
+
+class _SplitBWLinearFunction(PyLayer):
+    @staticmethod
+    def forward(ctx, x, weight, bias):
+        ctx.save_for_backward(x, weight, bias)
+        return paddle._C_ops.linear(x, weight, bias)
+
+    @staticmethod
+    def backward(ctx, dy):
+        x, weight, bias = ctx.saved_tensor()
+        if dy.dtype == weight.dtype:
+            dx = paddle.matmul(dy, weight, transpose_y=True)
+        else:
+            dx = paddle.matmul(
+                dy, paddle.cast(weight, dtype=dy.dtype), transpose_y=True
+            )
+
+        def weight_grad():
+            with paddle.no_grad():
+                x_2d = x.reshape([-1, x.shape[-1]])
+                dy_2d = dy.reshape([-1, dy.shape[-1]]).astype(x.dtype)
+                if not weight.stop_gradient:
+                    _accumulate_grad(
+                        weight, paddle.matmul(x_2d, dy_2d, transpose_x=True)
+                    )
+                if bias is not None and not bias.stop_gradient:
+                    _accumulate_grad(bias, dy_2d.sum(axis=0))
+
+        if WeightGradStore.enabled:
+            WeightGradStore.put(weight_grad)
+        else:
+            weight_grad()
+
+        if bias is None:
+            return dx, None
+        return dx, None, None
+
+
+class SplitBWLinear(nn.Linear):
+    """
+    Linear layer whose backward pass is split into the input gradient and
+    the weight gradient, so that the zero bubble pipeline schedule can defer
+    the weight gradient to fill pipeline bubbles. It has the same arguments
+    and parameters as :ref:`api_paddle_nn_Linear`.
+
+    The weight gradient is accumulated into `main_grad` of the parameters
+    if they have one, otherwise into `grad`.
+    """
+
+    def forward(self, input):
+        return _SplitBWLinearFunction.apply(input, self.weight, self.bias)
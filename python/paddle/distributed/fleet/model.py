@@ -21,6 +21,7 @@ from .meta_parallel import (
     PipelineParallel,
     PipelineParallelWithInterleave,
     PipelineParallelWithInterleaveFthenB,
+    PipelineParallelZeroBubble,
     SegmentParallel,
     ShardingParallel,
     TensorParallel,
@@ -157,9 +158,22 @@ def distributed_model(model):
         assert isinstance(
             model, PipelineLayer
         ), "For pipeline parallel, the model should an instance of PipelineLayer"
+        use_zero_bubble = strategy.hybrid_configs["pp_configs"].use_zero_bubble
         if model.get_num_virtual_stages() == 1:
-            # 1f1b pipeline
-            model = PipelineParallel(model, fleet_env._hcg, strategy=strategy)
+            if use_zero_bubble:
+                # zero bubble pipeline
+                model = PipelineParallelZeroBubble(
+                    model, fleet_env._hcg, strategy=strategy
+                )
+            else:
+                # 1f1b pipeline
+                model = PipelineParallel(
+                    model, fleet_env._hcg, strategy=strategy
+                )
+        elif use_zero_bubble:
+            raise NotImplementedError(
+                "The zero bubble pipeline doesn't support virtual pipeline stages yet."
+            )
         else:
             accumulate_steps = strategy.pipeline_configs['accumulate_steps']
             pp_degree = fleet_env._hcg.get_pipe_parallel_world_size()
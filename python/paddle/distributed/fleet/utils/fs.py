@@ -17,13 +17,17 @@
 from __future__ import annotations
 
 import abc
+import errno
 import functools
 import multiprocessing
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Callable, Literal, TypedDict, TypeVar
 
 # (TODO: GhostScreaming) It will be removed later.
@@ -1716,3 +1720,746 @@ class AFSClient(FS):
             begin += blocks[i]
 
         return trainer_files[trainer_id]
+
+
+class FileStat:
+    """
+    The metadata of a path returned by :class:`FSBackend`.
+
+    Args:
+        path(str): The path.
+        is_dir(bool): Whether the path is a directory.
+        size(int): The size of the file in bytes, 0 for directories.
+    """
+
+    __slots__ = ["path", "is_dir", "size"]
+
+    def __init__(self, path: str, is_dir: bool, size: int = 0) -> None:
+        self.path = path
+        self.is_dir = is_dir
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"FileStat(path={self.path}, is_dir={self.is_dir}, size={self.size})"
+
+
+class FSBackend:
+    """
+    The primitive operations of a file system used by :class:`NativeFSClient`.
+
+    Unlike :class:`HDFSClient`, which forks a ``hadoop fs`` command for every
+    operation, a backend is expected to keep its connection open across
+    calls and to be safe to use from multiple threads.
+
+    Errors should be raised as ``OSError`` (or subclasses), missing paths as
+    ``FileNotFoundError``.
+    """
+
+    @abc.abstractmethod
+    def stat(self, fs_paths):
+        """
+        Return a list of :class:`FileStat` (or None for missing paths), one
+        for each path in `fs_paths`, in as few remote calls as possible.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_dir(self, fs_path):
+        """
+        Return the :class:`FileStat` of all direct children of `fs_path`.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def mkdirs(self, fs_path):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, fs_path, recursive):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rename(self, fs_src_path, fs_dst_path):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def read_range(self, fs_path, offset, length):
+        """
+        Read `length` bytes of `fs_path` starting from `offset`.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def open_output(self, fs_path):
+        """
+        Return a writable binary file object that creates `fs_path`.
+        """
+        raise NotImplementedError
+
+
+class LocalFSBackend(FSBackend):
+    """
+    A :class:`FSBackend` on the local file system. It is mainly used as a
+    stand-in of the remote file system in tests.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from paddle.distributed.fleet.utils.fs import LocalFSBackend, NativeFSClient
+
+            >>> client = NativeFSClient(LocalFSBackend())
+            >>> subdirs, files = client.ls_dir("./")
+
+    """
+
+    def _stat(self, fs_path):
+        try:
+            st = os.stat(fs_path)
+        except FileNotFoundError:
+            return None
+        is_dir = os.path.isdir(fs_path)
+        return FileStat(fs_path, is_dir, 0 if is_dir else st.st_size)
+
+    def stat(self, fs_paths: list[str]) -> list[FileStat | None]:
+        return [self._stat(p) for p in fs_paths]
+
+    def list_dir(self, fs_path: str) -> list[FileStat]:
+        stats = []
+        with os.scandir(fs_path) as it:
+            for entry in it:
+                is_dir = entry.is_dir()
+                size = 0 if is_dir else entry.stat().st_size
+                stats.append(FileStat(entry.path, is_dir, size))
+        return stats
+
+    def mkdirs(self, fs_path: str) -> None:
+        os.makedirs(fs_path, exist_ok=True)
+
+    def delete(self, fs_path: str, recursive: bool) -> None:
+        if os.path.isdir(fs_path):
+            if recursive:
+                shutil.rmtree(fs_path)
+            else:
+                os.rmdir(fs_path)
+        else:
+            os.remove(fs_path)
+
+    def rename(self, fs_src_path: str, fs_dst_path: str) -> None:
+        os.rename(fs_src_path, fs_dst_path)
+
+    def read_range(self, fs_path: str, offset: int, length: int) -> bytes:
+        with open(fs_path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def open_output(self, fs_path: str):
+        return open(fs_path, "wb")
+
+
+class ArrowHDFSBackend(FSBackend):
+    """
+    A :class:`FSBackend` on HDFS/AFS through ``pyarrow.fs.HadoopFileSystem``,
+    which talks to the namenode through libhdfs in-process, so the JVM is
+    started once and the connection is reused by all operations.
+
+    Args:
+        hadoop_home(str): Hadoop home.
+        configs(dict): Hadoop config, the same as :class:`HDFSClient`. It needs
+            to contain the key "fs.default.name", and optionally "hadoop.job.ugi".
+            The other keys are passed to the file system as extra configs.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('depend on external file')
+            >>> from paddle.distributed.fleet.utils.fs import ArrowHDFSBackend, NativeFSClient
+
+            >>> hadoop_home = "/home/client/hadoop-client/hadoop/"
+            >>> configs = {
+            ...     "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+            ...     "hadoop.job.ugi": "hello,hello123"
+            ... }
+
+            >>> client = NativeFSClient(ArrowHDFSBackend(hadoop_home, configs))
+            >>> client.ls_dir("hdfs:/test_hdfs_client")
+
+    """
+
+    def __init__(self, hadoop_home: str, configs: _HDFSClientConfig) -> None:
+        try:
+            from pyarrow import fs as pafs
+        except ImportError:
+            raise ImportError(
+                "ArrowHDFSBackend requires pyarrow, please install it by `pip install pyarrow`."
+            )
+        self._pafs = pafs
+
+        os.environ.setdefault("HADOOP_HOME", hadoop_home)
+        if "CLASSPATH" not in os.environ:
+            # libhdfs can not expand wildcards in CLASSPATH
+            os.environ["CLASSPATH"] = subprocess.check_output(
+                [f"{hadoop_home}/bin/hadoop", "classpath", "--glob"],
+                text=True,
+            ).strip()
+
+        configs = dict(configs or {})
+        default_name = configs.pop("fs.default.name")
+        user = None
+        ugi = configs.get("hadoop.job.ugi")
+        if ugi:
+            user = ugi.split(",")[0]
+        self._fs = pafs.HadoopFileSystem(
+            default_name,
+            user=user,
+            extra_conf={k: str(v) for k, v in configs.items()},
+        )
+
+    def _to_stat(self, info):
+        if info.type == self._pafs.FileType.NotFound:
+            return None
+        is_dir = info.type == self._pafs.FileType.Directory
+        return FileStat(info.path, is_dir, 0 if is_dir else info.size)
+
+    def stat(self, fs_paths: list[str]) -> list[FileStat | None]:
+        return [
+            self._to_stat(info) for info in self._fs.get_file_info(fs_paths)
+        ]
+
+    def list_dir(self, fs_path: str) -> list[FileStat]:
+        selector = self._pafs.FileSelector(fs_path, recursive=False)
+        return [
+            self._to_stat(info) for info in self._fs.get_file_info(selector)
+        ]
+
+    def mkdirs(self, fs_path: str) -> None:
+        self._fs.create_dir(fs_path, recursive=True)
+
+    def delete(self, fs_path: str, recursive: bool) -> None:
+        info = self._fs.get_file_info(fs_path)
+        if info.type == self._pafs.FileType.NotFound:
+            raise FileNotFoundError(fs_path)
+        if info.type == self._pafs.FileType.Directory:
+            if not recursive and self.list_dir(fs_path):
+                raise OSError(
+                    errno.ENOTEMPTY, os.strerror(errno.ENOTEMPTY), fs_path
+                )
+            self._fs.delete_dir(fs_path)
+        else:
+            self._fs.delete_file(fs_path)
+
+    def rename(self, fs_src_path: str, fs_dst_path: str) -> None:
+        self._fs.move(fs_src_path, fs_dst_path)
+
+    def read_range(self, fs_path: str, offset: int, length: int) -> bytes:
+        with self._fs.open_input_file(fs_path) as f:
+            return f.read_at(length, offset)
+
+    def open_output(self, fs_path: str):
+        return self._fs.open_output_stream(fs_path)
+
+
+# the errors that retrying never fixes
+_PERMANENT_OS_ERRORS = (
+    FileNotFoundError,
+    FileExistsError,
+    PermissionError,
+    NotADirectoryError,
+    IsADirectoryError,
+)
+
+
+def _wrap_backend_errors(f):
+    # turn the transient errors of backends, such as connection or I/O
+    # errors, into ExecuteError, so that they can be retried by _handle_errors
+    @functools.wraps(f)
+    def handler(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except _PERMANENT_OS_ERRORS:
+            raise
+        except OSError as e:
+            if e.errno == errno.ENOTEMPTY:
+                raise
+            raise ExecuteError(f"{f.__name__}{args[1:]}: {e}")
+
+    return handler
+
+
+class NativeFSClient(FS):
+    """
+    A tool of remote file system on top of a :class:`FSBackend`.
+
+    It has the same interface as :class:`HDFSClient`, but it runs the
+    operations through a backend that keeps its connection open instead of
+    forking a ``hadoop fs`` command for each of them. Metadata checks are
+    answered by a single ``stat`` call, the files of a directory are
+    transferred in parallel by a thread pool, and large files are downloaded
+    as parallel byte ranges.
+
+    Args:
+        backend(FSBackend): The file system backend, e.g. :class:`ArrowHDFSBackend`,
+            or :class:`LocalFSBackend` in tests.
+        num_threads(int): The number of threads used to transfer files. Default is 8.
+        chunk_size(int): The size in bytes of a byte range when downloading large
+            files in parallel. Default is 64MB.
+        time_out(int): Timeout of retrying a failed operation, in ms. Default is 5 minutes.
+        sleep_inter(int): The interval between two retries, in ms. Default is 1000.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from paddle.distributed.fleet.utils.fs import LocalFSBackend, NativeFSClient
+
+            >>> client = NativeFSClient(LocalFSBackend())
+            >>> subdirs, files = client.ls_dir("./")
+
+    """
+
+    def __init__(
+        self,
+        backend: FSBackend,
+        num_threads: int = 8,
+        chunk_size: int = 64 * 1024 * 1024,
+        time_out: int = 5 * 60 * 1000,  # ms
+        sleep_inter: int = 1000,  # ms
+    ) -> None:
+        assert num_threads > 0, "num_threads should be positive"
+        assert chunk_size > 0, "chunk_size should be positive"
+        self._backend = backend
+        self._num_threads = num_threads
+        self._chunk_size = chunk_size
+        self._time_out = time_out
+        self._sleep_inter = sleep_inter
+        self._pool = None
+        self._pool_finalizer = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self._num_threads)
+                # shut the threads down once the client is released
+                self._pool_finalizer = weakref.finalize(
+                    self, self._pool.shutdown, wait=False
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """
+        Shut down the threads used to transfer files. The client can still
+        be used afterwards, which starts new threads when needed.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool_finalizer.detach()
+                self._pool.shutdown()
+                self._pool = None
+
+    def _parallel(self, func, tasks):
+        if len(tasks) <= 1:
+            return [func(*task) for task in tasks]
+        futures = [self._get_pool().submit(func, *task) for task in tasks]
+        # wait for all the tasks before raising, so that no task is still
+        # running when the caller cleans up
+        wait(futures)
+        return [future.result() for future in futures]
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def _stat(self, fs_path):
+        return self._backend.stat([fs_path])[0]
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def _list_dir(self, fs_path):
+        return self._backend.list_dir(fs_path)
+
+    def list_dirs(self, fs_path: str) -> list[str]:
+        """
+        Only list directories under `fs_path` .
+
+        Args:
+            fs_path(str): The remote file path.
+
+        Returns:
+            List: A list of all its subdirectories, e.g. [subdirname1, subdirname1, ...].
+        """
+        dirs, _ = self.ls_dir(fs_path)
+        return dirs
+
+    def ls_dir(self, fs_path: str) -> tuple[list[str], list[str]]:
+        """
+        List directories and files under `fs_path` .
+
+        Args:
+            fs_path(str): The remote file path.
+
+        Returns:
+            Tuple: Return a 2-tuple, the first element is the list of all its subdirectories,
+            and the second one is the list of all its subfiles, e.g. ([subdirname1, subdirname1, ...], [filename1, filename2, ...]).
+        """
+        try:
+            stats = self._list_dir(fs_path)
+        except FileNotFoundError:
+            return [], []
+
+        dirs = []
+        files = []
+        for st in stats:
+            name = os.path.basename(st.path.rstrip("/"))
+            if st.is_dir:
+                dirs.append(name)
+            else:
+                files.append(name)
+        return dirs, files
+
+    def is_dir(self, fs_path: str) -> bool:
+        """
+        Whether the remote path is a directory.
+
+        Args:
+            fs_path(str): The remote file path.
+
+        Returns:
+            Bool: Return true if the path exists and it's a directory, otherwise return false.
+        """
+        st = self._stat(fs_path)
+        return st is not None and st.is_dir
+
+    def is_file(self, fs_path: str) -> bool:
+        """
+        Whether the remote path is a file.
+
+        Args:
+            fs_path(str): The remote file path.
+
+        Returns:
+            Bool: Return true if the path exists and it's a file, otherwise return false.
+        """
+        st = self._stat(fs_path)
+        return st is not None and not st.is_dir
+
+    def is_exist(self, fs_path: str) -> bool:
+        """
+        Whether the remote path exists.
+
+        Args:
+            fs_path(str): The remote file path.
+
+        Returns:
+            Bool: Whether it's is file or directory, return true if the path exists,
+            otherwise return false.
+        """
+        return self._stat(fs_path) is not None
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def list_files_info(self, path_list: list[str]) -> list[_FileInfo]:
+        """
+        list_files return file path and size, with a single batched
+        metadata call.
+        Args:
+            path_list(list): file list
+        Returns:
+            filelist(list): file list with file path and size
+        """
+        if len(path_list) <= 0:
+            return []
+
+        file_list = []
+        for path, st in zip(path_list, self._backend.stat(path_list)):
+            if st is None:
+                logger.warning(f"list_files path not exists, path[{path}]")
+                continue
+            if st.is_dir:
+                for child in self._backend.list_dir(path):
+                    if not child.is_dir:
+                        file_list.append(
+                            {'path': child.path, 'size': child.size}
+                        )
+            else:
+                file_list.append({'path': path, 'size': st.size})
+        return file_list
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def mkdirs(self, fs_path: str) -> None:
+        """
+        Create a remote directory, including the missing parents.
+
+        Args:
+            fs_path(str): The remote directory path.
+        """
+        self._backend.mkdirs(fs_path)
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def delete(self, fs_path: str) -> None:
+        """
+        Delete a remote path, whether it's a file or directory.
+
+        Args:
+            fs_path(str): The remote file path.
+        """
+        try:
+            self._backend.delete(fs_path, recursive=True)
+        except FileNotFoundError:
+            pass
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def _try_rename(self, fs_src_path, fs_dst_path):
+        self._backend.rename(fs_src_path, fs_dst_path)
+
+    def rename(self, fs_src_path: str, fs_dst_path: str) -> None:
+        """
+        Rename the remote file or directory.
+
+        Args:
+            fs_src_path(str): The actual name of the file or directory
+            fs_dst_path(str): The new name of the file or directory.
+        """
+        self._try_rename(fs_src_path, fs_dst_path)
+
+    def mv(
+        self,
+        fs_src_path: str,
+        fs_dst_path: str,
+        overwrite: bool = False,
+        test_exists: bool = True,
+    ) -> None:
+        """
+        Move a remote file or directory from `fs_src_path` to `fs_dst_path` .
+
+        Args:
+            fs_src_path(str):  Name of the file or directory, that's needed to be moved.
+            fs_dst_path(str):  Name of the file or directory to which to move to.
+            overwrite(bool): Whether to re-write `fs_dst_path` if that exists. Default is False.
+            test_exists(bool): Check the existence of `fs_src_path` and `fs_dst_path` . When `test_exists` is set true, if `fs_src_path` doesn't exist or `fs_dst_path` exists, program will throw an Exception.
+        """
+        if overwrite and self.is_exist(fs_dst_path):
+            self.delete(fs_dst_path)
+
+        if test_exists:
+            src, dst = self._backend.stat([fs_src_path, fs_dst_path])
+            if src is None:
+                raise FSFileNotExistsError(f"{fs_src_path} is not exists")
+
+            if dst is not None:
+                raise FSFileExistsError(f"{fs_dst_path} exists already")
+
+        self._try_rename(fs_src_path, fs_dst_path)
+
+    def touch(self, fs_path: str, exist_ok: bool = True) -> None:
+        """
+        Create a remote file.
+
+        Args:
+            fs_path(str): The remote file path.
+            exist_ok(bool): When `fs_path` exists, if `exist_ok` is set false,
+            program will throw an Exception. Default is true.
+        """
+        if self.is_exist(fs_path):
+            if exist_ok:
+                return
+            raise FSFileExistsError
+
+        self._write_file(fs_path, [])
+
+    def need_upload_download(self) -> Literal[True]:
+        return True
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def read_range(self, fs_path: str, offset: int, length: int) -> bytes:
+        """
+        Read `length` bytes of a remote file starting from `offset`.
+
+        Args:
+            fs_path(str): The remote file path.
+            offset(int): The start position.
+            length(int): The number of bytes to read.
+
+        Returns:
+            bytes: The content, which is shorter than `length` at the end of file.
+        """
+        return self._backend.read_range(fs_path, offset, length)
+
+    def cat(self, fs_path: str | None = None) -> str:
+        """
+        Cat a remote file.
+
+        Args:
+            fs_path(str|None): The remote file path.
+
+        Returns:
+            file content
+        """
+        st = self._stat(fs_path)
+        if st is None or st.is_dir:
+            return ""
+        data = b"".join(self._read_chunks(fs_path, st.size))
+        return data.decode().rstrip("\n")
+
+    def _read_chunks(self, fs_path, size):
+        tasks = [
+            (fs_path, offset, min(self._chunk_size, size - offset))
+            for offset in range(0, size, self._chunk_size)
+        ]
+        return self._parallel(self.read_range, tasks)
+
+    @_handle_errors()
+    @_wrap_backend_errors
+    def _write_file(self, fs_path, chunks):
+        with self._backend.open_output(fs_path) as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    def _upload_file(self, local_path, fs_path):
+        def read_chunks():
+            with open(local_path, "rb") as f:
+                while True:
+                    chunk = f.read(self._chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+
+        try:
+            self._write_file(fs_path, read_chunks())
+        except Exception as e:
+            self.delete(fs_path)
+            raise e
+
+    def _download_file(self, fs_path, local_path, size):
+        def download_chunk(offset, length):
+            data = self.read_range(fs_path, offset, length)
+            if len(data) != length:
+                raise ExecuteError(
+                    f"read {fs_path} at {offset} expect {length} bytes, but got {len(data)}"
+                )
+            os.pwrite(fd, data, offset)
+
+        fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            tasks = [
+                (offset, min(self._chunk_size, size - offset))
+                for offset in range(0, size, self._chunk_size)
+            ]
+            self._parallel(download_chunk, tasks)
+        except Exception as e:
+            os.close(fd)
+            fd = None
+            os.remove(local_path)
+            raise e
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def upload_dir(
+        self, local_dir: str, dest_dir: str, overwrite: bool = False
+    ) -> None:
+        """
+        upload dir to the remote file system
+        Args:
+            local_dir(str): local dir
+            dest_dir(str): remote dest dir
+            overwrite(bool): is overwrite
+        """
+        local_dir = local_dir.rstrip("/")
+        dest_dir = dest_dir.rstrip("/")
+        dest_path = dest_dir + "/" + os.path.basename(local_dir)
+        if overwrite:
+            self.delete(dest_path)
+        self.upload(local_dir, dest_path)
+
+    def upload(
+        self,
+        local_path: str,
+        fs_path: str,
+        multi_processes: int | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Upload the local file or directory to `fs_path`, the files of a
+        directory are uploaded in parallel.
+
+        Args:
+            local_path(str): The local path.
+            fs_path(str): The remote path.
+            multi_processes(int|None): Unused, kept to be compatible with
+                :class:`HDFSClient`. The parallelism is set by `num_threads`.
+            overwrite(bool|False): will overwrite the remote path or not
+        """
+        if not os.path.exists(local_path):
+            raise FSFileNotExistsError(f"{local_path} not exists")
+
+        if overwrite:
+            self.delete(fs_path)
+
+        if not os.path.isdir(local_path):
+            self._upload_file(local_path, fs_path)
+            return
+
+        tasks = []
+        for root, dirs, files in os.walk(local_path):
+            rel = os.path.relpath(root, local_path)
+            remote_root = fs_path if rel == "." else fs_path + "/" + rel
+            self.mkdirs(remote_root)
+            for name in files:
+                tasks.append(
+                    (os.path.join(root, name), remote_root + "/" + name)
+                )
+        self._parallel(self._upload_file, tasks)
+
+    def download(
+        self,
+        fs_path: str,
+        local_path: str,
+        multi_processes: int | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Download the remote file or directory to `local_path`. Files of a
+        directory are downloaded in parallel, and a large file is downloaded
+        as parallel byte ranges.
+
+        Args:
+            fs_path(str): The remote path.
+            local_path(str): The local path.
+            multi_processes(int|None): Unused, kept to be compatible with
+                :class:`HDFSClient`. The parallelism is set by `num_threads`.
+            overwrite(bool): will overwrite the local path or not
+        """
+        st = self._stat(fs_path)
+        if st is None:
+            raise FSFileNotExistsError(f"{fs_path} not exits")
+
+        if overwrite and os.path.exists(local_path):
+            LocalFS().delete(local_path)
+
+        if not st.is_dir:
+            self._download_file(fs_path, local_path, st.size)
+            return
+
+        files = []
+        pending = [(fs_path.rstrip("/"), local_path)]
+        while pending:
+            remote_dir, local_dir = pending.pop()
+            os.makedirs(local_dir, exist_ok=True)
+            for child in self._list_dir(remote_dir):
+                name = os.path.basename(child.path.rstrip("/"))
+                remote_child = remote_dir + "/" + name
+                local_child = os.path.join(local_dir, name)
+                if child.is_dir:
+                    pending.append((remote_child, local_child))
+                else:
+                    files.append((remote_child, local_child, child.size))
+
+        # small files are downloaded file by file, large files are split
+        # into byte ranges which share the same thread pool
+        small = [f for f in files if f[2] <= self._chunk_size]
+        large = [f for f in files if f[2] > self._chunk_size]
+        self._parallel(self._download_file, small)
+        for task in large:
+            self._download_file(*task)
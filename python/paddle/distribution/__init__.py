@@ -36,6 +36,7 @@ from .multinomial import Multinomial
 from .multivariate_normal import MultivariateNormal
 from .normal import Normal
 from .poisson import Poisson
+from .sampling import chunked_sample
 from .student_t import StudentT
 from .transform import (  # noqa:F401
     AbsTransform,
@@ -83,6 +84,7 @@ __all__ = [
     'Binomial',
     'Poisson',
     'StudentT',
+    'chunked_sample',
 ]
 
 __all__.extend(transform.__all__)
@@ -19,6 +19,8 @@ from collections.abc import Sequence
 from functools import reduce
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
+
 import paddle
 from paddle.base.data_feeder import check_type, convert_dtype
 from paddle.base.framework import Variable
@@ -80,23 +82,19 @@ def vec_to_tril_matrix(
         dim,
     )
 
-    # Create index_matrix = [index0, rows, cols]
-    rows, cols = paddle.meshgrid(paddle.arange(dim), paddle.arange(dim))
-    mask = rows > cols
-    lower_indices = paddle.stack([rows[mask], cols[mask]], axis=1)
-    repeated_lower_indices = paddle.repeat_interleave(
-        lower_indices, shape0, axis=0
+    # The elements of p are put in the strict lower triangle in row order,
+    # gather them with the flattened positions of the matrix, where the
+    # positions not in the strict lower triangle take the zero padded at the
+    # front of p.
+    rows, cols = np.tril_indices(dim, -1)
+    index = np.zeros([dim * dim], dtype='int64')
+    index[rows * dim + cols] = np.arange(1, last_dim + 1)
+
+    p = p_flatten.reshape((shape0, last_dim))
+    p = paddle.concat(
+        [paddle.zeros(shape=(shape0, 1), dtype=p.dtype), p], axis=1
     )
-    index0 = paddle.arange(shape0).unsqueeze(1).tile([last_dim, 1])
-    index_matrix = paddle.concat([index0, repeated_lower_indices], axis=1)
-
-    # Sort the indices
-    sorted_indices = paddle.argsort(index_matrix[:, 0])
-    index_matrix = index_matrix[sorted_indices]
-
-    # Set the value
-    matrix = paddle.zeros(shape=(shape0, dim, dim), dtype=p_flatten.dtype)
-    matrix = paddle.scatter_nd_add(matrix, index_matrix, p_flatten).reshape(
+    matrix = paddle.gather(p, paddle.to_tensor(index), axis=1).reshape(
         output_shape
     )
 
@@ -160,10 +160,15 @@ class Multinomial(distribution.Distribution):
             raise TypeError('sample shape must be Iterable object.')
 
         samples = self._categorical.sample([self.total_count, *list(shape)])
-        return (
-            paddle.nn.functional.one_hot(samples, self.probs.shape[-1])
-            .cast(self.probs.dtype)
-            .sum(0)
+        # Count the trials of each category by scattering them into the last
+        # axis, instead of summing one-hot encoded trials, which takes
+        # total_count times the memory of the result.
+        samples = samples.transpose([*range(1, samples.ndim), 0])
+        counts = paddle.zeros(
+            [*samples.shape[:-1], self.probs.shape[-1]], dtype=self.probs.dtype
+        )
+        return paddle.put_along_axis(
+            counts, samples, 1.0, axis=-1, reduce='add', broadcast=False
         )
 
     def entropy(self) -> Tensor:
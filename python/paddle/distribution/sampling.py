@@ -0,0 +1,143 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING
+
+import paddle
+from paddle.base import core
+from paddle.framework import in_dynamic_mode
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from paddle import Tensor
+    from paddle.distribution.distribution import Distribution
+
+__all__ = ["chunked_sample"]
+
+_MASK64 = (1 << 64) - 1
+
+
+def _chunk_seed(seed: int, index: int) -> int:
+    """
+    Derive the seed of a chunk from the base seed and the chunk index with the
+    SplitMix64 mixing function, so the seed of each chunk only depends on its
+    index and nearby chunks get uncorrelated seeds.
+    """
+    z = (seed + (index + 1) * 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    z = z ^ (z >> 31)
+    # keep it in the range of int64
+    return z >> 1
+
+
+@contextlib.contextmanager
+def _fork_rng(seed: int) -> Generator[None, None, None]:
+    """
+    Seed the random generators in the block and recover their states after.
+    """
+    cpu_state = core.default_cpu_generator().get_state()
+    device_states = paddle.get_rng_state()
+    paddle.seed(seed)
+    try:
+        yield
+    finally:
+        paddle.set_rng_state(device_states)
+        core.default_cpu_generator().set_state(cpu_state)
+
+
+def chunked_sample(
+    distribution: Distribution,
+    shape: Sequence[int],
+    chunk_size: int,
+    seed: int,
+    chunk_indices: Sequence[int] | None = None,
+    reparameterize: bool = False,
+) -> Tensor:
+    """
+    Draw samples of a distribution in chunks along the first axis of ``shape``.
+
+    The random generators are seeded for each chunk by a seed derived from
+    ``seed`` and the index of the chunk, so the samples of a chunk do not
+    depend on which other chunks are drawn or in which order. The chunks of a
+    large sample can be drawn by different processes (e.g. each worker draws
+    ``chunk_indices=range(rank, num_chunks, world_size)``), and the result is
+    the same as drawing them all at once. The states of the global random
+    generators are recovered after sampling.
+
+    Args:
+        distribution (Distribution): The distribution to be sampled.
+        shape (Sequence[int]): The sample shape, whose first axis is split
+            into chunks.
+        chunk_size (int): The size of the first axis of each chunk. The last
+            chunk may be smaller.
+        seed (int): The base seed.
+        chunk_indices (Sequence[int]|None, optional): The indices of the chunks
+            to be drawn. Default is None, which means all chunks are drawn.
+        reparameterize (bool, optional): Whether to draw samples by
+            :code:`rsample`. Default is False, which uses :code:`sample`.
+
+    Returns:
+        Tensor: The concatenation of the drawn chunks along the first axis.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.distribution import Normal, chunked_sample
+
+            >>> dist = Normal(paddle.zeros([3]), paddle.ones([3]))
+            >>> x = chunked_sample(dist, [1000, 2], chunk_size=256, seed=2024)
+            >>> print(x.shape)
+            [1000, 2, 3]
+
+            >>> # the second chunk is the same as x[256:512]
+            >>> y = chunked_sample(dist, [1000, 2], 256, 2024, chunk_indices=[1])
+            >>> print(bool((x[256:512] == y).all()))
+            True
+    """
+    if not in_dynamic_mode():
+        raise RuntimeError("chunked_sample is only supported in dynamic mode.")
+
+    shape = list(shape)
+    if len(shape) == 0:
+        raise ValueError("shape should have at least one axis to be chunked.")
+    if chunk_size <= 0:
+        raise ValueError(
+            f"chunk_size should be greater than 0, but received {chunk_size}."
+        )
+
+    num_chunks = (shape[0] + chunk_size - 1) // chunk_size
+    if chunk_indices is None:
+        chunk_indices = range(num_chunks)
+    elif len(chunk_indices) == 0:
+        raise ValueError("chunk_indices should not be empty.")
+    sample = distribution.rsample if reparameterize else distribution.sample
+
+    chunks = []
+    for index in chunk_indices:
+        if not 0 <= index < num_chunks:
+            raise ValueError(
+                f"chunk index {index} is out of range [0, {num_chunks})."
+            )
+        size = min(chunk_size, shape[0] - index * chunk_size)
+        with _fork_rng(_chunk_seed(seed, index)):
+            chunks.append(sample([size, *shape[1:]]))
+    if len(chunks) == 1:
+        return chunks[0]
+    return paddle.concat(chunks, axis=0)
@@ -13,9 +13,18 @@
 # limitations under the License.
 
 from .math import segment_max, segment_mean, segment_min, segment_sum
-from .message_passing import send_u_recv, send_ue_recv, send_uv
+from .message_passing import (
+    MessagePassingPlan,
+    send_u_recv,
+    send_ue_recv,
+    send_uv,
+)
 from .reindex import reindex_graph, reindex_heter_graph
-from .sampling import sample_neighbors, weighted_sample_neighbors
+from .sampling import (
+    NeighborSampler,
+    sample_neighbors,
+    weighted_sample_neighbors,
+)
 
 __all__ = [
     'send_u_recv',
@@ -29,4 +38,6 @@ __all__ = [
     'reindex_heter_graph',
     'sample_neighbors',
     'weighted_sample_neighbors',
+    'NeighborSampler',
+    'MessagePassingPlan',
 ]
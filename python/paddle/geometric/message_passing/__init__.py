@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .plan import MessagePassingPlan  # noqa: F401
 from .send_recv import send_u_recv, send_ue_recv, send_uv  # noqa: F401
 
 __all__ = []
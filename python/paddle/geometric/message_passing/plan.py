@@ -0,0 +1,212 @@
+#   Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import paddle
+
+from ..math import segment_max, segment_mean, segment_min, segment_sum
+from .send_recv import send_uv
+from .utils import reshape_lhs_rhs
+
+if TYPE_CHECKING:
+    from paddle import Tensor
+
+    from .send_recv import _MessageOp, _ReduceOp
+__all__ = []
+
+_SEGMENT_REDUCE = {
+    "sum": segment_sum,
+    "mean": segment_mean,
+    "max": segment_max,
+    "min": segment_min,
+}
+
+
+class MessagePassingPlan:
+    """
+
+    Index plan of a graph for repeated message passing.
+
+    :ref:`api_paddle_geometric_send_u_recv` and :ref:`api_paddle_geometric_send_ue_recv` work on
+    the raw `src_index` and `dst_index` in every call, scatter the messages to the destinations
+    with atomic operations, and infer the output size from `dst_index` unless `out_size` is given,
+    which copies data from device to host. The plan sorts the edges by destination once, and keeps
+    the sorted indices, the permutation of the edges, the in-degrees and the destination offsets
+    (CSR) of the sorted edges, so that the layers and epochs over the same graph reuse them.
+
+    The messages in destination order are reduced by segment reductions such as
+    :ref:`api_paddle_geometric_segment_sum`, where the messages of a node are contiguous, instead
+    of being scattered. The mean is computed from the cached in-degrees, and the nodes without
+    incoming edges get zeros as in :ref:`api_paddle_geometric_send_u_recv`.
+
+    Args:
+        src_index (Tensor): An 1-D tensor, and the available data type is int32, int64.
+        dst_index (Tensor): An 1-D tensor, and should have the same shape as `src_index`.
+                            The available data type is int32, int64.
+        num_nodes (int, optional): The number of nodes, which is the 0th dimension of the outputs.
+                            Default is None, which means `max(dst_index) + 1`.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> x = paddle.to_tensor([[0, 2, 3], [1, 4, 5], [2, 6, 7]], dtype="float32")
+            >>> indexes = paddle.to_tensor([[0, 1], [1, 2], [2, 1], [0, 0]], dtype="int32")
+            >>> src_index, dst_index = indexes[:, 0], indexes[:, 1]
+            >>> plan = paddle.geometric.MessagePassingPlan(src_index, dst_index, num_nodes=3)
+            >>> out = plan.send_u_recv(x, reduce_op="sum")
+            >>> print(out)
+            Tensor(shape=[3, 3], dtype=float32, place=Place(cpu), stop_gradient=True,
+            [[0. , 2. , 3. ],
+             [2. , 8. , 10.],
+             [1. , 4. , 5. ]])
+    """
+
+    def __init__(
+        self,
+        src_index: Tensor,
+        dst_index: Tensor,
+        num_nodes: int | None = None,
+    ) -> None:
+        if num_nodes is None:
+            num_nodes = int(paddle.max(dst_index)) + 1
+        self.num_nodes = num_nodes
+        self.src_index = src_index
+        self.dst_index = dst_index
+        self.perm = paddle.argsort(dst_index, stable=True)
+        self.sorted_src_index = paddle.gather(src_index, self.perm)
+        self.sorted_dst_index = paddle.gather(dst_index, self.perm)
+        self.in_degree = paddle.bincount(dst_index, minlength=num_nodes)
+        # the sorted edges of node i are in [dst_offsets[i], dst_offsets[i + 1])
+        self.dst_offsets = paddle.concat(
+            [
+                paddle.zeros([1], dtype=self.in_degree.dtype),
+                paddle.cumsum(self.in_degree),
+            ]
+        )
+        # segment reductions output up to the last destination, the nodes
+        # after it are padded
+        num_edges = self.sorted_dst_index.shape[0]
+        self._num_segments = (
+            int(self.sorted_dst_index[-1]) + 1 if num_edges > 0 else 0
+        )
+        self._mean_norm = {}
+
+    def sort_edges(self, edge_feat: Tensor) -> Tensor:
+        """
+        Reorder the edge features `edge_feat` into the destination order of the plan,
+        which can be passed to :meth:`send_ue_recv` with `edges_sorted=True`.
+        """
+        return paddle.gather(edge_feat, self.perm)
+
+    def _segment_reduce(self, segment_reduce, msg):
+        # pad the output of the segment reduction to the number of nodes
+        num_pad = self.num_nodes - self._num_segments
+        if num_pad > 0:
+            pad = paddle.zeros([num_pad, *msg.shape[1:]], dtype=msg.dtype)
+            if self._num_segments == 0:
+                return pad
+        out = segment_reduce(msg, self.sorted_dst_index)
+        return paddle.concat([out, pad]) if num_pad > 0 else out
+
+    def _reduce(self, msg, reduce_op):
+        if reduce_op not in _SEGMENT_REDUCE:
+            raise ValueError(
+                f"reduce_op should be `sum`, `mean`, `max` or `min`, but received {reduce_op}"
+            )
+        if reduce_op == "mean" and msg.is_floating_point():
+            # divide by the degrees computed once, instead of counting the
+            # destinations in every call
+            out = self._segment_reduce(segment_sum, msg)
+            dtype = out.dtype
+            if dtype not in self._mean_norm:
+                degree = paddle.clip(self.in_degree, min=1)
+                self._mean_norm[dtype] = degree.astype(dtype)
+            norm = self._mean_norm[dtype]
+            return out / norm.reshape([-1] + [1] * (len(out.shape) - 1))
+
+        out = self._segment_reduce(_SEGMENT_REDUCE[reduce_op], msg)
+        if reduce_op in ("max", "min"):
+            # the segments of the nodes without incoming edges are not
+            # always zero, e.g. on GPU
+            degree = self.in_degree.reshape([-1] + [1] * (len(out.shape) - 1))
+            out = paddle.where(degree > 0, out, paddle.zeros_like(out))
+        return out
+
+    def send_u_recv(self, x: Tensor, reduce_op: _ReduceOp = "sum") -> Tensor:
+        """
+        Same as :ref:`api_paddle_geometric_send_u_recv` over the graph of the plan.
+        """
+        msg = paddle.gather(x, self.sorted_src_index)
+        return self._reduce(msg, reduce_op)
+
+    def send_ue_recv(
+        self,
+        x: Tensor,
+        y: Tensor,
+        message_op: _MessageOp = "add",
+        reduce_op: _ReduceOp = "sum",
+        edges_sorted: bool = False,
+    ) -> Tensor:
+        """
+        Same as :ref:`api_paddle_geometric_send_ue_recv` over the graph of the plan. The edge
+        features `y` are in the order of the original edges, unless `edges_sorted` is True,
+        which means `y` has been reordered by :meth:`sort_edges`.
+        """
+        if message_op not in ["add", "sub", "mul", "div"]:
+            raise ValueError(
+                f"message_op should be `add`, `sub`, `mul`, `div`, but received {message_op}"
+            )
+        if not edges_sorted:
+            y = self.sort_edges(y)
+        x, y = reshape_lhs_rhs(x, y)
+        msg = paddle.gather(x, self.sorted_src_index)
+        # the same messages as the kernel of send_ue_recv
+        if message_op == "add":
+            msg = msg + y
+        elif message_op == "sub":
+            msg = msg + (-y)
+        elif message_op == "mul":
+            msg = msg * y
+        else:
+            msg = msg * (1.0 / (y + 1e-12))
+        return self._reduce(msg, reduce_op)
+
+    def send_uv(
+        self,
+        x: Tensor,
+        y: Tensor,
+        message_op: _MessageOp = "add",
+        edges_sorted: bool = False,
+    ) -> Tensor:
+        """
+        Same as :ref:`api_paddle_geometric_send_uv` over the graph of the plan. The output
+        is in the order of the original edges, or in the destination order of the plan
+        if `edges_sorted` is True.
+        """
+        if edges_sorted:
+            return send_uv(
+                x,
+                y,
+                self.sorted_src_index,
+                self.sorted_dst_index,
+                message_op=message_op,
+            )
+        return send_uv(
+            x, y, self.src_index, self.dst_index, message_op=message_op
+        )
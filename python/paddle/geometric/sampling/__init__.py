@@ -13,5 +13,6 @@
 # limitations under the License.
 
 from .neighbors import sample_neighbors, weighted_sample_neighbors  # noqa: F401
+from .sampler import NeighborSampler, SampledSubgraph  # noqa: F401
 
 __all__ = []
@@ -0,0 +1,323 @@
+#   Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+import paddle
+
+from ..reindex import reindex_graph
+from .neighbors import sample_neighbors, weighted_sample_neighbors
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from paddle import Tensor
+__all__ = []
+
+
+class SampledSubgraph(NamedTuple):
+    nodes: Tensor
+    edges: list[tuple[Tensor, Tensor]]
+    eids: list[Tensor] | None
+    feat: Tensor | None
+
+
+def _to_tensor(data, dtype=None):
+    if data is None or isinstance(data, paddle.Tensor):
+        return data
+    return paddle.to_tensor(np.asarray(data), dtype=dtype)
+
+
+class NeighborSampler:
+    """
+
+    Multi-hop neighbor sampler over a graph kept in CSC format.
+
+    The sampler holds `row`, `colptr` (and optionally `edge_weight`, `eids`
+    and node features) once, and :meth:`sample` runs neighbor sampling,
+    reindexing and feature gathering for all the hops of a mini-batch in one
+    call. Node features can be a numpy memmap, in that case only the rows of
+    the sampled nodes are read, so the features may be larger than memory.
+
+    The sampler can be passed as `collate_fn` of :ref:`api_paddle_io_DataLoader`
+    over a dataset of node ids (the loader then yields the fields of
+    `SampledSubgraph` as a list), or iterated with :meth:`batches`, which
+    samples the next batches in a background thread.
+
+    Args:
+        row (Tensor|numpy.ndarray): One of the components of the CSC format of the input graph, and
+                      the shape should be [num_edges]. The available data type is int32, int64.
+        colptr (Tensor|numpy.ndarray): One of the components of the CSC format of the input graph,
+                         and the shape should be [num_nodes + 1]. The data type should be the same with `row`.
+        sample_sizes (list|tuple): The number of neighbors sampled for every hop, -1 means all the neighbors.
+        edge_weight (Tensor|numpy.ndarray, optional): The float32 edge weight in CSC order. If it is given,
+                         neighbors are sampled by :ref:`api_paddle_geometric_weighted_sample_neighbors`.
+                         Default is None.
+        eids (Tensor|numpy.ndarray, optional): The edge ids in CSC order, required if `return_eids` is True.
+                         Default is None.
+        node_feat (Tensor|numpy.ndarray, optional): The node features with shape [num_nodes, ...]. Default is None.
+        return_eids (bool, optional): Whether to return the edge ids of the sampled edges. Default is False.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> # edges: (3, 0), (7, 0), (0, 1), (9, 1), (1, 2), (4, 3), (2, 4),
+            >>> #        (9, 5), (3, 5), (9, 6), (1, 6), (9, 8), (7, 8)
+            >>> row = paddle.to_tensor([3, 7, 0, 9, 1, 4, 2, 9, 3, 9, 1, 9, 7], dtype="int64")
+            >>> colptr = paddle.to_tensor([0, 2, 4, 5, 6, 7, 9, 11, 11, 13, 13], dtype="int64")
+            >>> node_feat = paddle.rand([10, 4])
+            >>> sampler = paddle.geometric.NeighborSampler(row, colptr, [2, 2], node_feat=node_feat)
+            >>> subgraph = sampler.sample(paddle.to_tensor([0, 8, 1, 2], dtype="int64"))
+            >>> # subgraph.nodes starts with the input nodes, subgraph.edges holds
+            >>> # the (src, dst) of every hop indexed into subgraph.nodes
+            >>> print(subgraph.nodes.shape[0] >= 4, subgraph.feat.shape[0] == subgraph.nodes.shape[0])
+            True True
+    """
+
+    def __init__(
+        self,
+        row: Tensor | np.ndarray,
+        colptr: Tensor | np.ndarray,
+        sample_sizes: Sequence[int],
+        edge_weight: Tensor | np.ndarray | None = None,
+        eids: Tensor | np.ndarray | None = None,
+        node_feat: Tensor | np.ndarray | None = None,
+        return_eids: bool = False,
+    ) -> None:
+        if return_eids and eids is None:
+            raise ValueError(
+                "`eids` should not be None if `return_eids` is True."
+            )
+        if len(sample_sizes) == 0:
+            raise ValueError("`sample_sizes` should not be empty.")
+        self.row = _to_tensor(row)
+        self.colptr = _to_tensor(colptr)
+        self.edge_weight = _to_tensor(edge_weight)
+        self.eids = _to_tensor(eids)
+        self.sample_sizes = list(sample_sizes)
+        self.node_feat = node_feat
+        self.return_eids = return_eids
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: np.ndarray,
+        num_nodes: int,
+        sample_sizes: Sequence[int],
+        edge_weight: np.ndarray | None = None,
+        **kwargs,
+    ) -> NeighborSampler:
+        """
+        Build the sampler from `edges` with shape [num_edges, 2] of (src, dst) pairs,
+        the edge id of an edge is its position in `edges`.
+        """
+        edges = np.asarray(edges)
+        order = np.argsort(edges[:, 1], kind="stable")
+        row = edges[order, 0].astype("int64")
+        colptr = np.zeros(num_nodes + 1, dtype="int64")
+        np.cumsum(np.bincount(edges[:, 1], minlength=num_nodes), out=colptr[1:])
+        if edge_weight is not None:
+            edge_weight = np.asarray(edge_weight, dtype="float32")[order]
+        return cls(
+            row,
+            colptr,
+            sample_sizes,
+            edge_weight=edge_weight,
+            eids=order.astype("int64"),
+            **kwargs,
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Save the graph as .npy files in directory `path`, so that it can be loaded by :meth:`load`.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in ["row", "colptr", "edge_weight", "eids", "node_feat"]:
+            data = getattr(self, name)
+            if data is None:
+                continue
+            if isinstance(data, paddle.Tensor):
+                data = data.numpy()
+            np.save(os.path.join(path, name + ".npy"), data)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        sample_sizes: Sequence[int],
+        mmap_feat: bool = True,
+        return_eids: bool = False,
+    ) -> NeighborSampler:
+        """
+        Load the graph saved by :meth:`save`. If `mmap_feat` is True, node features
+        are memory-mapped instead of being read into memory.
+        """
+        kwargs = {}
+        for name in ["edge_weight", "eids", "node_feat"]:
+            file = os.path.join(path, name + ".npy")
+            if os.path.exists(file):
+                mmap_mode = "r" if name == "node_feat" and mmap_feat else None
+                kwargs[name] = np.load(file, mmap_mode=mmap_mode)
+        return cls(
+            np.load(os.path.join(path, "row.npy")),
+            np.load(os.path.join(path, "colptr.npy")),
+            sample_sizes,
+            return_eids=return_eids,
+            **kwargs,
+        )
+
+    def _sample_neighbors(self, nodes, sample_size):
+        if self.edge_weight is not None:
+            return weighted_sample_neighbors(
+                self.row,
+                self.colptr,
+                self.edge_weight,
+                nodes,
+                sample_size=sample_size,
+                eids=self.eids,
+                return_eids=self.return_eids,
+            )
+        return sample_neighbors(
+            self.row,
+            self.colptr,
+            nodes,
+            sample_size=sample_size,
+            eids=self.eids,
+            return_eids=self.return_eids,
+        )
+
+    def gather_feat(self, nodes: Tensor) -> Tensor | None:
+        """
+        Gather the features of `nodes`, returns None if the sampler has no node features.
+        """
+        if self.node_feat is None:
+            return None
+        if isinstance(self.node_feat, paddle.Tensor):
+            return paddle.gather(self.node_feat, nodes)
+        # read the rows in ascending order, which is much friendlier to
+        # memory-mapped features
+        index = nodes.numpy()
+        order = np.argsort(index)
+        feat = np.empty(
+            (len(index), *self.node_feat.shape[1:]), dtype=self.node_feat.dtype
+        )
+        feat[order] = self.node_feat[index[order]]
+        return paddle.to_tensor(feat)
+
+    def sample(self, input_nodes: Tensor | np.ndarray) -> SampledSubgraph:
+        """
+        Sample the neighbors of `input_nodes` hop by hop.
+
+        Every hop samples the neighbors of all the nodes reached so far, and the
+        new nodes are appended to them, so the nodes of a hop are always a prefix
+        of the final `nodes` and the edges of all hops share one index space.
+
+        Returns:
+            SampledSubgraph, a namedtuple of
+
+            - nodes (Tensor), the ids of sampled nodes, `input_nodes` first.
+
+            - edges (list), the `(src, dst)` of the sampled edges of every hop, indexed into `nodes`.
+
+            - eids (list|None), the edge ids of every hop if `return_eids` is True.
+
+            - feat (Tensor|None), the features of `nodes` if the sampler has node features.
+        """
+        nodes = _to_tensor(input_nodes, dtype=self.row.dtype)
+        edges = []
+        eids = [] if self.return_eids else None
+        for sample_size in self.sample_sizes:
+            outs = self._sample_neighbors(nodes, sample_size)
+            neighbors, count = outs[0], outs[1]
+            if self.return_eids:
+                eids.append(outs[2])
+            src, dst, nodes = reindex_graph(nodes, neighbors, count)
+            edges.append((src, dst))
+        return SampledSubgraph(nodes, edges, eids, self.gather_feat(nodes))
+
+    def __call__(self, batch: Sequence) -> SampledSubgraph:
+        # used as collate_fn of DataLoader over a dataset of node ids
+        return self.sample(np.asarray(batch).reshape([-1]))
+
+    def batches(
+        self,
+        nodes: Tensor | np.ndarray,
+        batch_size: int,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        prefetch: int = 2,
+    ) -> Iterator[SampledSubgraph]:
+        """
+        Iterate over the sampled subgraphs of `nodes` in mini-batches of `batch_size`.
+        Up to `prefetch` batches are sampled ahead in a background thread, 0 means
+        sampling in the calling thread.
+        """
+        if isinstance(nodes, paddle.Tensor):
+            nodes = nodes.numpy()
+        nodes = np.asarray(nodes)
+        if shuffle:
+            nodes = nodes[np.random.permutation(len(nodes))]
+        end = len(nodes)
+        if drop_last:
+            end -= end % batch_size
+
+        def generate():
+            for start in range(0, end, batch_size):
+                yield self.sample(nodes[start : start + batch_size])
+
+        if prefetch <= 0:
+            yield from generate()
+            return
+
+        buffer = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+
+        def worker():
+            try:
+                for subgraph in generate():
+                    if stop.is_set():
+                        return
+                    buffer.put(subgraph)
+            except Exception as e:
+                buffer.put(e)
+            buffer.put(done)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            # unblock the worker if it waits on a full buffer
+            while thread.is_alive():
+                try:
+                    buffer.get(timeout=0.1)
+                except queue.Empty:
+                    pass
@@ -0,0 +1,406 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from paddle.base.core import create_predictor
+
+from .wrapper import Config
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+    from typing_extensions import Self
+
+    from .wrapper import Predictor
+
+    _Inputs = (
+        dict[str, npt.NDArray[Any]]
+        | Sequence[npt.NDArray[Any]]
+        | npt.NDArray[Any]
+    )
+
+__all__ = []
+
+_STOP = object()
+
+
+class _Request:
+    __slots__ = ('inputs', 'batch_size', 'signature', 'future', 'arrive_time')
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.batch_size = inputs[0].shape[0]
+        # requests can only be concatenated with the same dtype and
+        # non-batch dimensions
+        self.signature = tuple((x.dtype.str, x.shape[1:]) for x in inputs)
+        self.future = Future()
+        self.arrive_time = time.perf_counter()
+
+
+def _percentiles(values):
+    if len(values) == 0:
+        return {'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+    values = np.asarray(values) * 1000.0
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        'p50': float(p50),
+        'p90': float(p90),
+        'p99': float(p99),
+        'max': float(values.max()),
+    }
+
+
+class BatchingServer:
+    """
+    An in-process server that runs a pool of predictors in worker threads and
+    coalesces concurrent requests into batches.
+
+    Each worker owns a predictor cloned from the first one by
+    :code:`Predictor.clone`, so the weights are shared among workers. A worker
+    takes the earliest request from the queue and keeps collecting requests
+    until the batch has :code:`max_batch_size` samples or :code:`max_delay_ms`
+    has passed since the earliest request arrived. The inputs of the requests
+    are concatenated along the first dimension into buffers preallocated for
+    the worker, and the outputs are split back in the same way, so all inputs
+    and outputs of the model must be batched along the first dimension.
+    Requests whose inputs have different dtypes or non-batch dimensions are
+    run in different batches.
+
+    Args:
+        config(Config|Predictor): The config to create the predictor, or a
+            created predictor.
+        num_workers(int, optional): The number of predictors and worker threads.
+            Default is 1.
+        max_batch_size(int, optional): The max number of samples in a batch. A
+            request larger than it is run alone. Default is 32.
+        max_delay_ms(float, optional): The max time in milliseconds a request
+            waits for other requests to be batched with. Default is 2.0.
+        max_queue_size(int, optional): The max number of waiting requests,
+            :code:`submit` blocks when the queue is full. 0 means no limit.
+            Default is 0.
+        metrics_window(int, optional): The number of recent requests used to
+            compute the latency percentiles in :code:`metrics`. Default is 1024.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('requires an inference model')
+            >>> import numpy as np
+            >>> from paddle.inference import BatchingServer, Config
+
+            >>> config = Config('./model/inference.pdmodel', './model/inference.pdiparams')
+            >>> with BatchingServer(config, num_workers=4, max_batch_size=16) as server:
+            ...     future = server.submit({'x': np.ones([1, 4], dtype='float32')})
+            ...     out, = future.result()
+            ...     print(server.metrics()['requests'])
+            1
+    """
+
+    def __init__(
+        self,
+        config: Config | Predictor,
+        num_workers: int = 1,
+        max_batch_size: int = 32,
+        max_delay_ms: float = 2.0,
+        max_queue_size: int = 0,
+        metrics_window: int = 1024,
+    ) -> None:
+        if num_workers < 1:
+            raise ValueError(
+                f"num_workers should be greater than 0, but received {num_workers}."
+            )
+        if max_batch_size < 1:
+            raise ValueError(
+                f"max_batch_size should be greater than 0, but received {max_batch_size}."
+            )
+        if max_delay_ms < 0:
+            raise ValueError(
+                f"max_delay_ms should not be negative, but received {max_delay_ms}."
+            )
+
+        predictor = (
+            create_predictor(config) if isinstance(config, Config) else config
+        )
+        self._predictors = [predictor] + [
+            predictor.clone() for _ in range(num_workers - 1)
+        ]
+        self._input_names = list(predictor.get_input_names())
+        self._output_names = list(predictor.get_output_names())
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay_ms / 1000.0
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._workers = []
+
+        self._lock = threading.Lock()
+        self._num_requests = 0
+        self._num_batches = 0
+        self._num_samples = 0
+        self._num_errors = 0
+        self._queue_times = collections.deque(maxlen=metrics_window)
+        self._latencies = collections.deque(maxlen=metrics_window)
+
+    @property
+    def input_names(self) -> list[str]:
+        return list(self._input_names)
+
+    @property
+    def output_names(self) -> list[str]:
+        return list(self._output_names)
+
+    @property
+    def running(self) -> bool:
+        return len(self._workers) > 0
+
+    def start(self) -> None:
+        """
+        Start the worker threads. It is called by :code:`submit` if the server
+        is not started.
+        """
+        with self._lock:
+            if self._workers:
+                return
+            for i, predictor in enumerate(self._predictors):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    args=(predictor,),
+                    name=f"BatchingServer-{i}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def stop(self) -> None:
+        """
+        Stop the worker threads after the submitted requests are done.
+        """
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._queue.put(_STOP)
+        for worker in workers:
+            worker.join()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def submit(self, inputs: _Inputs) -> Future:
+        """
+        Submit a request.
+
+        Args:
+            inputs(dict|list|tuple|numpy.ndarray): The inputs of the model,
+                either a dict keyed by input names, a list in the order of
+                :code:`input_names`, or an array if the model has only one
+                input. The first dimension of each input is the batch size.
+
+        Returns:
+            concurrent.futures.Future: The future whose result is the list of
+            outputs in the order of :code:`output_names`.
+        """
+        request = _Request(self._normalize_inputs(inputs))
+        if not self.running:
+            self.start()
+        self._queue.put(request)
+        return request.future
+
+    def predict(
+        self, inputs: _Inputs, timeout: float | None = None
+    ) -> list[npt.NDArray[Any]]:
+        """
+        Submit a request and wait for its outputs.
+
+        Args:
+            inputs(dict|list|tuple|numpy.ndarray): The inputs of the model, see
+                :code:`submit`.
+            timeout(float|None, optional): The max seconds to wait. Default is
+                None, which means waiting until the request is done.
+
+        Returns:
+            list: The outputs in the order of :code:`output_names`.
+        """
+        return self.submit(inputs).result(timeout)
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Get the metrics of the server. Latencies are in milliseconds, where
+        :code:`queue_ms` is the time a request waits before its batch runs and
+        :code:`latency_ms` is the time from submitting to getting the outputs.
+
+        Returns:
+            dict: The metrics.
+        """
+        with self._lock:
+            queue_times = list(self._queue_times)
+            latencies = list(self._latencies)
+            num_batches = self._num_batches
+            return {
+                'requests': self._num_requests,
+                'batches': num_batches,
+                'errors': self._num_errors,
+                'avg_batch_size': (
+                    self._num_samples / num_batches if num_batches else 0.0
+                ),
+                'queue_size': self._queue.qsize(),
+                'queue_ms': _percentiles(queue_times),
+                'latency_ms': _percentiles(latencies),
+            }
+
+    def _normalize_inputs(self, inputs):
+        if isinstance(inputs, dict):
+            missing = [n for n in self._input_names if n not in inputs]
+            if missing:
+                raise ValueError(f"Missing inputs {missing} for the request.")
+            inputs = [inputs[n] for n in self._input_names]
+        elif isinstance(inputs, np.ndarray):
+            inputs = [inputs]
+        if len(inputs) != len(self._input_names):
+            raise ValueError(
+                f"The model requires {len(self._input_names)} inputs {self._input_names}, "
+                f"but received {len(inputs)}."
+            )
+        inputs = [np.ascontiguousarray(x) for x in inputs]
+        batch_sizes = {x.shape[0] if x.ndim > 0 else None for x in inputs}
+        if len(batch_sizes) != 1 or None in batch_sizes:
+            raise ValueError(
+                "All inputs of a request should have the same batch size in "
+                f"the first dimension, but received shapes {[x.shape for x in inputs]}."
+            )
+        return inputs
+
+    def _next_batch(self, carry):
+        """
+        Collect a batch of requests. Return the batch and the request that can
+        not be put into the batch, which starts the next one.
+        """
+        first = carry if carry is not None else self._queue.get()
+        if first is _STOP:
+            return None, None
+        batch = [first]
+        num_samples = first.batch_size
+        deadline = first.arrive_time + self._max_delay
+        while num_samples < self._max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                if timeout > 0:
+                    request = self._queue.get(timeout=timeout)
+                else:
+                    request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is _STOP:
+                # stop after this batch is done
+                return batch, request
+            if (
+                request.signature != first.signature
+                or num_samples + request.batch_size > self._max_batch_size
+            ):
+                return batch, request
+            batch.append(request)
+            num_samples += request.batch_size
+        return batch, None
+
+    def _worker_loop(self, predictor):
+        input_handles = [
+            predictor.get_input_handle(n) for n in self._input_names
+        ]
+        output_handles = [
+            predictor.get_output_handle(n) for n in self._output_names
+        ]
+        # staging buffers of this worker, grown on demand and reused by batches
+        buffers = {}
+        carry = None
+        while True:
+            batch, carry = self._next_batch(carry)
+            if batch is None:
+                break
+            batch = [
+                r for r in batch if r.future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                continue
+            start_time = time.perf_counter()
+            try:
+                outputs = self._run_batch(
+                    batch, input_handles, output_handles, predictor, buffers
+                )
+            except Exception as e:
+                with self._lock:
+                    self._num_errors += len(batch)
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            end_time = time.perf_counter()
+            with self._lock:
+                self._num_requests += len(batch)
+                self._num_batches += 1
+                self._num_samples += sum(r.batch_size for r in batch)
+                for request in batch:
+                    self._queue_times.append(start_time - request.arrive_time)
+                    self._latencies.append(end_time - request.arrive_time)
+            for request, output in zip(batch, outputs):
+                request.future.set_result(output)
+
+    def _run_batch(
+        self, batch, input_handles, output_handles, predictor, buffers
+    ):
+        num_samples = sum(r.batch_size for r in batch)
+        for i, handle in enumerate(input_handles):
+            if len(batch) == 1:
+                data = batch[0].inputs[i]
+            else:
+                parts = [r.inputs[i] for r in batch]
+                key = (i, parts[0].dtype.str, parts[0].shape[1:])
+                buffer = buffers.get(key)
+                if buffer is None or buffer.shape[0] < num_samples:
+                    buffer = np.empty(
+                        (max(num_samples, self._max_batch_size),)
+                        + parts[0].shape[1:],
+                        dtype=parts[0].dtype,
+                    )
+                    buffers[key] = buffer
+                data = buffer[:num_samples]
+                np.concatenate(parts, axis=0, out=data)
+            handle.reshape(data.shape)
+            handle.copy_from_cpu(data)
+
+        predictor.run()
+
+        sections = np.cumsum([r.batch_size for r in batch])[:-1]
+        results = [[] for _ in batch]
+        for name, handle in zip(self._output_names, output_handles):
+            output = handle.copy_to_cpu()
+            if output.ndim == 0 or output.shape[0] != num_samples:
+                raise ValueError(
+                    f"The output {name} with shape {output.shape} can not be "
+                    f"split into requests, whose first dimension should be the "
+                    f"batch size {num_samples}."
+                )
+            for result, part in zip(results, np.split(output, sections)):
+                result.append(part)
+        return results
@@ -106,8 +106,9 @@ class _DataLoaderIterBase:
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
+        self._sample_seed = loader._sample_seed
 
-        self._sampler_iter = iter(self._index_sampler)
+        self._init_sampler_iter(loader._next_epoch_state())
         if self._auto_collate_batch:
             self._collate_fn = loader.collate_fn or default_collate_fn
         else:
@@ -132,6 +133,35 @@ class _DataLoaderIterBase:
             else:
                 return _InfiniteIterableSampler(self._dataset, 1)
 
+    def _init_sampler_iter(self, epoch_state):
+        # NOTE: the position of the iteration is recorded as the epoch and
+        #       the number of batches yielded, batches prefetched but not
+        #       yielded are generated from the sampler again on resuming,
+        #       so the state size does not depend on the prefetch depth
+        self._epoch = epoch_state["epoch"]
+        sampler_epoch = epoch_state.get("sampler_epoch")
+        if sampler_epoch is not None and hasattr(
+            self._batch_sampler, "set_epoch"
+        ):
+            self._batch_sampler.set_epoch(sampler_epoch)
+        self._sampler_epoch = getattr(self._batch_sampler, "epoch", None)
+
+        self._sampler_iter = iter(self._index_sampler)
+        # skip the yielded batches by indices only, no data is read
+        self._num_yielded = 0
+        for _ in range(epoch_state.get("num_yielded", 0)):
+            try:
+                next(self._sampler_iter)
+            except StopIteration:
+                break
+            self._num_yielded += 1
+
+    def _state_dict(self):
+        state = {"epoch": self._epoch, "num_yielded": self._num_yielded}
+        if self._sampler_epoch is not None:
+            state["sampler_epoch"] = self._sampler_epoch
+        return state
+
     def __iter__(self):
         return self
 
@@ -167,6 +197,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
             self._auto_collate_batch,
             self._collate_fn,
             self._drop_last,
+            sample_seed=self._sample_seed,
         )
 
         # NOTE: _structure_infos used to record the data structure of
@@ -244,7 +275,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 # with paddle.base.dygraph.guard(place=paddle.CPUPlace()):
                 # read data from dataset in mini-batch
                 batch = self._dataset_fetcher.fetch(
-                    indices, self._thread_done_event
+                    indices, self._thread_done_event, epoch=self._epoch
                 )
             except StopIteration:
                 self._exit_thread_expectedly()
@@ -321,6 +352,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            self._num_yielded += len(self._places)
             benchmark().after_reader()
 
             return data
@@ -473,6 +505,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._use_shared_memory,
                     self._base_seed,
                     self._worker_shm_buffer_size,
+                    self._sample_seed,
                 ),
             )
             worker.daemon = True
@@ -533,7 +566,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._thread.daemon = True
         self._thread.start()
 
-    def _reset(self):
+    def _reset(self, epoch_state):
         # resume iteration in following steps
         # 1. Resume workers, clear worker caches
         # put _ResumeIteration to all worker as resume iteration flag
@@ -573,7 +606,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
         # 4. reset _sampler_iter and put prefetch indices to start next epoch
         # init workers and indices queues and put 2 indices in each indices queue
-        self._sampler_iter = iter(self._index_sampler)
+        self._init_sampler_iter(epoch_state)
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
@@ -801,7 +834,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             else:
                 return
 
-            self._indices_queues[worker_idx].put((self._send_idx, indices))
+            self._indices_queues[worker_idx].put(
+                (self._send_idx, indices, self._epoch)
+            )
             self._task_infos[self._send_idx] = (worker_idx,)
             self._batches_outstanding += 1
             self._send_idx += 1
@@ -872,6 +907,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 trace_event.end()
 
     def _on_output_batch(self):
+        self._num_yielded += len(self._places)
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
             self._try_put_indices()
@@ -12,6 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import random
+
+import numpy as np
+
+import paddle
+
+
+def _seed_sample(sample_seed, epoch, index):
+    # derive the random states from (seed, epoch, index) only, so that the
+    # random transforms of a sample do not depend on which worker loads it,
+    # and a resumed iteration reproduces the same samples
+    states = np.random.SeedSequence([sample_seed, epoch, index]).generate_state(
+        4
+    )
+    seed = (int(states[0]) << 31) | (int(states[1]) >> 1)
+    random.seed(seed)
+    np.random.seed(states)
+    paddle.seed(seed)
+
 
 class _DatasetFetcher:
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
@@ -29,7 +48,9 @@ class _DatasetFetcher:
     #       e.g. to_tensor may cause SIGSEGV in thread, so we pass the
     #       done_event argument to check DataLoader exit status between
     #       each sample processing in the batch
-    def fetch(self, batch_indices, done_event=None):
+    # NOTE: epoch is only used to derive the random states of each sample
+    #       when sample_seed is set, see _seed_sample
+    def fetch(self, batch_indices, done_event=None, epoch=0):
         raise NotImplementedError(
             f"'fetch' not implement for class {self.__class__.__name__}"
         )
@@ -40,7 +61,7 @@ class _IterableDatasetFetcher(_DatasetFetcher):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
         self.dataset_iter = iter(dataset)
 
-    def fetch(self, batch_indices, done_event=None):
+    def fetch(self, batch_indices, done_event=None, epoch=0):
         if self.auto_collate_batch:
             data = []
             for _ in batch_indices:
@@ -66,19 +87,31 @@ class _IterableDatasetFetcher(_DatasetFetcher):
 
 
 class _MapDatasetFetcher(_DatasetFetcher):
-    def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
+    def __init__(
+        self,
+        dataset,
+        auto_collate_batch,
+        collate_fn,
+        drop_last,
+        sample_seed=None,
+    ):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
+        self.sample_seed = sample_seed
 
-    def fetch(self, batch_indices, done_event=None):
+    def fetch(self, batch_indices, done_event=None, epoch=0):
         if self.auto_collate_batch:
             data = []
             for idx in batch_indices:
                 if done_event is None or not done_event.is_set():
+                    if self.sample_seed is not None:
+                        _seed_sample(self.sample_seed, epoch, idx)
                     data.append(self.dataset[idx])
                 else:
                     return None
 
         else:
+            if self.sample_seed is not None:
+                _seed_sample(self.sample_seed, epoch, batch_indices)
             data = self.dataset[batch_indices]
 
         if self.collate_fn:
@@ -51,11 +51,20 @@ class _DatasetKind:
 
     @staticmethod
     def create_fetcher(
-        kind, dataset, auto_collate_batch, collate_fn, drop_last
+        kind,
+        dataset,
+        auto_collate_batch,
+        collate_fn,
+        drop_last,
+        sample_seed=None,
     ):
         if kind == _DatasetKind.MAP:
             return _MapDatasetFetcher(
-                dataset, auto_collate_batch, collate_fn, drop_last
+                dataset,
+                auto_collate_batch,
+                collate_fn,
+                drop_last,
+                sample_seed=sample_seed,
             )
         elif kind == _DatasetKind.ITER:
             return _IterableDatasetFetcher(
@@ -293,6 +302,7 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cache_size=0,
+    sample_seed=None,
 ):
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
@@ -332,7 +342,12 @@ def _worker_loop(
             if init_fn is not None:
                 init_fn(worker_id)
             fetcher = _DatasetKind.create_fetcher(
-                dataset_kind, dataset, auto_collate_batch, collate_fn, drop_last
+                dataset_kind,
+                dataset,
+                auto_collate_batch,
+                collate_fn,
+                drop_last,
+                sample_seed=sample_seed,
             )
         except:
             init_exception = _WorkerException(worker_id)
@@ -350,7 +365,12 @@ def _worker_loop(
                 out_queue.put((data, None, None))
                 iterator_drained = False
                 fetcher = _DatasetKind.create_fetcher(
-                    dataset_kind, dataset, auto_collate_batch, collate_fn, True
+                    dataset_kind,
+                    dataset,
+                    auto_collate_batch,
+                    collate_fn,
+                    True,
+                    sample_seed=sample_seed,
                 )
                 continue
 
@@ -365,7 +385,10 @@ def _worker_loop(
             if done_event.is_set() or iterator_drained:
                 continue
 
-            idx, indices = data
+            # NOTE: the epoch is appended by the main process to derive the
+            #       random states of samples, see _seed_sample
+            idx, indices = data[0], data[1]
+            epoch = data[2] if len(data) > 2 else 0
             try:
                 if init_exception is not None:
                     batch = init_exception
@@ -377,7 +400,7 @@ def _worker_loop(
                     #       CPU tensor operation, so we add CPUPlace guard here
                     #       to make sure tensor will be operated only on CPU
                     with paddle.base.dygraph.guard(place=paddle.CPUPlace()):
-                        batch = fetcher.fetch(indices)
+                        batch = fetcher.fetch(indices, epoch=epoch)
             except Exception as e:
                 if (
                     isinstance(e, StopIteration)
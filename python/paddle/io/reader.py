@@ -19,6 +19,7 @@ import multiprocessing
 import sys
 import time
 import warnings
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -358,6 +359,13 @@ class DataLoader:
             worker id on each subprocess starting if not set as None. Default
             None.
         persistent_workers(bool, optional): whether to keep the workers in the DataLoader. Default False.
+        sample_seed(int|None, optional): if set, the random states of :code:`random`,
+            :code:`numpy` and :code:`paddle` in the worker processes are re-seeded
+            before loading each sample, with a key derived from (sample_seed, epoch,
+            sample index). The random transforms of a sample are then reproducible
+            no matter which worker loads it, and an iteration restored by
+            :code:`set_state_dict` yields the same samples. Only supported for
+            map-style dataset with :attr:`num_workers` > 0. Default None.
 
     Returns:
         DataLoader: an iterable object for data iterating, each element of the generated data is a Tensor.
@@ -463,6 +471,7 @@ class DataLoader:
         timeout: int = 0,
         worker_init_fn: Callable[[int], None] | None = None,
         persistent_workers: bool = False,
+        sample_seed: int | None = None,
     ) -> None:
         self.return_list = return_list
         self.collate_fn = collate_fn
@@ -558,8 +567,23 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
+        self._epoch = 0
+        self._resume_state = None
+        self._last_iterator = None
+        self._sample_seed = None
         self.num_workers = AuToTune(self).__call__()
 
+        if sample_seed is not None:
+            if self.dataset_kind != _DatasetKind.MAP:
+                raise ValueError(
+                    "sample_seed is only supported for map-style dataset"
+                )
+            # NOTE: re-seeding the global random states per sample in the
+            #       main process would change the random states of training
+            if self.num_workers == 0:
+                raise ValueError("sample_seed requires num_workers > 0")
+            self._sample_seed = sample_seed
+
     def __len__(self) -> int:
         if self.dataset_kind == _DatasetKind.ITER:
             raise ValueError("length of IterableDataset not supported")
@@ -571,15 +595,97 @@ class DataLoader:
 
     def __iter__(self) -> _DataLoaderIterBase:
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            iterator = _DataLoaderIterSingleProcess(self)
         elif self._persistent_workers:
             if self._iterator is None:
                 self._iterator = _DataLoaderIterMultiProcess(self)
             else:
-                self._iterator._reset()
-            return self._iterator
+                self._iterator._reset(self._next_epoch_state())
+            iterator = self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            iterator = _DataLoaderIterMultiProcess(self)
+        # NOTE: keep a weak reference only, not to prevent the iterator
+        #       and its workers from being released
+        self._last_iterator = weakref.ref(iterator)
+        return iterator
+
+    def _next_epoch_state(self) -> dict[str, int]:
+        state = self._resume_state or {"epoch": self._epoch, "num_yielded": 0}
+        self._resume_state = None
+        self._epoch = state["epoch"] + 1
+        return state
+
+    def state_dict(self) -> dict[str, int]:
+        """
+        Get the position of the current iteration of the DataLoader, which
+        can be saved with the checkpoint and restored by :code:`set_state_dict`
+        to resume the iteration in the middle of an epoch, without reading
+        the data of the yielded batches again.
+
+        The state records the epoch, the number of yielded batches and the
+        epoch of the batch sampler (if it has one, e.g.
+        :code:`paddle.io.DistributedBatchSampler`). The order of batches can
+        only be restored if the batch sampler yields the same order for the
+        same epoch, which is not the case for :code:`shuffle=True` with the
+        default :code:`paddle.io.BatchSampler`.
+
+        Returns:
+            dict, the state of the DataLoader.
+
+        Examples:
+            .. code-block:: python
+
+                >>> # doctest: +SOLO('can not use multiprocessing testing `paddle.io.DataLoader`')
+                >>> import numpy as np
+                >>> import paddle
+                >>> from paddle.io import Dataset, DistributedBatchSampler, DataLoader
+
+                >>> class RandomDataset(Dataset):  # type: ignore[type-arg]
+                ...     def __getitem__(self, idx):
+                ...         return np.random.random([4]).astype('float32')
+                ...
+                ...     def __len__(self):
+                ...         return 32
+                ...
+                >>> dataset = RandomDataset()
+                >>> sampler = DistributedBatchSampler(dataset, batch_size=4, shuffle=True)
+                >>> loader = DataLoader(dataset, batch_sampler=sampler, num_workers=2, sample_seed=2024)
+                >>> for i, data in enumerate(loader):
+                ...     if i == 3:
+                ...         state = loader.state_dict()
+                ...         break
+
+                >>> new_sampler = DistributedBatchSampler(dataset, batch_size=4, shuffle=True)
+                >>> new_loader = DataLoader(dataset, batch_sampler=new_sampler, num_workers=2, sample_seed=2024)
+                >>> new_loader.set_state_dict(state)
+                >>> # continue from the 5th batch of the epoch
+                >>> for data in new_loader:
+                ...     pass
+        """
+        if self._resume_state is not None:
+            return dict(self._resume_state)
+        iterator = (
+            self._last_iterator() if self._last_iterator is not None else None
+        )
+        if iterator is None:
+            return {"epoch": self._epoch, "num_yielded": 0}
+        return iterator._state_dict()
+
+    def set_state_dict(self, state_dict: dict[str, int]) -> None:
+        """
+        Restore the position of iteration saved by :code:`state_dict`, the
+        next iteration of the DataLoader starts from the first batch not
+        yielded when the state was saved.
+
+        Args:
+            state_dict(dict): the state returned by :code:`state_dict`.
+        """
+        if "epoch" not in state_dict or "num_yielded" not in state_dict:
+            raise ValueError(
+                "state_dict of DataLoader should contain 'epoch' and "
+                f"'num_yielded', but got {list(state_dict.keys())}"
+            )
+        self._resume_state = dict(state_dict)
 
     def __call__(self) -> _DataLoaderIterBase:
         return self.__iter__()
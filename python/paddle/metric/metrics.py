@@ -41,6 +41,161 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _add_counts(total, counts):
+    # Keep the accumulator on the device once a batch arrives as a Tensor,
+    # so that updates from device outputs never synchronize with the host.
+    if isinstance(counts, paddle.Tensor):
+        if not isinstance(total, paddle.Tensor):
+            total = paddle.to_tensor(total, place=counts.place)
+    elif isinstance(total, paddle.Tensor):
+        counts = paddle.to_tensor(counts, place=total.place)
+    return total + counts
+
+
+def _copy_counts(counts):
+    if isinstance(counts, paddle.Tensor):
+        return counts.clone()
+    return np.array(counts)
+
+
+class _ConfusionStats:
+    """
+    Per-class true positive, false positive and false negative counts,
+    i.e. the diagonal and the column/row sums of a confusion matrix.
+
+    Counts of a mini-batch are computed with vectorized operators: NumPy
+    for ndarray inputs, Paddle operators (on the device of the inputs)
+    for Tensor inputs.
+
+    Args:
+        num_classes (int|None): Number of classes. None means binary
+            classification, where the predictions are the probabilities of
+            the positive class.
+        multi_label (bool): Whether every class is an independent binary
+            decision, with probabilities and 0/1 labels of shape
+            [batch_size, num_classes].
+        half_positive (bool): Whether a probability of exactly 0.5 is a
+            positive prediction.
+    """
+
+    def __init__(
+        self,
+        num_classes: int | None = None,
+        multi_label: bool = False,
+        half_positive: bool = True,
+    ) -> None:
+        if num_classes is not None and num_classes < 1:
+            raise ValueError(
+                f"The 'num_classes' must be a positive integer, but received {num_classes}."
+            )
+        if multi_label and num_classes is None:
+            raise ValueError("The 'num_classes' is required for multi_label.")
+        self.num_classes = num_classes
+        self.multi_label = multi_label
+        self.half_positive = half_positive
+        self.reset()
+
+    @property
+    def binary(self) -> bool:
+        return self.num_classes is None or self.multi_label
+
+    def reset(self) -> None:
+        size = self.num_classes or 1
+        self.tp = np.zeros([size], dtype='int64')
+        self.fp = np.zeros([size], dtype='int64')
+        self.fn = np.zeros([size], dtype='int64')
+
+    def _positive(self, preds):
+        # Same decision as rounding the probability to the nearest integer
+        # and comparing it with 1.
+        if self.half_positive:
+            lower = preds >= 0.5
+        else:
+            lower = preds > 0.5
+        return lower & (preds < 1.5)
+
+    def _binary_counts(self, preds, labels):
+        size = self.num_classes or 1
+        pred = self._positive(preds).astype('int64').reshape([-1, size])
+        label = (labels == 1).astype('int64').reshape([-1, size])
+        tp = (pred * label).sum(0)
+        return tp, pred.sum(0) - tp, label.sum(0) - tp
+
+    def _class_ids(self, x):
+        if (
+            self.num_classes > 1
+            and x.ndim > 1
+            and x.shape[-1] == self.num_classes
+        ):
+            # scores or one-hot over the last axis
+            x = x.argmax(-1)
+        return x.reshape([-1]).astype('int64')
+
+    def _multi_class_counts(self, preds, labels):
+        pred = self._class_ids(preds)
+        label = self._class_ids(labels)
+        hit = (pred == label).astype('int64')
+        if isinstance(pred, paddle.Tensor):
+            bincount = paddle.bincount
+        else:
+            bincount = np.bincount
+        tp = bincount(pred, weights=hit, minlength=self.num_classes)
+        tp = tp.astype('int64')
+        fp = bincount(pred, minlength=self.num_classes) - tp
+        fn = bincount(label, minlength=self.num_classes) - tp
+        return tp, fp, fn
+
+    def update(self, preds, labels) -> None:
+        if not isinstance(preds, paddle.Tensor) and not _is_numpy_(preds):
+            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
+        if not isinstance(labels, paddle.Tensor) and not _is_numpy_(labels):
+            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+
+        if isinstance(preds, paddle.Tensor) or isinstance(
+            labels, paddle.Tensor
+        ):
+            if not isinstance(preds, paddle.Tensor):
+                preds = paddle.to_tensor(preds, place=labels.place)
+            if not isinstance(labels, paddle.Tensor):
+                labels = paddle.to_tensor(labels, place=preds.place)
+
+        if self.binary:
+            tp, fp, fn = self._binary_counts(preds, labels)
+        else:
+            tp, fp, fn = self._multi_class_counts(preds, labels)
+        self.tp = _add_counts(self.tp, tp)
+        self.fp = _add_counts(self.fp, fp)
+        self.fn = _add_counts(self.fn, fn)
+
+    def numpy(self, name: str) -> npt.NDArray[np.int64]:
+        counts = getattr(self, name)
+        if isinstance(counts, paddle.Tensor):
+            counts = counts.numpy()
+        return counts
+
+    def state(self) -> dict[str, npt.NDArray[np.int64] | Tensor]:
+        return {
+            'tp': _copy_counts(self.tp),
+            'fp': _copy_counts(self.fp),
+            'fn': _copy_counts(self.fn),
+        }
+
+    def merge(self, state: dict[str, npt.NDArray[np.int64] | Tensor]) -> None:
+        for name in ('tp', 'fp', 'fn'):
+            setattr(self, name, _add_counts(getattr(self, name), state[name]))
+
+
+def _ratio(num, den, average):
+    # Per-class num / den, 0 where den is 0, then averaged.
+    if average == 'micro':
+        den = den.sum()
+        return float(num.sum()) / den if den != 0 else 0.0
+    ratios = np.where(den != 0, num / np.maximum(den, 1), 0.0)
+    if average == 'macro':
+        return float(ratios.mean())
+    return ratios.tolist()
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -170,6 +325,27 @@ class Metric(metaclass=abc.ABCMeta):
             f"function 'name' not implemented in {self.__class__.__name__}."
         )
 
+    def state(self) -> dict[str, Any]:
+        """
+        Returns a copy of the accumulated statistics as a dict of arrays
+        (numpy.ndarray, or Tensor if accumulated on device). States of
+        different data parallel ranks can be summed up, e.g. by
+        :code:`paddle.distributed.all_reduce`, and loaded back with
+        :code:`Metric.merge`.
+        """
+        raise NotImplementedError(
+            f"function 'state' not implemented in {self.__class__.__name__}."
+        )
+
+    def merge(self, state: dict[str, Any]) -> None:
+        """
+        Adds the statistics in `state`, as returned by :code:`Metric.state`,
+        to the accumulated statistics of this metric.
+        """
+        raise NotImplementedError(
+            f"function 'merge' not implemented in {self.__class__.__name__}."
+        )
+
     def compute(self, *args: Any) -> Any:
         """
         This API is advanced usage to accelerate metric calculating, calculations
@@ -279,10 +455,10 @@ class Accuracy(Metric):
         Return:
             Tensor: Correct mask, a tensor with shape [batch_size, d0, ..., topk].
         """
-        pred = paddle.argsort(pred, descending=True)
-        pred = paddle.slice(
-            pred, axes=[len(pred.shape) - 1], starts=[0], ends=[self.maxk]
-        )
+        maxk = self.maxk
+        if 0 < pred.shape[-1] < maxk:
+            maxk = pred.shape[-1]
+        _, pred = paddle.topk(pred, k=maxk)
         if (len(label.shape) == 1) or (
             len(label.shape) == 2 and label.shape[-1] == 1
         ):
@@ -308,14 +484,19 @@ class Accuracy(Metric):
         Return:
             Tensor: the accuracy of current step.
         """
+        num_samples = int(np.prod(correct.shape[:-1]))
+        # correct count of every top-k position, summed over all samples on
+        # the device of `correct`, then the counts of the first k positions
+        ks = [min(k, correct.shape[-1]) - 1 for k in self.topk]
+        correct = correct.reshape([-1, correct.shape[-1]]).astype('int64')
         if isinstance(correct, paddle.Tensor):
-            correct = np.array(correct)
-        num_samples = np.prod(np.array(correct.shape[:-1]))
+            num_corrects = paddle.cumsum(correct.sum(0))[ks].numpy()
+        else:
+            num_corrects = np.cumsum(correct.sum(0))[ks]
         accs = []
-        for i, k in enumerate(self.topk):
-            num_corrects = correct[..., :k].sum()
-            accs.append(float(num_corrects) / num_samples)
-            self.total[i] += num_corrects
+        for i, num_correct in enumerate(num_corrects.tolist()):
+            accs.append(float(num_correct) / num_samples)
+            self.total[i] += num_correct
             self.count[i] += num_samples
         accs = accs[0] if len(self.topk) == 1 else accs
         return accs
@@ -338,6 +519,30 @@ class Accuracy(Metric):
         res = res[0] if len(self.topk) == 1 else res
         return res
 
+    def state(self) -> dict[str, npt.NDArray[Any]]:
+        """
+        Returns a copy of the correct count and the total count of every
+        top-k.
+        """
+        return {
+            'total': np.array(self.total, dtype='float64'),
+            'count': np.array(self.count, dtype='int64'),
+        }
+
+    def merge(self, state: dict[str, npt.NDArray[Any] | Tensor]) -> None:
+        """
+        Adds the counts in `state`, as returned by :code:`state`, to the
+        accumulated counts.
+        """
+        total, count = state['total'], state['count']
+        if isinstance(total, paddle.Tensor):
+            total = total.numpy()
+        if isinstance(count, paddle.Tensor):
+            count = count.numpy()
+        for i in range(len(self.topk)):
+            self.total[i] += float(total[i])
+            self.count[i] += int(count[i])
+
     def _init_name(self, name: str | None) -> None:
         name = name or 'acc'
         if self.maxk != 1:
@@ -358,12 +563,25 @@ class Precision(Metric):
     relevant instances among the retrieved instances. Refer to
     https://en.wikipedia.org/wiki/Evaluation_of_binary_classifiers
 
-    Noted that this class manages the precision score only for binary
-    classification task.
+    By default this class manages the precision score for binary
+    classification task. Set `num_classes` for multi-class or multi-label
+    classification, where the precision of every class is computed and
+    averaged according to `average`.
+
+    Statistics are accumulated on device when the inputs of
+    :code:`update` are Tensors and in NumPy when they are numpy arrays.
 
     Args:
         name (str, optional): String name of the metric instance.
             Default is `precision`.
+        num_classes (int|None, optional): Number of classes. Default is None,
+            which means binary classification.
+        multi_label (bool, optional): Whether every class is an independent
+            binary decision. Default is False.
+        average (str|None, optional): How to average the scores of classes,
+            one of `macro` (unweighted mean), `micro` (computed from the
+            total counts) and None (a list of per-class scores). Ignored for
+            binary classification. Default is `macro`.
 
     Examples:
         .. code-block:: python
@@ -381,6 +599,28 @@ class Precision(Metric):
             >>> print(res)
             1.0
 
+        .. code-block:: python
+            :name: code-multi-class-example
+
+            >>> import numpy as np
+            >>> import paddle
+
+            >>> x = np.array([[0.1, 0.7, 0.2], [0.6, 0.3, 0.1], [0.2, 0.2, 0.6]])
+            >>> y = np.array([1, 0, 0])
+
+            >>> m = paddle.metric.Precision(num_classes=3, average=None)
+            >>> m.update(x, y)
+            >>> print(m.accumulate())
+            [1.0, 1.0, 0.0]
+
+            >>> # sum up the statistics of all data parallel ranks
+            >>> state = m.state()
+            >>> # for v in state.values(): paddle.distributed.all_reduce(v)
+            >>> m.reset()
+            >>> m.merge(state)
+            >>> print(m.accumulate())
+            [1.0, 1.0, 0.0]
+
         .. code-block:: python
             :name: code-model-api-example
 
@@ -417,17 +657,36 @@ class Precision(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    tp: int
-    fp: int
-
     def __init__(
-        self, name: str = 'precision', *args: Any, **kwargs: Any
+        self,
+        name: str = 'precision',
+        num_classes: int | None = None,
+        multi_label: bool = False,
+        average: Literal['macro', 'micro'] | None = 'macro',
+        *args: Any,
+        **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fp = 0  # false positive
+        self._stats = _ConfusionStats(num_classes, multi_label)
+        self._average = average
         self._name = name
 
+    @property
+    def tp(self) -> int | npt.NDArray[np.int64]:
+        """
+        True positive count (of every class if `num_classes` is set).
+        """
+        tp = self._stats.numpy('tp')
+        return int(tp[0]) if self._stats.num_classes is None else tp
+
+    @property
+    def fp(self) -> int | npt.NDArray[np.int64]:
+        """
+        False positive count (of every class if `num_classes` is set).
+        """
+        fp = self._stats.numpy('fp')
+        return int(fp[0]) if self._stats.num_classes is None else fp
+
     def update(
         self,
         preds: npt.NDArray[np.float32 | np.float64] | Tensor,
@@ -437,51 +696,53 @@ class Precision(Metric):
         Update the states based on the current mini-batch prediction results.
 
         Args:
-            preds (numpy.ndarray): The prediction result, usually the output
-                of two-class sigmoid function. It should be a vector (column
-                vector or row vector) with data type: 'float64' or 'float32'.
-            labels (numpy.ndarray): The ground truth (labels),
-                the shape should keep the same as preds.
-                The data type is 'int32' or 'int64'.
+            preds (numpy.ndarray|Tensor): The prediction result. For binary
+                classification, it is usually the output of two-class
+                sigmoid function, a vector (column vector or row vector)
+                with data type: 'float64' or 'float32'. For multi-class,
+                it is the scores of shape [batch_size, num_classes] or the
+                predicted class ids. For multi-label, it is the
+                probabilities of shape [batch_size, num_classes].
+            labels (numpy.ndarray|Tensor): The ground truth (labels). For
+                binary and multi-label classification, the shape should
+                keep the same as preds. For multi-class, it is the class
+                ids or one hot labels. The data type is 'int32' or 'int64'.
         """
-        if isinstance(preds, paddle.Tensor):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, paddle.Tensor):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+        self._stats.update(preds, labels)
 
     def reset(self) -> None:
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fp = 0
+        self._stats.reset()
 
-    def accumulate(self) -> float:
+    def accumulate(self) -> float | list[float]:
         """
         Calculate the final precision.
 
         Returns:
-            A scaler float: results of the calculated precision.
+            A scaler float: results of the calculated precision, or a list
+            of per-class precision if `average` is None.
+        """
+        tp = self._stats.numpy('tp')
+        ap = tp + self._stats.numpy('fp')
+        if self._stats.num_classes is None:
+            return _ratio(tp, ap, 'micro')
+        return _ratio(tp, ap, self._average)
+
+    def state(self) -> dict[str, npt.NDArray[np.int64] | Tensor]:
         """
-        ap = self.tp + self.fp
-        return float(self.tp) / ap if ap != 0 else 0.0
+        Returns a copy of the true positive, false positive and false
+        negative counts of every class.
+        """
+        return self._stats.state()
+
+    def merge(self, state: dict[str, npt.NDArray[np.int64] | Tensor]) -> None:
+        """
+        Adds the counts in `state`, as returned by :code:`state`, to the
+        accumulated counts.
+        """
+        self._stats.merge(state)
 
     def name(self) -> str:
         """
@@ -499,12 +760,25 @@ class Recall(Metric):
     Refer to:
     https://en.wikipedia.org/wiki/Precision_and_recall
 
-    Noted that this class manages the recall score only for
-    binary classification task.
+    By default this class manages the recall score for binary
+    classification task. Set `num_classes` for multi-class or multi-label
+    classification, where the recall of every class is computed and
+    averaged according to `average`.
+
+    Statistics are accumulated on device when the inputs of
+    :code:`update` are Tensors and in NumPy when they are numpy arrays.
 
     Args:
         name (str, optional): String name of the metric instance.
             Default is `recall`.
+        num_classes (int|None, optional): Number of classes. Default is None,
+            which means binary classification.
+        multi_label (bool, optional): Whether every class is an independent
+            binary decision. Default is False.
+        average (str|None, optional): How to average the scores of classes,
+            one of `macro` (unweighted mean), `micro` (computed from the
+            total counts) and None (a list of per-class scores). Ignored for
+            binary classification. Default is `macro`.
 
     Examples:
         .. code-block:: python
@@ -558,15 +832,39 @@ class Recall(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    tp: int
-    fn: int
-
-    def __init__(self, name: str = 'recall', *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        name: str = 'recall',
+        num_classes: int | None = None,
+        multi_label: bool = False,
+        average: Literal['macro', 'micro'] | None = 'macro',
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fn = 0  # false negative
+        # a probability of 0.5 rounds half to even, i.e. to the negative class
+        self._stats = _ConfusionStats(
+            num_classes, multi_label, half_positive=False
+        )
+        self._average = average
         self._name = name
 
+    @property
+    def tp(self) -> int | npt.NDArray[np.int64]:
+        """
+        True positive count (of every class if `num_classes` is set).
+        """
+        tp = self._stats.numpy('tp')
+        return int(tp[0]) if self._stats.num_classes is None else tp
+
+    @property
+    def fn(self) -> int | npt.NDArray[np.int64]:
+        """
+        False negative count (of every class if `num_classes` is set).
+        """
+        fn = self._stats.numpy('fn')
+        return int(fn[0]) if self._stats.num_classes is None else fn
+
     def update(
         self,
         preds: npt.NDArray[np.float32 | np.float64] | Tensor,
@@ -576,51 +874,52 @@ class Recall(Metric):
         Update the states based on the current mini-batch prediction results.
 
         Args:
-            preds(numpy.array): prediction results of current mini-batch,
-                the output of two-class sigmoid function.
-                Shape: [batch_size, 1]. Dtype: 'float64' or 'float32'.
-            labels(numpy.array): ground truth (labels) of current mini-batch,
-                the shape should keep the same as preds.
-                Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
+            preds(numpy.array|Tensor): prediction results of current mini-batch.
+                For binary classification, the output of two-class sigmoid
+                function, Shape: [batch_size, 1]. For multi-class, the scores
+                of shape [batch_size, num_classes] or the predicted class ids.
+                For multi-label, the probabilities of shape
+                [batch_size, num_classes]. Dtype: 'float64' or 'float32'.
+            labels(numpy.array|Tensor): ground truth (labels) of current
+                mini-batch. For binary and multi-label classification, the
+                shape should keep the same as preds. For multi-class, the
+                class ids or one hot labels. Dtype: 'int32' or 'int64'.
         """
-        if isinstance(preds, paddle.Tensor):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
+        self._stats.update(preds, labels)
 
-        if isinstance(labels, paddle.Tensor):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
-
-    def accumulate(self) -> float:
+    def accumulate(self) -> float | list[float]:
         """
         Calculate the final recall.
 
         Returns:
-            A scaler float: results of the calculated Recall.
+            A scaler float: results of the calculated Recall, or a list of
+            per-class recall if `average` is None.
         """
-        recall = self.tp + self.fn
-        return float(self.tp) / recall if recall != 0 else 0.0
+        tp = self._stats.numpy('tp')
+        recall = tp + self._stats.numpy('fn')
+        if self._stats.num_classes is None:
+            return _ratio(tp, recall, 'micro')
+        return _ratio(tp, recall, self._average)
 
     def reset(self) -> None:
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fn = 0
+        self._stats.reset()
+
+    def state(self) -> dict[str, npt.NDArray[np.int64] | Tensor]:
+        """
+        Returns a copy of the true positive, false positive and false
+        negative counts of every class.
+        """
+        return self._stats.state()
+
+    def merge(self, state: dict[str, npt.NDArray[np.int64] | Tensor]) -> None:
+        """
+        Adds the counts in `state`, as returned by :code:`state`, to the
+        accumulated counts.
+        """
+        self._stats.merge(state)
 
     def name(self) -> str:
         """
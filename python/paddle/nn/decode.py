@@ -358,17 +358,9 @@ class BeamSearchDecoder(Decoder):
                 where unfinished beams stay unchanged and finished beams are \
                 replaced with a tensor with all probability on the EOS token.
         """
-        # TODO: use where_op
-        finished = paddle.cast(finished, dtype=probs.dtype)
-
-        probs = paddle.multiply(
-            paddle.tile(
-                paddle.unsqueeze(finished, [2]), [1, 1, self.vocab_size]
-            ),
-            self.noend_mask_tensor,
-        ) - paddle.multiply(probs, (finished - 1).unsqueeze([2]))
-
-        return probs
+        finished = paddle.expand_as(paddle.unsqueeze(finished, [2]), probs)
+        noend_mask = paddle.expand_as(self.noend_mask_tensor, probs)
+        return paddle.where(finished, noend_mask, probs)
 
     def _gather(self, x, indices, batch_size):
         r"""
@@ -402,6 +394,25 @@ class BeamSearchDecoder(Decoder):
         topk_coordinates.stop_gradient = True
         return paddle.gather_nd(x, topk_coordinates)
 
+    def _gather_beams(self, x, flat_indices):
+        r"""
+        Gather beams from the tensor `x` using indices into the merged
+        batch-beam dimension, which is cheaper than building coordinates for
+        `gather_nd` as `_gather` does.
+
+        Parameters:
+            x(Tensor): A tensor with shape `[batch_size, beam_size, ...]`.
+            flat_indices(Tensor): A `int64` tensor with shape `[batch_size * beam_size, 1]`,
+                representing the indices into `[batch_size * beam_size, ...]`.
+
+        Returns:
+            Tensor: A tensor with the same shape and data type as `x`, \
+                representing the gathered tensor.
+        """
+        return self._split_batch_beams(
+            paddle.gather_nd(self._merge_batch_beams(x), flat_indices)
+        )
+
     class OutputWrapper(NamedTuple):
         """
         The structure for the returned value `outputs` of `decoder.step`.
@@ -457,6 +468,16 @@ class BeamSearchDecoder(Decoder):
             shape=[1], dtype="int64", fill_value=self.end_token
         )
 
+        # offsets of each batch entry in the merged batch-beam dimension
+        self.batch_beam_offsets = paddle.unsqueeze(
+            paddle.arange(0, self.batch_size, 1, dtype="int64")
+            * self.beam_size,
+            [1],
+        )
+        self.batch_beam_offsets.stop_gradient = True
+        # the eos mask only depends on vocab size, build it once per decoding
+        self.noend_mask_tensor = None
+
         init_cell_states = paddle.utils.map_structure(
             self._expand_to_beam_size, initial_cell_states
         )
@@ -523,20 +544,25 @@ class BeamSearchDecoder(Decoder):
                 as the input argument `beam_state`.
 
         """
-        self.vocab_size = logits.shape[-1]
-        self.vocab_size_tensor = paddle.full(
-            shape=[1], dtype="int64", fill_value=self.vocab_size
-        )
-        noend_array = [-self.kinf] * self.vocab_size
-        noend_array[self.end_token] = 0
-
-        self.noend_mask_tensor = paddle.assign(np.array(noend_array, "float32"))
-        if paddle.get_default_dtype() == "float64":
-            self.noend_mask_tensor = paddle.cast(
-                self.noend_mask_tensor, "float64"
+        if (
+            self.noend_mask_tensor is None
+            or self.vocab_size != logits.shape[-1]
+        ):
+            self.vocab_size = logits.shape[-1]
+            self.vocab_size_tensor = paddle.full(
+                shape=[1], dtype="int64", fill_value=self.vocab_size
             )
+            noend_array = [-self.kinf] * self.vocab_size
+            noend_array[self.end_token] = 0
+            self.noend_mask_tensor = paddle.assign(
+                np.array(noend_array, "float32")
+            )
+            if self.noend_mask_tensor.dtype != logits.dtype:
+                self.noend_mask_tensor = paddle.cast(
+                    self.noend_mask_tensor, logits.dtype
+                )
 
-        step_log_probs = paddle.log(paddle.nn.functional.softmax(logits))
+        step_log_probs = paddle.nn.functional.log_softmax(logits)
         step_log_probs = self._mask_probs(step_log_probs, beam_state.finished)
 
         log_probs = paddle.add(
@@ -550,21 +576,21 @@ class BeamSearchDecoder(Decoder):
         topk_scores, topk_indices = paddle.topk(x=scores, k=self.beam_size)
         beam_indices = paddle.floor_divide(topk_indices, self.vocab_size_tensor)
         token_indices = paddle.remainder(topk_indices, self.vocab_size_tensor)
-        next_log_probs = self._gather(
-            paddle.reshape(log_probs, [-1, self.beam_size * self.vocab_size]),
-            topk_indices,
-            self.batch_size,
+        # scores are the log probs as long as there is no length penalty
+        next_log_probs = topk_scores
+        # reorder all beam states by parent beam with one set of flat indices
+        flat_beam_indices = paddle.reshape(
+            beam_indices + self.batch_beam_offsets, [-1, 1]
         )
+        flat_beam_indices.stop_gradient = True
         next_cell_states = paddle.utils.map_structure(
-            lambda x: self._gather(x, beam_indices, self.batch_size),
+            lambda x: self._gather_beams(x, flat_beam_indices),
             next_cell_states,
         )
-        next_finished = self._gather(
-            beam_state.finished, beam_indices, self.batch_size
-        )
-        next_lengths = self._gather(
-            beam_state.lengths, beam_indices, self.batch_size
+        next_finished = self._gather_beams(
+            beam_state.finished, flat_beam_indices
         )
+        next_lengths = self._gather_beams(beam_state.lengths, flat_beam_indices)
         next_lengths = next_lengths + paddle.cast(
             paddle.logical_not(next_finished), beam_state.lengths.dtype
         )
@@ -689,6 +715,20 @@ class BeamSearchDecoder(Decoder):
         return True
 
 
+def _maybe_copy(state, new_state, step_mask):
+    # keep `state` for the finished entries marked by the bool `step_mask`
+    # shaped `[batch_size]`, and take `new_state` for the others
+    step_mask = paddle.reshape(step_mask, [-1] + [1] * (len(state.shape) - 1))
+    step_mask = paddle.expand_as(step_mask, state)
+    step_mask.stop_gradient = True
+    if convert_dtype(state.dtype) == "bool":
+        return paddle.logical_or(
+            paddle.logical_and(step_mask, state),
+            paddle.logical_and(paddle.logical_not(step_mask), new_state),
+        )
+    return paddle.where(step_mask, state, new_state)
+
+
 def _dynamic_decode_imperative(
     decoder,
     inits=None,
@@ -699,25 +739,6 @@ def _dynamic_decode_imperative(
     return_length=False,
     **kwargs,
 ):
-    def _maybe_copy(state, new_state, step_mask):
-        # TODO: use where_op
-        state_dtype = state.dtype
-        if convert_dtype(state_dtype) in ["bool"]:
-            state = paddle.cast(state, dtype="float32")
-            new_state = paddle.cast(new_state, dtype="float32")
-        if step_mask.dtype != state.dtype:
-            step_mask = paddle.cast(step_mask, dtype=state.dtype)
-            # otherwise, renamed bool gradients of would be summed up leading
-            # to sum(bool) error.
-        step_mask = step_mask.unsqueeze([1])
-        step_mask.stop_gradient = True
-        new_state = paddle.multiply(state, step_mask) - paddle.multiply(
-            new_state, (step_mask - 1)
-        )
-        if convert_dtype(state_dtype) in ["bool"]:
-            new_state = paddle.cast(new_state, dtype=state_dtype)
-        return new_state
-
     initial_inputs, initial_states, initial_finished = decoder.initialize(inits)
     inputs, states, finished = (
         initial_inputs,
@@ -860,25 +881,6 @@ def _dynamic_decode_declarative(
             initial_states,
         )
 
-    def _maybe_copy(state, new_state, step_mask):
-        # TODO: use where_op
-        state_dtype = state.dtype
-        if convert_dtype(state_dtype) in ["bool"]:
-            state = paddle.cast(state, dtype="float32")
-            new_state = paddle.cast(new_state, dtype="float32")
-        if step_mask.dtype != state.dtype:
-            step_mask = paddle.cast(step_mask, dtype=state.dtype)
-            # otherwise, renamed bool gradients of would be summed up leading
-            # to sum(bool) error.
-        step_mask = step_mask.unsqueeze([1])
-        step_mask.stop_gradient = True
-        new_state = paddle.multiply(state, step_mask) - paddle.multiply(
-            new_state, (step_mask - 1)
-        )
-        if convert_dtype(state_dtype) in ["bool"]:
-            new_state = paddle.cast(new_state, dtype=state_dtype)
-        return new_state
-
     def _transpose_batch_time(x):
         return paddle.transpose(x, [1, 0, *list(range(2, len(x.shape)))])
 
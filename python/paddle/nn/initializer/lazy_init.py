@@ -102,6 +102,10 @@ class LazyGuard:
     process of user defined Layer. Meanwhile, it provides necessary API to
     trigger EagerParamBase Lazy Initialization and get startup Program.
 
+    Parameters created under LazyGuard can also be allocated from a checkpoint
+    by ``Layer.set_state_dict``, which fills each of them with the value in
+    the state dict without running its initializer.
+
     Examples:
 
         .. code-block:: python
@@ -116,6 +120,13 @@ class LazyGuard:
             >>> for param in net.parameters():
             ...     # Initialize param and allocate memory explicitly.
             ...     param.initialize()
+
+            >>> # Or allocate params from a checkpoint without initializing.
+            >>> with LazyGuard():
+            ...     net = Linear(10, 10)
+            ...
+            >>> state_dict = Linear(10, 10).state_dict()
+            >>> missing_keys, unexpected_keys = net.set_state_dict(state_dict)
     """
 
     def __enter__(self) -> None:
@@ -144,6 +144,15 @@ def _addindent(string, indent):
     return s1[0] + '\n' + '\n'.join(s2)
 
 
+def _is_lazy_param(param):
+    # parameters created under LazyGuard are not allocated until initialized
+    return (
+        isinstance(param, framework.EagerParamBase)
+        and getattr(param, '_init_func', None) is not None
+        and not param._is_initialized()
+    )
+
+
 def _layer_trans_dtype(layer, dtype, excluded_layers):
     if type(layer) in excluded_layers:
         return
@@ -2125,7 +2134,8 @@ class Layer:
         use_structured_name: bool = True,
     ) -> tuple[list[str], list[str]]:
         '''
-        Set parameters and persistable buffers from state_dict. All the parameters and buffers will be reset by the tensor in the state_dict
+        Set parameters and persistable buffers from state_dict. All the parameters and buffers will be reset by the tensor in the state_dict.
+        Parameters created under :ref:`api_paddle_LazyGuard` are allocated from the tensor in the state_dict directly, without running their initializers.
 
         Parameters:
             state_dict(dict) : Dict contains all the parameters and persistable buffers.
@@ -2184,7 +2194,11 @@ class Layer:
 
         matched_param_state = []
         for key, param in self._state_dict_impl(use_hook=False).items():
-            if isinstance(param, paddle.Tensor) and not param._is_initialized():
+            if (
+                isinstance(param, paddle.Tensor)
+                and not param._is_initialized()
+                and not _is_lazy_param(param)
+            ):
                 continue
             key_name = key if use_structured_name else param.name
             try:
@@ -2197,7 +2211,13 @@ class Layer:
                 unexpected_keys.append(key)
         if in_dygraph_mode():
             for param, state in matched_param_state:
+                # NOTE: parameters created under LazyGuard have no memory yet,
+                # set_value allocates them from the state directly, so their
+                # initializers are never run.
+                lazy = _is_lazy_param(param)
                 param.set_value(state)
+                if lazy:
+                    param.set_init_func(None)
         else:
 
             def _set_var(var, ndarray):
@@ -168,6 +168,22 @@ def _maybe_copy(state: Tensor, new_state: Tensor, step_mask: Tensor) -> Tensor:
     return new_state
 
 
+def _has_fused_inputs(cell: Layer) -> bool:
+    # The built-in cells split their step into an input projection, which has
+    # no recurrent dependency and can be computed for all time steps by one
+    # matmul, and the recurrent part. Subclasses overriding `forward` might
+    # not follow it and fall back to calling the cell at each step, and so do
+    # cells with forward hooks (e.g. weight_norm recomputes the weights in a
+    # forward pre hook), which only run through `Layer.__call__`.
+    if cell._forward_pre_hooks or cell._forward_post_hooks:
+        return False
+    return type(cell).forward in (
+        SimpleRNNCell.forward,
+        LSTMCell.forward,
+        GRUCell.forward,
+    )
+
+
 def _transpose_batch_time(x: Tensor) -> Tensor:
     perm = [1, 0, *list(range(2, len(x.shape)))]
     return paddle.transpose(x, perm)
@@ -210,12 +226,63 @@ def _rnn_dynamic_graph(
             else None
         )
 
+    if (
+        not kwargs
+        and isinstance(inputs, paddle.Tensor)
+        and _has_fused_inputs(cell)
+    ):
+        inputs = cell._project_inputs(inputs)
+        step_fn = cell._recurrent_step
+    else:
+        step_fn = partial(cell, **kwargs)
+
+    # split along time once instead of slicing at every step
+    flat_inputs = paddle.utils.flatten(inputs)
+    flat_step_inputs = [paddle.unbind(x, axis=0) for x in flat_inputs]
+
     states = initial_states
+    step_masks = None
+    if sequence_length is not None:
+        flat_states = paddle.utils.flatten(states)
+        if all(
+            x.dtype in (paddle.float32, paddle.float64) for x in flat_states
+        ):
+            # broadcast the mask to every state once, then each step only
+            # needs one `where` per state
+            bool_mask = paddle.cast(mask, "bool")
+            step_masks = [
+                paddle.unbind(
+                    paddle.expand(
+                        paddle.reshape(
+                            bool_mask,
+                            [time_steps, -1] + [1] * (len(x.shape) - 1),
+                        ),
+                        [time_steps, *x.shape],
+                    ),
+                    axis=0,
+                )
+                for x in flat_states
+            ]
+
     outputs = []
     for i in range(time_steps):
-        step_inputs = paddle.utils.map_structure(lambda x: x[i], inputs)
-        step_outputs, new_states = cell(step_inputs, states, **kwargs)
-        if sequence_length is not None:
+        step_inputs = paddle.utils.pack_sequence_as(
+            inputs, [x[i] for x in flat_step_inputs]
+        )
+        step_outputs, new_states = step_fn(step_inputs, states)
+        if step_masks is not None:
+            new_states = paddle.utils.pack_sequence_as(
+                states,
+                [
+                    paddle.where(step_mask[i], new_state, state)
+                    for step_mask, state, new_state in zip(
+                        step_masks,
+                        paddle.utils.flatten(states),
+                        paddle.utils.flatten(new_states),
+                    )
+                ],
+            )
+        elif sequence_length is not None:
             new_states = paddle.utils.map_structure(
                 partial(_maybe_copy, step_mask=mask[i]), states, new_states
             )
@@ -894,10 +961,18 @@ class SimpleRNNCell(RNNCellBase):
     def forward(self, inputs: Tensor, states: Tensor | None = None):
         if states is None:
             states = self.get_initial_states(inputs, self.state_shape)
-        pre_h = states
+        return self._recurrent_step(self._project_inputs(inputs), states)
+
+    def _project_inputs(self, inputs: Tensor) -> Tensor:
         i2h = paddle.matmul(inputs, self.weight_ih, transpose_y=True)
         if self.bias_ih is not None:
-            i2h += self.bias_ih
+            i2h = i2h + self.bias_ih
+        return i2h
+
+    def _recurrent_step(
+        self, i2h: Tensor, states: Tensor
+    ) -> tuple[Tensor, Tensor]:
+        pre_h = states
         h2h = paddle.matmul(pre_h, self.weight_hh, transpose_y=True)
         if self.bias_hh is not None:
             h2h += self.bias_hh
@@ -1107,11 +1182,21 @@ class LSTMCell(RNNCellBase):
     def forward(self, inputs: Tensor, states: Sequence[Tensor] | None = None):
         if states is None:
             states = self.get_initial_states(inputs, self.state_shape)
-        pre_hidden, pre_cell = states
+        return self._recurrent_step(self._project_inputs(inputs), states)
+
+    def _project_inputs(self, inputs: Tensor) -> Tensor:
         gates = paddle.matmul(inputs, self.weight_ih, transpose_y=True)
         if self.bias_ih is not None:
             gates = gates + self.bias_ih
-        gates += paddle.matmul(pre_hidden, self.weight_hh, transpose_y=True)
+        return gates
+
+    def _recurrent_step(
+        self, gates: Tensor, states: Sequence[Tensor]
+    ) -> tuple[Tensor, tuple[Tensor, Tensor]]:
+        pre_hidden, pre_cell = states
+        gates = gates + paddle.matmul(
+            pre_hidden, self.weight_hh, transpose_y=True
+        )
         if self.bias_hh is not None:
             gates = gates + self.bias_hh
 
@@ -1304,11 +1389,18 @@ class GRUCell(RNNCellBase):
     ) -> tuple[Tensor, Tensor]:
         if states is None:
             states = self.get_initial_states(inputs, self.state_shape)
+        return self._recurrent_step(self._project_inputs(inputs), states)
 
-        pre_hidden = states
+    def _project_inputs(self, inputs: Tensor) -> Tensor:
         x_gates = paddle.matmul(inputs, self.weight_ih, transpose_y=True)
         if self.bias_ih is not None:
             x_gates = x_gates + self.bias_ih
+        return x_gates
+
+    def _recurrent_step(
+        self, x_gates: Tensor, states: Tensor
+    ) -> tuple[Tensor, Tensor]:
+        pre_hidden = states
         h_gates = paddle.matmul(pre_hidden, self.weight_hh, transpose_y=True)
         if self.bias_hh is not None:
             h_gates = h_gates + self.bias_hh
@@ -22,6 +22,7 @@ import numpy as np
 
 import paddle
 from paddle.base.data_feeder import convert_dtype
+from paddle.framework import in_dynamic_mode
 
 from ... import tensor
 from ...framework import ParamAttr
@@ -175,6 +176,9 @@ class MultiHeadAttention(Layer):
 
     Cache = collections.namedtuple("Cache", ["k", "v"])
     StaticCache = collections.namedtuple("StaticCache", ["k", "v"])
+    PreallocatedCache = collections.namedtuple(
+        "PreallocatedCache", ["k", "v", "seq_lens"]
+    )
 
     embed_dim: int
     kdim: int
@@ -246,8 +250,10 @@ class MultiHeadAttention(Layer):
         query: Tensor,
         key: Tensor,
         value: Tensor,
-        cache: Cache | StaticCache = ...,
-    ) -> tuple[Tensor, Tensor, Tensor, Cache | StaticCache]: ...
+        cache: Cache | StaticCache | PreallocatedCache = ...,
+    ) -> tuple[
+        Tensor, Tensor, Tensor, Cache | StaticCache | PreallocatedCache
+    ]: ...
 
     def _prepare_qkv(self, query, key, value, cache=None):
         r"""
@@ -277,6 +283,9 @@ class MultiHeadAttention(Layer):
                 `StaticCache`, `key` and `value` args would be ignored, `k` and
                 `v` fields would be used as calculated results on `key` and
                 `value`, which mostly used for decoder-encoder cross attention.
+                If it is an instance of `PreallocatedCache`, `k` and `v` are
+                written in place at the positions given by `seq_lens`, see
+                `MultiHeadAttention.gen_cache` for more details.
                 It is only used for inference and should be None for training.
                 Default None.
 
@@ -301,9 +310,41 @@ class MultiHeadAttention(Layer):
             k = tensor.concat([cache.k, k], axis=2)
             v = tensor.concat([cache.v, v], axis=2)
             cache = self.Cache(k, v)
+        elif isinstance(cache, self.PreallocatedCache):
+            # for decoder self-attention in inference, write the new keys and
+            # values into the preallocated buffers instead of concatenating
+            cache = self._update_preallocated_cache(cache, k, v)
+            k, v = cache.k, cache.v
 
         return (q, k, v) if cache is None else (q, k, v, cache)
 
+    def _update_preallocated_cache(
+        self, cache: PreallocatedCache, k: Tensor, v: Tensor
+    ) -> PreallocatedCache:
+        # position of the t-th new step of slot b is `seq_lens[b] + t`
+        step = paddle.arange(k.shape[2], dtype=cache.seq_lens.dtype)
+        index = cache.seq_lens.unsqueeze(1) + step.unsqueeze(0)
+        index = index.reshape([index.shape[0], 1, -1, 1])
+        if in_dynamic_mode():
+            paddle.put_along_axis_(cache.k, index, k, axis=2)
+            paddle.put_along_axis_(cache.v, index, v, axis=2)
+            cache_k, cache_v = cache.k, cache.v
+        else:
+            cache_k = paddle.put_along_axis(cache.k, index, k, axis=2)
+            cache_v = paddle.put_along_axis(cache.v, index, v, axis=2)
+        return self.PreallocatedCache(
+            cache_k, cache_v, cache.seq_lens + k.shape[2]
+        )
+
+    def _preallocated_cache_mask(
+        self, cache: PreallocatedCache, dtype: DTypeLike
+    ) -> Tensor:
+        # mask out the positions of each slot which have not been written yet
+        positions = paddle.arange(cache.k.shape[2], dtype=cache.seq_lens.dtype)
+        valid = positions.unsqueeze(0) < cache.seq_lens.unsqueeze(1)
+        valid = valid.reshape([valid.shape[0], 1, 1, -1])
+        return _convert_attention_mask(valid, dtype)
+
     def compute_kv(self, key: Tensor, value: Tensor) -> tuple[Tensor, Tensor]:
         r"""
         Applies linear projection on input keys and values, then splits heads
@@ -338,7 +379,11 @@ class MultiHeadAttention(Layer):
 
     @overload
     def gen_cache(
-        self, key: Tensor, value: Tensor | None = ..., type: type[Cache] = ...
+        self,
+        key: Tensor,
+        value: Tensor | None = ...,
+        type: type[Cache] = ...,
+        max_length: None = ...,
     ) -> Cache: ...
 
     @overload
@@ -347,9 +392,19 @@ class MultiHeadAttention(Layer):
         key: Tensor,
         value: Tensor | None = ...,
         type: type[StaticCache] = ...,
+        max_length: None = ...,
     ) -> StaticCache: ...
 
-    def gen_cache(self, key, value=None, type=Cache):
+    @overload
+    def gen_cache(
+        self,
+        key: Tensor,
+        value: Tensor | None = ...,
+        type: type[PreallocatedCache] = ...,
+        max_length: int = ...,
+    ) -> PreallocatedCache: ...
+
+    def gen_cache(self, key, value=None, type=Cache, max_length=None):
         """
         Generates cache for `forward` usage in inference according to arguments.
         The generated cache is an instance of `MultiHeadAttention.Cache` or an
@@ -370,6 +425,17 @@ class MultiHeadAttention(Layer):
         and the tensors keep unchanged among decoding steps, which are mostly used
         for decoder-encoder cross attention.
 
+        If the generated cache is an instance of `PreallocatedCache`, it serves
+        the same purpose as `Cache`, but `k` and `v` fields are buffers shaped
+        `[batch_size, num_heads, max_length, embed_dim // num_heads]` allocated
+        once, and `seq_lens` field is an int64 tensor shaped `[batch_size]`
+        holding the number of valid positions of each batch slot. Each decoding
+        step writes its keys and values in place at position `seq_lens` of every
+        slot, so the slots may have different lengths, and positions beyond
+        `seq_lens` are masked out in attention. Thus `attn_mask` used with it
+        should be broadcastable to `[batch_size, num_heads, query_length, max_length]`.
+        The total decoding length of any slot must not exceed `max_length`.
+
         The cache is generated as follows:
 
         1. If `type` is `StaticCache`, apply `compute_kv(key, value)` and use the
@@ -383,6 +449,13 @@ class MultiHeadAttention(Layer):
         3. If `type` is `Cache` and `value` is not None, use `key`, `value` to create
         an instance of `Cache`.
 
+        4. If `type` is `PreallocatedCache`, generate zero tensors shaped
+        `[batch_size, num_heads, max_length, embed_dim // num_heads]` whose
+        `batch_size` and data type come from `key`. If `value` is None, all
+        slots start empty. Otherwise `key` and `value` are taken as initial
+        keys and values shaped `[batch_size, num_heads, length, embed_dim // num_heads]`
+        and are copied to the beginning of the buffers.
+
         Parameters:
             key (Tensor): The keys for multi-head attention. It is
                 a tensor with shape `[batch_size, key_length, kdim]`. The
@@ -392,15 +465,54 @@ class MultiHeadAttention(Layer):
                 is a tensor with shape `[batch_size, value_length, vdim]`.
                 The data type should be float32 or float64. If None, `key` is only
                 for batch size reference. Default None.
-            type (type): It should be `MultiHeadAttention.StaticCache` or
-                `MultiHeadAttention.Cache` to indicate the cache type to generate.
+            type (type): It should be `MultiHeadAttention.StaticCache`,
+                `MultiHeadAttention.Cache` or `MultiHeadAttention.PreallocatedCache`
+                to indicate the cache type to generate.
+            max_length (int|None, optional): The capacity of the buffers along
+                the length dimension. It is required when `type` is
+                `MultiHeadAttention.PreallocatedCache` and ignored otherwise.
+                Default None.
 
         Returns:
-            namedtuple: an instance of `Cache` or `StaticCache` accordingly.
+            namedtuple: an instance of `Cache`, `StaticCache` or `PreallocatedCache`
+            accordingly.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import paddle
+
+                >>> multi_head_attn = paddle.nn.MultiHeadAttention(128, 2)
+                >>> query = paddle.rand((2, 1, 128))
+                >>> cache = multi_head_attn.gen_cache(
+                ...     query, type=multi_head_attn.PreallocatedCache, max_length=16
+                ... )
+                >>> for _ in range(3):
+                ...     output, cache = multi_head_attn(query, cache=cache)
+                >>> print(cache.k.shape)
+                [2, 2, 16, 64]
+                >>> print(cache.seq_lens.numpy())
+                [3 3]
         """
         if type == MultiHeadAttention.StaticCache:  # static_kv
             k, v = self.compute_kv(key, value)
             return self.StaticCache(k, v)
+        elif type == MultiHeadAttention.PreallocatedCache:
+            if max_length is None:
+                raise ValueError(
+                    "max_length should be provided to generate PreallocatedCache."
+                )
+            batch_size = paddle.shape(key)[0].item()
+            fill_shape = [batch_size, self.num_heads, max_length, self.head_dim]
+            k = paddle.zeros(fill_shape, key.dtype)
+            v = paddle.zeros(fill_shape, key.dtype)
+            seq_lens = paddle.zeros([batch_size], 'int64')
+            if value is None:
+                return self.PreallocatedCache(k, v, seq_lens)
+            return self._update_preallocated_cache(
+                self.PreallocatedCache(k, v, seq_lens), key, value
+            )
         elif value is None:  # incremental_state
             fill_shape = [-1, self.num_heads, 0, self.head_dim]
             fill_shape[0] = paddle.shape(key)[0].item()
@@ -508,6 +620,9 @@ class MultiHeadAttention(Layer):
                 `StaticCache`, `key` and `value` args would be ignored, `k` and
                 `v` fields would be used as calculated results on `key` and
                 `value`, which mostly used for decoder-encoder cross attention.
+                If it is an instance of `PreallocatedCache`, it is used like
+                `Cache` but updated in place, see `MultiHeadAttention.gen_cache`
+                for more details.
                 It is only used for inference and should be None for training.
                 Default None.
 
@@ -521,7 +636,9 @@ class MultiHeadAttention(Layer):
             having the same type as `cache`, and if it is `StaticCache`, it
             is same as the input `cache`, if it is `Cache`, the new cache
             reserves tensors concatenating raw tensors with intermediate
-            results of current query.
+            results of current query, if it is `PreallocatedCache`, the new
+            cache shares buffers with the input `cache` and has `seq_lens`
+            increased by `query_length`.
         """
         key = query if key is None else key
         value = query if value is None else value
@@ -539,6 +656,10 @@ class MultiHeadAttention(Layer):
             # Support bool or int mask
             attn_mask = _convert_attention_mask(attn_mask, product.dtype)
             product = product + attn_mask
+        if isinstance(cache, self.PreallocatedCache):
+            product = product + self._preallocated_cache_mask(
+                cache, product.dtype
+            )
         weights = F.softmax(product)
         if self.dropout:
             weights = F.dropout(
@@ -1177,18 +1298,23 @@ class TransformerDecoderLayer(Layer):
             tgt if cache is None else (tgt, (incremental_cache, static_cache))
         )
 
-    def gen_cache(
-        self, memory: Tensor
-    ) -> tuple[MultiHeadAttention.Cache, MultiHeadAttention.StaticCache]:
+    def gen_cache(self, memory: Tensor, max_length: int | None = None) -> tuple[
+        MultiHeadAttention.Cache | MultiHeadAttention.PreallocatedCache,
+        MultiHeadAttention.StaticCache,
+    ]:
         r"""
         Generates cache for `forward` usage. The generated cache is a tuple
-        composed of an instance of `MultiHeadAttention.Cache` and an instance
-        of `MultiHeadAttention.StaticCache`.
+        composed of an instance of `MultiHeadAttention.Cache` (or
+        `MultiHeadAttention.PreallocatedCache` if `max_length` is given) and
+        an instance of `MultiHeadAttention.StaticCache`.
 
         Parameters:
             memory (Tensor): The output of Transformer encoder. It is a tensor
                 with shape `[batch_size, source_length, d_model]`. The data type
                 should be float32 or float64.
+            max_length (int|None, optional): If provided, `incremental_cache`
+                is a `MultiHeadAttention.PreallocatedCache` which can hold
+                `max_length` decoding steps and is updated in place. Default None.
 
         Returns:
             tuple: It is a tuple( :code:`(incremental_cache, static_cache)` ). \
@@ -1201,9 +1327,16 @@ class TransformerDecoderLayer(Layer):
                 See `MultiHeadAttention.gen_cache` and `MultiHeadAttention.forward` \
                 for more details.
         """
-        incremental_cache = self.self_attn.gen_cache(
-            memory, type=self.self_attn.Cache
-        )
+        if max_length is None:
+            incremental_cache = self.self_attn.gen_cache(
+                memory, type=self.self_attn.Cache
+            )
+        else:
+            incremental_cache = self.self_attn.gen_cache(
+                memory,
+                type=self.self_attn.PreallocatedCache,
+                max_length=max_length,
+            )
         static_cache = self.cross_attn.gen_cache(
             memory, memory, type=self.cross_attn.StaticCache
         )
@@ -1373,7 +1506,10 @@ class TransformerDecoder(Layer):
 
     @overload
     def gen_cache(
-        self, memory: Tensor, do_zip: Literal[False] = ...
+        self,
+        memory: Tensor,
+        do_zip: Literal[False] = ...,
+        max_length: int | None = ...,
     ) -> (
         list[tuple[MultiHeadAttention.Cache, MultiHeadAttention.StaticCache]]
         | list[
@@ -1384,7 +1520,10 @@ class TransformerDecoder(Layer):
 
     @overload
     def gen_cache(
-        self, memory: Tensor, do_zip: Literal[True] = ...
+        self,
+        memory: Tensor,
+        do_zip: Literal[True] = ...,
+        max_length: int | None = ...,
     ) -> list[
         tuple[MultiHeadAttention.Cache, ...]
         | tuple[MultiHeadAttention.StaticCache, ...]
@@ -1392,7 +1531,10 @@ class TransformerDecoder(Layer):
 
     @overload
     def gen_cache(
-        self, memory: Tensor, do_zip: bool = ...
+        self,
+        memory: Tensor,
+        do_zip: bool = ...,
+        max_length: int | None = ...,
     ) -> (
         list[tuple[MultiHeadAttention.Cache, MultiHeadAttention.StaticCache]]
         | list[
@@ -1401,7 +1543,7 @@ class TransformerDecoder(Layer):
         ]
     ): ...
 
-    def gen_cache(self, memory, do_zip=False):
+    def gen_cache(self, memory, do_zip=False, max_length=None):
         r"""
         Generates cache for `forward` usage. The generated cache is a list, and
         each element in it is a tuple( :code:`(incremental_cache, static_cache)` )
@@ -1416,6 +1558,10 @@ class TransformerDecoder(Layer):
                 should be float32 or float64.
             do_zip (bool, optional): Indicate whether to apply `zip` on the tuples.
                 If True, return a list with two elements. Default False
+            max_length (int|None, optional): If provided, the incremental cache
+                of each layer is a `MultiHeadAttention.PreallocatedCache` which
+                can hold `max_length` decoding steps, see
+                `TransformerDecoderLayer.gen_cache` for more details. Default None.
 
         Returns:
             list: It is a list, and each element in the list is a tuple produced \
@@ -1423,7 +1569,10 @@ class TransformerDecoder(Layer):
                 for more details. If `do_zip` is True, apply `zip` on these tuples \
                 and return a list with two elements.
         """
-        cache = [layer.gen_cache(memory) for layer in self.layers]
+        cache = [
+            layer.gen_cache(memory, max_length=max_length)
+            for layer in self.layers
+        ]
         if do_zip:
             cache = list(zip(*cache))
         return cache
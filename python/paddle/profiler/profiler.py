@@ -14,9 +14,11 @@
 from __future__ import annotations
 
 import datetime
+import gzip
 import importlib
 import json
 import os
+import shutil
 import socket
 from enum import Enum
 from typing import TYPE_CHECKING, Callable, Literal
@@ -35,6 +37,7 @@ from paddle.base.core import (
 from paddle.profiler import utils
 
 from .profiler_statistic import (
+    OperatorSummary,
     SortedKeys,
     StatisticData,
     _build_table,
@@ -224,17 +227,32 @@ def _default_state_scheduler(step: int):
     return ProfilerState.RECORD
 
 
+def _gzip_file(src_path: str, dst_path: str) -> None:
+    r"""
+    Compress ``src_path`` into ``dst_path`` chunk by chunk and remove ``src_path``.
+    """
+    with open(src_path, 'rb') as src, gzip.open(dst_path, 'wb') as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.remove(src_path)
+
+
 def export_chrome_tracing(
-    dir_name: str, worker_name: str | None = None
+    dir_name: str, worker_name: str | None = None, compress: bool = False
 ) -> Callable[[Profiler], None]:
     r"""
     Return a callable, used for outputing tracing data to chrome tracing format file.
     The output file will be saved in directory ``dir_name``, and file name will be set as `worker_name`.
     if `worker_name` is not set, the default name is `[hostname]_[pid]`.
 
+    The callable is invoked once for every recorded window of the scheduler, so with a repeating
+    scheduler (see :ref:`make_scheduler <api_paddle_profiler_make_scheduler>`) a long run is written
+    as a sequence of small trace files while it is training, instead of one huge trace at the end.
+
     Args:
         dir_name(str): Directory to save profiling data.
         worker_name(str, optional): Prefix of the file name saved, default is `[hostname]_[pid]`.
+        compress(bool, optional): Whether to gzip each trace file, the file name then ends with ``.json.gz``.
+            Chrome tracing and perfetto can open gzipped traces directly. Default: False.
 
     Returns:
         A callable, which takes a Profiler object as parameter and calls its export method to save data to chrome tracing format file.
@@ -272,6 +290,8 @@ def export_chrome_tracing(
         filename = '{}_time_{}.paddle_trace.json'.format(
             worker_name, now.strftime('%Y_%m_%d_%H_%M_%S_%f')
         )
+        if compress:
+            filename += '.gz'
         prof.export(os.path.join(dir_name, filename), "json")
 
     return handle_fn
@@ -372,6 +392,9 @@ class Profiler:
         profile_memory (bool, optional): If it is True, collect tensor memory allocation and release information. Default: False.
         custom_device_types (list, optional): If targets contain profiler.ProfilerTarget.CUSTOM_DEVICE, custom_device_types select the custom device type for profiling. The default value represents all custom devices will be selected.
         with_flops (bool, optional): If it is True, the flops of the op will be calculated. Default: False.
+        accumulate_summary (bool, optional): If it is True, the operator events of every recorded window are folded into
+            ``operator_summary`` (an ``OperatorSummary`` holding per-operator call count and CPU/GPU time) as soon as the window
+            is returned, so a long run can be summarized without keeping its traces. Default: False.
 
     Examples:
         1. profiling range [2, 5).
@@ -499,6 +522,7 @@ class Profiler:
     profile_memory: bool
     with_flops: bool
     emit_nvtx: bool
+    operator_summary: OperatorSummary | None
 
     def __init__(
         self,
@@ -514,6 +538,7 @@ class Profiler:
         emit_nvtx: bool = False,
         custom_device_types: list[str] = [],
         with_flops: bool = False,
+        accumulate_summary: bool = False,
     ) -> None:
         supported_targets = _get_supported_targets()
         if targets:
@@ -576,6 +601,10 @@ class Profiler:
         self.profile_memory = profile_memory
         self.with_flops = with_flops
         self.emit_nvtx = emit_nvtx
+        self.operator_summary = (
+            OperatorSummary() if accumulate_summary else None
+        )
+        self._sampling_ops = False
 
     def __enter__(self) -> Self:
         self.start()
@@ -661,6 +690,8 @@ class Profiler:
                 ...     prof.step()
                 ... prof.stop()
         '''
+        if self.timer_only:
+            self._sample_ops(resample=False)
         benchmark().end()
         if self.timer_only:
             return
@@ -684,8 +715,7 @@ class Profiler:
             or self.current_state == ProfilerState.RECORD_AND_RETURN
         ):
             self.profiler_result = self.profiler.stop()
-            if self.on_trace_ready:
-                self.on_trace_ready(self)
+            self._handle_trace_ready()
         utils._is_profiler_used = False
 
     def step(self, num_samples: int | None = None) -> None:
@@ -718,6 +748,7 @@ class Profiler:
         """
         benchmark().step(num_samples)
         if self.timer_only:
+            self._sample_ops()
             return
         if self.record_event:
             self.record_event.end()
@@ -779,6 +810,20 @@ class Profiler:
             unit = 'samples'
         return benchmark().step_info(unit)
 
+    def _sample_ops(self, resample=True):
+        # In timer_only mode, record operators of the steps requested by
+        # the sampling hook of benchmark, see Benchmark.enable_sampling.
+        hook = benchmark().hooks.get('sampling_hook')
+        if self._sampling_ops:
+            self._sampling_ops = False
+            result = self.profiler.stop()
+            if hook is not None:
+                hook.add_op_sample(result.get_data())
+        if resample and hook is not None and hook.need_op_sample():
+            self._sampling_ops = True
+            self.profiler.prepare()
+            self.profiler.start()
+
     def _trigger_action(self):
         if self.previous_state == ProfilerState.CLOSED:
             if self.current_state == ProfilerState.READY:  # CLOSED -> READY
@@ -847,15 +892,20 @@ class Profiler:
                 self.profiler_result = self.profiler.stop()
                 self.profiler.prepare()
                 self.profiler.start()
-            if self.on_trace_ready:
-                self.on_trace_ready(self)
+            self._handle_trace_ready()
+
+    def _handle_trace_ready(self):
+        if self.operator_summary is not None:
+            self.operator_summary.parse(self.profiler_result.get_data())
+        if self.on_trace_ready:
+            self.on_trace_ready(self)
 
     def export(self, path: str = "", format: str = "json") -> None:
         r"""
         Exports the tracing data to file.
 
         Args:
-            path(str): file path of the output.
+            path(str): file path of the output. If it ends with ``.gz``, the file is gzipped.
             format(str, optional): output format, can be chosen from ['json', 'pb'], 'json' for chrome tracing and 'pb' for protobuf, default value is 'json'.
 
 
@@ -878,7 +928,11 @@ class Profiler:
                 >>> prof.export(path="./profiler_data.json", format="json")
         """
         if self.profiler_result:
-            self.profiler_result.save(path, format)
+            if path.endswith('.gz'):
+                self.profiler_result.save(path[:-3], format)
+                _gzip_file(path[:-3], path)
+            else:
+                self.profiler_result.save(path, format)
 
     def summary(
         self,
@@ -757,6 +757,129 @@ class EventSummary:
                 self.kernel_items[name].add_item(device_node)
 
 
+class OperatorSummary:
+    r"""
+    Fold operator events into per-operator aggregates window by window.
+
+    Unlike :class:`EventSummary`, it does not wrap the whole tree with
+    :class:`HostStatisticNode`, and it keeps nothing of a parsed tree but the
+    aggregates, so ``parse`` can be called for every profiling window of a long
+    run while memory stays bounded by the number of distinct operators.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.thread_items = collections.defaultdict(dict)
+        self.num_windows = 0
+
+    def parse(self, nodetrees):
+        r"""
+        Fold the operator events of one profiling window into the aggregates.
+        """
+        for thread_id, rootnode in nodetrees.items():
+            # iterative post-order traversal, every frame is
+            # [node, children iterator, gpu_time, general_gpu_time]
+            stack = [[rootnode, iter(rootnode.children_node), 0, 0]]
+            while stack:
+                frame = stack[-1]
+                child = next(frame[1], None)
+                if child is not None:
+                    stack.append([child, iter(child.children_node), 0, 0])
+                    continue
+                stack.pop()
+                node, _, gpu_time, general_gpu_time = frame
+                for runtimenode in node.runtime_node:
+                    for devicenode in runtimenode.device_node:
+                        duration = devicenode.end_ns - devicenode.start_ns
+                        if devicenode.type == TracerEventType.Kernel:
+                            gpu_time += duration
+                        general_gpu_time += duration
+                for devicenode in node.device_node:
+                    duration = devicenode.end_ns - devicenode.start_ns
+                    if devicenode.type == TracerEventType.Kernel:
+                        gpu_time += duration
+                    general_gpu_time += duration
+                if stack:
+                    stack[-1][2] += gpu_time
+                    stack[-1][3] += general_gpu_time
+                    if node.type == TracerEventType.Operator:
+                        self._add_item(
+                            node.name,
+                            node.thread_id,
+                            node.end_ns - node.start_ns,
+                            gpu_time,
+                            general_gpu_time,
+                        )
+        self.num_windows += 1
+
+    def _add_item(self, name, thread_id, cpu_time, gpu_time, general_gpu_time):
+        for items in (self.items, self.thread_items[thread_id]):
+            if name not in items:
+                items[name] = EventSummary.ItemBase(name)
+            item = items[name]
+            item.add_call()
+            item.add_cpu_time(cpu_time)
+            item.add_gpu_time(gpu_time)
+            item.add_general_gpu_time(general_gpu_time)
+
+    def merge(self, other):
+        r"""
+        Merge the aggregates of another OperatorSummary, e.g. from another worker.
+        """
+        for src, dst in [(other.items, self.items)] + [
+            (items, self.thread_items[thread_id])
+            for thread_id, items in other.thread_items.items()
+        ]:
+            for name, item in src.items():
+                if name not in dst:
+                    dst[name] = EventSummary.ItemBase(name)
+                merged = dst[name]
+                merged.call += item.call
+                merged.cpu_time += item.cpu_time
+                merged.gpu_time += item.gpu_time
+                merged.general_gpu_time += item.general_gpu_time
+                merged.max_cpu_time = max(
+                    merged.max_cpu_time, item.max_cpu_time
+                )
+                merged.min_cpu_time = min(
+                    merged.min_cpu_time, item.min_cpu_time
+                )
+                merged.max_gpu_time = max(
+                    merged.max_gpu_time, item.max_gpu_time
+                )
+                merged.min_gpu_time = min(
+                    merged.min_gpu_time, item.min_gpu_time
+                )
+                merged.max_general_gpu_time = max(
+                    merged.max_general_gpu_time, item.max_general_gpu_time
+                )
+                merged.min_general_gpu_time = min(
+                    merged.min_general_gpu_time, item.min_general_gpu_time
+                )
+        self.num_windows += other.num_windows
+        return self
+
+    def sorted_items(self, sorted_by=SortedKeys.CPUTotal):
+        r"""
+        Return the aggregated items sorted the same way as the operator table of ``Profiler.summary``.
+        """
+        key, reverse = {
+            SortedKeys.CPUTotal: ('cpu_time', True),
+            SortedKeys.CPUAvg: ('avg_cpu_time', True),
+            SortedKeys.CPUMax: ('max_cpu_time', True),
+            SortedKeys.CPUMin: ('min_cpu_time', False),
+            SortedKeys.GPUTotal: ('general_gpu_time', True),
+            SortedKeys.GPUAvg: ('avg_general_gpu_time', True),
+            SortedKeys.GPUMax: ('max_general_gpu_time', True),
+            SortedKeys.GPUMin: ('min_general_gpu_time', False),
+        }[sorted_by]
+        return sorted(
+            self.items.values(),
+            key=lambda item: getattr(item, key),
+            reverse=reverse,
+        )
+
+
 class MemorySummary:
     r"""
     Analyse memory events in profiling data.
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import time
 import timeit
-from collections import OrderedDict
+from collections import OrderedDict, deque
 
 
 class Stack:
@@ -301,6 +303,154 @@ class TimerHook(Hook):
         )
 
 
+def _percentile(sorted_values, q):
+    """
+    Get the q-th percentile of sorted values with linear interpolation.
+    """
+    pos = (len(sorted_values) - 1) * q / 100.0
+    low = int(pos)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (
+        pos - low
+    )
+
+
+def _summarize(values):
+    if not values:
+        return {}
+    sorted_values = sorted(values)
+    return {
+        'avg': sum(sorted_values) / len(sorted_values),
+        'p50': _percentile(sorted_values, 50),
+        'p90': _percentile(sorted_values, 90),
+        'p99': _percentile(sorted_values, 99),
+        'max': sorted_values[-1],
+        'min': sorted_values[0],
+    }
+
+
+class SamplingHook(Hook):
+    """
+    A hook for always-on monitoring of long runs. It keeps the cost of the
+    latest `window` steps and reads to report rolling percentiles, and asks
+    the profiler to record operators on one step out of `interval`, keeping
+    the per-step cost of each operator over the latest `window` samples.
+    All the costs are measured in seconds and memory does not grow with the
+    number of steps.
+    """
+
+    def __init__(
+        self,
+        interval=100,
+        window=1024,
+        top_k=10,
+        dump_interval=None,
+        dump_path=None,
+    ):
+        self.interval = interval
+        self.window = window
+        self.top_k = top_k
+        self.dump_interval = dump_interval
+        self.dump_path = dump_path
+        self.step_costs = deque(maxlen=window)
+        self.reader_costs = deque(maxlen=window)
+        self.op_costs = {}
+        self.num_steps = 0
+        self.num_op_samples = 0
+        self._op_sampling = False
+        self.start_time = timeit.default_timer()
+        self.start_reader = timeit.default_timer()
+
+    def begin(self, benchmark):
+        self.start_time = timeit.default_timer()
+
+    def before_reader(self, benchmark):
+        self.start_reader = timeit.default_timer()
+
+    def after_reader(self, benchmark):
+        self.reader_costs.append(timeit.default_timer() - self.start_reader)
+
+    def after_step(self, benchmark):
+        """
+        Record the cost of the current step. Steps with operator recording
+        are left out, so that the profiler overhead does not skew the step
+        percentiles.
+        """
+
+        step_cost = timeit.default_timer() - self.start_time
+        if self._op_sampling:
+            self._op_sampling = False
+        else:
+            self.step_costs.append(step_cost)
+        self.num_steps += 1
+        if self.dump_interval and self.num_steps % self.dump_interval == 0:
+            self.dump()
+        self.start_time = timeit.default_timer()
+
+    def end(self, benchmark):
+        if self.dump_interval:
+            self.dump()
+
+    def need_op_sample(self):
+        """
+        Whether operators should be recorded for the next step.
+        """
+
+        if self.interval and self.num_steps % self.interval == 0:
+            self._op_sampling = True
+        return self._op_sampling
+
+    def add_op_sample(self, nodetrees):
+        """
+        Fold the operators recorded for one step into the rolling statistics.
+        """
+
+        from .profiler_statistic import OperatorSummary
+
+        summary = OperatorSummary()
+        summary.parse(nodetrees)
+        for name, item in summary.items.items():
+            if name not in self.op_costs:
+                self.op_costs[name] = deque(maxlen=self.window)
+            self.op_costs[name].append(item.cpu_time / 1e9)
+        self.num_op_samples += 1
+        # the time spent on collecting the sample is not part of any step
+        self.start_time = timeit.default_timer()
+
+    def stats(self):
+        """
+        Get the rolling statistics as a dict.
+        """
+
+        ops = sorted(
+            self.op_costs.items(),
+            key=lambda x: sum(x[1]) / len(x[1]),
+            reverse=True,
+        )[: self.top_k]
+        return {
+            'num_steps': self.num_steps,
+            'num_op_samples': self.num_op_samples,
+            'step_cost': _summarize(self.step_costs),
+            'reader_cost': _summarize(self.reader_costs),
+            'ops': {name: _summarize(costs) for name, costs in ops},
+        }
+
+    def dump(self):
+        """
+        Append the rolling statistics as a line of json to `dump_path`, or
+        print it if `dump_path` is not set.
+        """
+
+        record = {'time': time.time()}
+        record.update(self.stats())
+        line = json.dumps(record)
+        if self.dump_path:
+            with open(self.dump_path, 'a') as f:
+                f.write(line + '\n')
+        else:
+            print(f'Sampling Stats: {line}')
+
+
 class TimeAverager:
     """
     Record the cost of every step and count the average.
@@ -396,6 +546,42 @@ class Benchmark:
         self.current_event.reset()
         return message
 
+    def enable_sampling(
+        self,
+        interval=100,
+        window=1024,
+        top_k=10,
+        dump_interval=None,
+        dump_path=None,
+    ):
+        """
+        Keep rolling statistics of the step cost, reader cost and operator
+        cost with a `SamplingHook`, it works with `Profiler(timer_only=True)`
+        and is cheap enough to stay enabled for a whole training. Operators
+        are recorded for one step out of `interval` (0 to disable it), and the
+        statistics of the latest `window` steps (samples for operators) are
+        kept. The statistics can be queried by `sampling_stats`, and they are
+        dumped every `dump_interval` steps if it is set.
+        """
+
+        hook = SamplingHook(interval, window, top_k, dump_interval, dump_path)
+        self.hooks['sampling_hook'] = hook
+        return hook
+
+    def disable_sampling(self):
+        self.hooks.pop('sampling_hook', None)
+
+    def sampling_stats(self):
+        """
+        It returns the rolling statistics of `SamplingHook` as a dict, and an
+        empty dict if sampling is not enabled.
+        """
+
+        hook = self.hooks.get('sampling_hook')
+        if hook is None:
+            return {}
+        return hook.stats()
+
     def begin(self):
         for hook in self.hooks.values():
             hook.begin(self)
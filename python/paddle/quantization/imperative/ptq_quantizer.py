@@ -20,6 +20,7 @@ import numpy as np
 import paddle
 
 from ...static.quantization.cal_kl_threshold import cal_kl_threshold
+from ..observers.hist import abs_histogram
 from . import utils
 
 
@@ -53,16 +54,10 @@ def combine_abs_max_and_hist(
     if new_max == 0.0:
         return origin_max, origin_hist
     elif origin_max == 0.0:
-        new_hist, _ = np.histogram(
-            paddle.abs(tensor).numpy(False), range=(0, new_max), bins=bins
-        )
-        new_hist = new_hist.astype(np.float32)
+        new_hist = abs_histogram(tensor, new_max, bins).astype(np.float32)
         return new_max, new_hist
     elif new_max <= origin_max:
-        new_hist, _ = np.histogram(
-            paddle.abs(tensor).numpy(False), range=(0, origin_max), bins=bins
-        )
-        new_hist = new_hist.astype(np.float32)
+        new_hist = abs_histogram(tensor, origin_max, bins).astype(np.float32)
         new_hist += origin_hist
         return origin_max, new_hist
     else:
@@ -83,10 +78,7 @@ def combine_abs_max_and_hist(
         sampled_hist = (cumsumed_hist - shift_cumsumed_hist) / upsample_bins
         sampled_hist = sampled_hist.astype(np.float32)
 
-        new_hist, _ = np.histogram(
-            paddle.abs(tensor).numpy(False), range=(0, new_max), bins=bins
-        )
-        new_hist = new_hist.astype(np.float32)
+        new_hist = abs_histogram(tensor, new_max, bins).astype(np.float32)
         new_hist += sampled_hist
 
         return new_max, new_hist
@@ -188,12 +180,9 @@ class BaseHistQuantizer(BaseQuantizer, metaclass=abc.ABCMeta):
                 if abs_max_vals[idx] == 0.0:
                     self.hists.append(None)
                 else:
-                    hist, _ = np.histogram(
-                        paddle.abs(tensor).numpy(False),
-                        range=(0.0, abs_max_vals[idx]),
-                        bins=self.bins,
-                    )
-                    hist = hist.astype(np.float32)
+                    hist = abs_histogram(
+                        tensor, abs_max_vals[idx], self.bins
+                    ).astype(np.float32)
                     self.hists.append(hist)
         else:
             assert len(self.abs_max_vals) == len(tensors)
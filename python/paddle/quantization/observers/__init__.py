@@ -16,5 +16,6 @@
 
 from .abs_max import AbsmaxObserver
 from .groupwise import GroupWiseWeightObserver
+from .hist import HistObserver
 
-__all__ = ["AbsmaxObserver", "GroupWiseWeightObserver"]
+__all__ = ["AbsmaxObserver", "GroupWiseWeightObserver", "HistObserver"]
@@ -0,0 +1,228 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import numpy as np
+
+import paddle
+
+from ...static.quantization.cal_kl_threshold import cal_kl_threshold
+from ..base_observer import BaseObserver
+from ..factory import ObserverFactory
+
+_SUPPORT_METHODS = ["percent", "mse", "kl"]
+
+
+def abs_histogram(tensor, upper, bins):
+    r"""
+    Count the absolute values of ``tensor`` into ``bins`` bins of [0, upper]
+    on the device of ``tensor``, only the counts are copied to host.
+    """
+    # histogram only takes an integer range, so scale the values to [0, bins]
+    scaled = paddle.clip(
+        paddle.abs(tensor.astype('float32')) * (bins / upper), 0.0, bins
+    )
+    hist = paddle.histogram(scaled, bins=bins, min=0, max=bins)
+    return hist.numpy().astype(np.float64)
+
+
+def rebin_histogram(hist, old_max, new_max):
+    r"""
+    Redistribute ``hist`` of [0, old_max] into the same number of bins over
+    [0, new_max], with ``new_max >= old_max``. Values are assumed to be
+    uniformly distributed inside a bin, so the result is exact when
+    ``new_max / old_max`` is a power of 2.
+    """
+    bins = hist.shape[0]
+    old_edges = np.linspace(0.0, old_max, bins + 1)
+    new_edges = np.linspace(0.0, new_max, bins + 1)
+    cdf = np.concatenate([[0.0], np.cumsum(hist, dtype=np.float64)])
+    return np.diff(np.interp(new_edges, old_edges, cdf))
+
+
+def _percent_threshold(hist, bin_width, percent):
+    cumsumed_hist = np.cumsum(hist) / np.sum(hist)
+    index = int(np.argmax(cumsumed_hist >= percent))
+    return (index + 0.5) * bin_width
+
+
+def _mse_threshold(hist, bin_width, quant_bits, block_size=128):
+    # Take every bin edge as a candidate threshold, and estimate the
+    # quantization error with the bin centers weighted by their counts.
+    bins = hist.shape[0]
+    max_int = 2 ** (quant_bits - 1) - 1
+    centers = (np.arange(bins) + 0.5) * bin_width
+    candidates = np.arange(1, bins + 1) * bin_width
+    losses = np.empty(bins)
+    for start in range(0, bins, block_size):
+        steps = candidates[start : start + block_size, None] / max_int
+        quant_dequant = np.minimum(np.round(centers / steps), max_int) * steps
+        losses[start : start + block_size] = (
+            (centers - quant_dequant) ** 2
+        ) @ hist
+    return float(candidates[np.argmin(losses)])
+
+
+class HistObserver(ObserverFactory):
+    r"""
+    It collects a fixed-size histogram of the absolute values of target tensor
+    over all calibration batches, and computes the threshold from the histogram.
+    The range of the histogram grows by powers of 2 when larger values come, so
+    the memory is constant no matter how many batches are observed.
+
+    Args:
+        quant_bits(int, optional): Number of bits to represent an quantized integer in binary. Default is 8.
+        bins(int, optional): Number of bins of the histogram. Default is 2048.
+        method(str, optional): How to compute the threshold from the histogram, can be
+            'percent', 'mse' or 'kl'. Default is 'mse'.
+        percent(float, optional): The percentile of values kept by the threshold for
+            the 'percent' method. Default is 0.99999.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from paddle.quantization import QuantConfig
+            >>> from paddle.quantization.observers import AbsmaxObserver, HistObserver
+            >>> q_config = QuantConfig(activation=HistObserver(method='kl'), weight=AbsmaxObserver())
+    """
+
+    def __init__(self, quant_bits=8, bins=2048, method="mse", percent=0.99999):
+        super().__init__(
+            quant_bits=quant_bits, bins=bins, method=method, percent=percent
+        )
+
+    def _get_class(self):
+        return HistObserverLayer
+
+
+class HistObserverLayer(BaseObserver):
+    """
+    Per-tensor histogram observer.
+    """
+
+    INIT_ABS_MAX = 1e-7
+
+    def __init__(
+        self, layer, quant_bits=8, bins=2048, method="mse", percent=0.99999
+    ):
+        super().__init__()
+        if method not in _SUPPORT_METHODS:
+            raise ValueError(
+                f"The method of HistObserver should be one of {_SUPPORT_METHODS}, but got {method}."
+            )
+        self._quant_bits = quant_bits
+        self._bins = bins
+        self._method = method
+        self._percent = percent
+        self._hist = np.zeros(bins, dtype=np.float64)
+        self._hist_max = 0.0
+        self._scale = None
+        self._zero_point = None
+
+    def forward(self, input):
+        self._update(input)
+        return input
+
+    def _grow(self, abs_max):
+        if self._hist_max == 0.0:
+            # only zeros so far, they stay in the first bin
+            self._hist_max = abs_max
+        elif abs_max > self._hist_max:
+            factor = 2 ** math.ceil(math.log2(abs_max / self._hist_max))
+            self._hist = rebin_histogram(
+                self._hist, self._hist_max, self._hist_max * factor
+            )
+            self._hist_max *= factor
+
+    def _update(self, input):
+        abs_max = float(paddle.max(paddle.abs(input)))
+        if abs_max == 0.0:
+            self._hist[0] += input.size
+            return
+        self._grow(abs_max)
+        self._hist += abs_histogram(input, self._hist_max, self._bins)
+        self._scale = None
+
+    def merge(self, other):
+        r"""
+        Merge the histogram collected by another HistObserverLayer, e.g. by
+        a copy of the model that sees another part of the calibration data.
+        """
+        hist = other._hist
+        if other._hist_max > self._hist_max:
+            self._grow(other._hist_max)
+        if 0.0 < other._hist_max < self._hist_max:
+            hist = rebin_histogram(hist, other._hist_max, self._hist_max)
+        self._hist = self._hist + hist
+        self._scale = None
+
+    def sync(self, group=None):
+        r"""
+        Merge the histograms collected on all ranks of ``group``, so that every
+        rank computes the same threshold.
+        """
+        if paddle.distributed.get_world_size(group) <= 1:
+            return
+        hist_max = paddle.to_tensor([self._hist_max], dtype='float64')
+        paddle.distributed.all_reduce(
+            hist_max, op=paddle.distributed.ReduceOp.MAX, group=group
+        )
+        hist_max = float(hist_max)
+        if 0.0 < self._hist_max < hist_max:
+            self._hist = rebin_histogram(self._hist, self._hist_max, hist_max)
+        self._hist_max = hist_max
+        hist = paddle.to_tensor(self._hist)
+        paddle.distributed.all_reduce(hist, group=group)
+        self._hist = hist.numpy()
+        self._scale = None
+
+    def bit_length(self):
+        return self._quant_bits
+
+    def quant_axis(self):
+        return -1
+
+    def cal_thresholds(self):
+        """Compute thresholds from the histogram."""
+        if self._hist_max == 0.0:
+            threshold = HistObserverLayer.INIT_ABS_MAX
+        else:
+            bin_width = self._hist_max / self._bins
+            if self._method == "percent":
+                threshold = _percent_threshold(
+                    self._hist, bin_width, self._percent
+                )
+            elif self._method == "kl":
+                threshold = cal_kl_threshold(
+                    self._hist, bin_width, self._quant_bits
+                )
+            else:
+                threshold = _mse_threshold(
+                    self._hist, bin_width, self._quant_bits
+                )
+        self._scale = paddle.to_tensor(threshold, dtype='float32')
+        self._zero_point = paddle.zeros_like(self._scale)
+
+    def scales(self):
+        """Return output scales."""
+        if self._scale is None:
+            self.cal_thresholds()
+        return self._scale
+
+    def zero_points(self):
+        """Return output zero points."""
+        if self._zero_point is None:
+            self.cal_thresholds()
+        return self._zero_point
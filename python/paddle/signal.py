@@ -411,10 +411,20 @@ def stft(
             data_format="NLC",
         ).squeeze(-1)
 
-    x_frames = frame(x=x, frame_length=n_fft, hop_length=hop_length, axis=-1)
-    x_frames = x_frames.transpose(
-        perm=[0, 2, 1]
-    )  # switch n_fft to last dim, egs: (batch, num_frames, n_fft)
+    if in_dynamic_mode():
+        # A strided view of x in the layout of (batch, num_frames, n_fft), which
+        # saves the copy of the whole frame matrix made by frame.
+        x_frames = x.unfold(axis=-1, size=n_fft, step=hop_length)
+        fft_axis = -1
+    else:
+        # Transform along axis 1 in the layout of (batch, n_fft, num_frames),
+        # which is the layout of the output, since transposing the frames and
+        # the output copies them in static graph.
+        x_frames = frame(
+            x=x, frame_length=n_fft, hop_length=hop_length, axis=-1
+        )
+        window = window.unsqueeze(-1)
+        fft_axis = 1
     x_frames = paddle.multiply(x_frames, window)
 
     norm = 'ortho' if normalized else 'backward'
@@ -427,7 +437,7 @@ def stft(
         out = fft_r2c(
             x=x_frames,
             n=None,
-            axis=-1,
+            axis=fft_axis,
             norm=norm,
             forward=True,
             onesided=onesided,
@@ -435,10 +445,16 @@ def stft(
         )
     else:
         out = fft_c2c(
-            x=x_frames, n=None, axis=-1, norm=norm, forward=True, name=name
+            x=x_frames,
+            n=None,
+            axis=fft_axis,
+            norm=norm,
+            forward=True,
+            name=name,
         )
 
-    out = out.transpose(perm=[0, 2, 1])  # (batch, n_fft, num_frames)
+    if fft_axis == -1:
+        out = out.transpose(perm=[0, 2, 1])  # (batch, n_fft, num_frames)
 
     if x_rank == 1:
         out.squeeze_(0)
@@ -594,9 +610,8 @@ def istft(
             window, pad=[pad_left, pad_right], mode='constant'
         )
 
-    x = x.transpose(
-        perm=[0, 2, 1]
-    )  # switch n_fft to last dim, egs: (batch, num_frames, n_fft)
+    # Transform along axis 1 in the layout of (batch, n_fft, num_frames),
+    # which overlap_add takes, to avoid transposing the frames back and forth.
     norm = 'ortho' if normalized else 'backward'
 
     if return_complex:
@@ -604,29 +619,26 @@ def istft(
             not onesided
         ), 'onesided should be False when input(output of istft) or window is a complex Tensor.'
 
-        out = fft_c2c(x=x, n=None, axis=-1, norm=norm, forward=False, name=None)
+        out = fft_c2c(x=x, n=None, axis=1, norm=norm, forward=False, name=None)
     else:
         assert not is_complex(
             window
         ), 'Data type of window should not be complex when return_complex is False.'
 
         if onesided is False:
-            x = x[:, :, : n_fft // 2 + 1]
-        out = fft_c2r(x=x, n=None, axis=-1, norm=norm, forward=False, name=None)
+            x = x[:, : n_fft // 2 + 1, :]
+        out = fft_c2r(x=x, n=None, axis=1, norm=norm, forward=False, name=None)
 
-    out = paddle.multiply(out, window).transpose(
-        perm=[0, 2, 1]
-    )  # (batch, n_fft, num_frames)
+    # (batch, n_fft, num_frames)
+    out = paddle.multiply(out, window.unsqueeze(-1))
     out = overlap_add(
         x=out, hop_length=hop_length, axis=-1
     )  # (batch, seq_length)
 
     window_envelop = overlap_add(
         x=paddle.tile(
-            x=paddle.multiply(window, window).unsqueeze(0),
-            repeat_times=[n_frames, 1],
-        ).transpose(
-            perm=[1, 0]
+            x=paddle.multiply(window, window).unsqueeze(-1),
+            repeat_times=[1, n_frames],
         ),  # (n_fft, num_frames)
         hop_length=hop_length,
         axis=-1,
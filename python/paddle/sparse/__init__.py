@@ -24,6 +24,7 @@ from .binary import (
     mv,
     subtract,
 )
+from .conversion import as_sparse_coo, as_sparse_csr
 from .creation import sparse_coo_tensor, sparse_csr_tensor
 from .multiary import addmm
 from .unary import (
@@ -57,6 +58,8 @@ from .unary import (
 __all__ = [
     'sparse_coo_tensor',
     'sparse_csr_tensor',
+    'as_sparse_coo',
+    'as_sparse_csr',
     'sin',
     'tan',
     'asin',
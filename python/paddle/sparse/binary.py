@@ -26,6 +26,8 @@ from paddle.base.framework import (
 )
 from paddle.base.layer_helper import LayerHelper
 
+from .conversion import _prefer_csr, _select_matmul_format, as_sparse_csr
+
 if TYPE_CHECKING:
     from paddle import Tensor
 
@@ -73,6 +75,11 @@ def matmul(x: Tensor, y: Tensor, name: str | None = None) -> Tensor:
 
     It supports backward propagation.
 
+    In dynamic mode, a SparseCooTensor whose ``stop_gradient`` is True is
+    computed in the CSR format when it is cheaper, and the converted tensor is
+    cached on it (see :ref:`api_paddle_sparse_as_sparse_csr`), so a constant
+    sparse matrix is only converted once across calls.
+
     Dimensions `x` and `y` must be >= 2D. Automatic broadcasting of Tensor is not supported.
     the shape of `x` should be `[*, M, K]` , and the shape of `y` should be `[*, K, N]` , where `*`
     is zero or more batch dimensions.
@@ -133,7 +140,11 @@ def matmul(x: Tensor, y: Tensor, name: str | None = None) -> Tensor:
     assert (
         in_dynamic_or_pir_mode()
     ), "Currently, Sparse API only support dynamic mode or pir mode."
-    return _C_ops.sparse_matmul(x, y)
+    x, y, to_coo = _select_matmul_format(x, y)
+    out = _C_ops.sparse_matmul(x, y)
+    if to_coo:
+        return out.to_sparse_coo(len(out.shape))
+    return out
 
 
 def masked_matmul(
@@ -219,6 +230,9 @@ def mv(x: Tensor, vec: Tensor, name: str | None = None) -> Tensor:
 
     It supports backward propagation.
 
+    In dynamic mode, a SparseCooTensor ``x`` whose ``stop_gradient`` is True is
+    computed in the cached CSR format when it is cheaper, like :ref:`api_paddle_sparse_matmul` .
+
     The shape of `x` should be `[M, N]` , and the shape of `vec` should be `[N]` ,
     and the shape of `out` will be `[M]` .
 
@@ -261,6 +275,8 @@ def mv(x: Tensor, vec: Tensor, name: str | None = None) -> Tensor:
     assert (
         in_dynamic_or_pir_mode()
     ), "Currently, Sparse API only support dynamic mode or pir mode."
+    if _prefer_csr(x):
+        x = as_sparse_csr(x)
     return _C_ops.sparse_mv(x, vec)
 
 
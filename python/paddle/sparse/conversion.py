@@ -0,0 +1,175 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import math
+import weakref
+from typing import TYPE_CHECKING
+
+from paddle.base.framework import dygraph_only, in_dygraph_mode
+
+if TYPE_CHECKING:
+    from paddle import Tensor
+
+__all__ = []
+
+# Maps the id of a tensor to the signature of its storage when it was
+# converted and the converted tensor. The cache is keyed by id because the
+# comparison of tensors is elementwise, and the entry is dropped by a finalizer
+# of the tensor. The conversion is redone once the storage of the tensor is
+# replaced or modified inplace.
+_converted_tensors = {}
+
+
+def _storage_signature(x):
+    # the values of a sparse tensor share the storage and the inplace version
+    # counter with the tensor
+    values = x.values() if x.is_sparse() else x
+    return values.data_ptr(), values._inplace_version()
+
+
+def _convert_cached(x, to_csr):
+    signature = _storage_signature(x)
+    key = id(x)
+    entry = _converted_tensors.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    out = x.to_sparse_csr() if to_csr else x.to_sparse_coo(len(x.shape))
+    # the conversion of a tensor requiring gradient is part of its graph,
+    # which can not be reused across iterations
+    if x.stop_gradient:
+        if entry is None:
+            weakref.finalize(x, _converted_tensors.pop, key, None)
+        _converted_tensors[key] = (signature, out)
+    return out
+
+
+@dygraph_only
+def as_sparse_csr(x: Tensor) -> Tensor:
+    r"""
+    Convert the input to a SparseCsrTensor, and cache the result on the input,
+    so converting it again returns the cached SparseCsrTensor instead of
+    converting it on every call.
+
+    The cache is invalidated when the values of the input are modified inplace
+    or replaced, and it is released together with the input. Only the inputs
+    whose ``stop_gradient`` is True are cached, e.g. the constant adjacency
+    matrix of a graph.
+
+    Args:
+        x (Tensor): The input tensor. It can be DenseTensor or SparseCooTensor
+            with 2 or 3 dimensions. A SparseCooTensor should be coalesced.
+
+    Returns:
+        Tensor: A SparseCsrTensor, which is ``x`` itself if ``x`` is already a
+            SparseCsrTensor.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> indices = [[0, 1, 2], [1, 2, 0]]
+            >>> values = [1., 2., 3.]
+            >>> coo = paddle.sparse.sparse_coo_tensor(indices, values, [3, 3])
+            >>> csr = paddle.sparse.as_sparse_csr(coo)
+            >>> print(csr.crows())
+            Tensor(shape=[4], dtype=int64, place=Place(cpu), stop_gradient=True,
+            [0, 1, 2, 3])
+            >>> print(paddle.sparse.as_sparse_csr(coo) is csr)
+            True
+    """
+    if x.is_sparse_csr():
+        return x
+    return _convert_cached(x, to_csr=True)
+
+
+@dygraph_only
+def as_sparse_coo(x: Tensor) -> Tensor:
+    r"""
+    Convert the input to a SparseCooTensor whose dimensions are all sparse,
+    and cache the result on the input, so converting it again returns the
+    cached SparseCooTensor instead of converting it on every call.
+
+    The cache is invalidated when the values of the input are modified inplace
+    or replaced, and it is released together with the input. Only the inputs
+    whose ``stop_gradient`` is True are cached.
+
+    Args:
+        x (Tensor): The input tensor. It can be DenseTensor or SparseCsrTensor.
+
+    Returns:
+        Tensor: A SparseCooTensor, which is ``x`` itself if ``x`` is already a
+            SparseCooTensor.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> crows = [0, 1, 2, 3]
+            >>> cols = [1, 2, 0]
+            >>> values = [1., 2., 3.]
+            >>> csr = paddle.sparse.sparse_csr_tensor(crows, cols, values, [3, 3])
+            >>> coo = paddle.sparse.as_sparse_coo(csr)
+            >>> print(coo.indices())
+            Tensor(shape=[2, 3], dtype=int64, place=Place(cpu), stop_gradient=True,
+            [[0, 1, 2],
+             [1, 2, 0]])
+            >>> print(paddle.sparse.as_sparse_coo(csr) is coo)
+            True
+    """
+    if x.is_sparse_coo():
+        return x
+    return _convert_cached(x, to_csr=False)
+
+
+def _is_csr_convertible(x):
+    # CSR only holds 2D or 3D tensors without dense dimensions
+    return (
+        in_dygraph_mode()
+        and x.is_sparse_coo()
+        and x.stop_gradient
+        and len(x.shape) in (2, 3)
+        and x.indices().shape[0] == len(x.shape)
+    )
+
+
+def _prefer_csr(x):
+    """
+    Whether to compute the product of the SparseCooTensor ``x`` and a dense
+    tensor with the cached CSR format of ``x``. CSR keeps one offset per row
+    instead of one row index per element, which is cheaper as long as there
+    is at least one element in a row on average.
+    """
+    return _is_csr_convertible(x) and x.nnz() >= math.prod(x.shape[:-1])
+
+
+def _select_matmul_format(x, y):
+    """
+    Select the formats of the operands of a sparse matmul, returns the
+    operands and whether the output should be converted back to COO.
+    """
+    if not in_dygraph_mode():
+        return x, y, False
+    if y.is_sparse():
+        # the kernel of COO @ COO converts both operands to CSR on each call
+        if _is_csr_convertible(x) and _is_csr_convertible(y):
+            return as_sparse_csr(x), as_sparse_csr(y), True
+    elif _prefer_csr(x):
+        return as_sparse_csr(x), y, False
+    return x, y, False
@@ -19,6 +19,8 @@ from typing import TYPE_CHECKING
 from paddle import _C_ops
 from paddle.base.framework import in_dynamic_or_pir_mode
 
+from .conversion import _prefer_csr, as_sparse_csr
+
 if TYPE_CHECKING:
     from paddle import Tensor
 
@@ -54,6 +56,9 @@ def addmm(
 
     It supports backward propagation.
 
+    In dynamic mode, when `y` is a DenseTensor, a SparseCooTensor `x` whose ``stop_gradient``
+    is True is computed in the cached CSR format when it is cheaper, like :ref:`api_paddle_sparse_matmul` .
+
     Dimensions `input` , `x` , `y` must be same and >= 2D. Automatic broadcasting of Tensor is not supported.
 
     Args:
@@ -96,4 +101,6 @@ def addmm(
     assert (
         in_dynamic_or_pir_mode()
     ), "Currently, Sparse API only support dynamic mode or pir mode."
+    if _prefer_csr(x) and not y.is_sparse():
+        x = as_sparse_csr(x)
     return _C_ops.sparse_addmm(input, x, y, beta, alpha)
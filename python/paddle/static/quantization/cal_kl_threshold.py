@@ -78,6 +78,20 @@ def safe_entropy(reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
     return (tmp_sum1 - tmp_sum2) / P_sum
 
 
+def _merge_bin_ids(num_bins, num_quantized_bins):
+    '''
+    Get the index of the quantized bin that every bin is merged into. The
+    bins are merged evenly and the last quantized bin takes the remainder,
+    which is the same as `expand_quantized_bins`.
+    '''
+    num_merged_bins = int(num_bins / num_quantized_bins)
+    if num_merged_bins == 0:
+        return np.full(num_bins, num_quantized_bins - 1)
+    return np.minimum(
+        np.arange(num_bins) // num_merged_bins, num_quantized_bins - 1
+    )
+
+
 def cal_kl_threshold(hist, bin_width, bits):
     '''
     Using the KL-divergence method to get the more precise threshold.
@@ -92,38 +106,49 @@ def cal_kl_threshold(hist, bin_width, bits):
     starting_iter = int((hist_bins - 1) * 0.5)
     quant_range = 2 ** (bits - 1) - 1
 
-    P_sum = np.sum(np.array(hist).ravel())
+    hist = np.asarray(hist, dtype=np.float64)
+    P_sum = np.sum(hist)
+    # outliers_count of every candidate threshold i is sum(hist[i:])
+    outliers_counts = np.cumsum(hist[::-1])[::-1]
     min_kl_divergence = 0
     min_kl_index = 0
     kl_inited = False
 
     for i in range(starting_iter, hist_bins):
-        reference_distr_P = hist[0:i].tolist()
-        outliers_count = sum(hist[i:])
-        if reference_distr_P[i - 1] == 0:
+        if hist[i - 1] == 0:
             continue
-        reference_distr_P[i - 1] += outliers_count
-        reference_distr_bins = reference_distr_P[:]
-        candidate_distr_Q = hist[0:i].tolist()
-        num_merged_bins = int(i / quant_range)
-        candidate_distr_Q_quantized = [0] * quant_range
-        j_start = 0
-        j_end = num_merged_bins
-        for idx in range(quant_range):
-            candidate_distr_Q_quantized[idx] = sum(
-                candidate_distr_Q[j_start:j_end]
-            )
-            j_start += num_merged_bins
-            j_end += num_merged_bins
-            if (idx + 1) == quant_range - 1:
-                j_end = i
-        candidate_distr_Q = expand_quantized_bins(
-            candidate_distr_Q_quantized, reference_distr_bins
+        reference_distr_P = hist[0:i].copy()
+        reference_distr_P[i - 1] += outliers_counts[i]
+        # quantize the candidate distribution into quant_range bins, then
+        # expand it back evenly over the non-empty bins of the reference
+        merge_ids = _merge_bin_ids(i, quant_range)
+        nonzero = reference_distr_P != 0
+        quantized_sum = np.bincount(
+            merge_ids, weights=hist[0:i], minlength=quant_range
+        )
+        nonzero_count = np.bincount(
+            merge_ids, weights=nonzero, minlength=quant_range
         )
-        Q_sum = sum(candidate_distr_Q)
-        kl_divergence = safe_entropy(
-            reference_distr_P, P_sum, candidate_distr_Q, Q_sum
+        avg_bin_ele = np.divide(
+            quantized_sum,
+            nonzero_count,
+            out=np.zeros_like(quantized_sum),
+            where=nonzero_count != 0,
         )
+        candidate_distr_Q = np.where(nonzero, avg_bin_ele[merge_ids], 0.0)
+        Q_sum = np.sum(candidate_distr_Q)
+
+        p = reference_distr_P[nonzero]
+        q = candidate_distr_Q[nonzero]
+        if np.any(q == 0):
+            _logger.error(
+                "Fatal error!, idx = "
+                + str(np.flatnonzero(nonzero)[q == 0][0])
+                + " qindex = 0!"
+            )
+        kl_divergence = (
+            np.sum(p * np.log(Q_sum * p)) - np.sum(p * np.log(P_sum * q))
+        ) / P_sum
         if not kl_inited:
             min_kl_divergence = kl_divergence
             min_kl_index = i
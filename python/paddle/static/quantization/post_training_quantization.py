@@ -15,6 +15,7 @@
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -54,6 +55,81 @@ _logger = get_logger(
 )
 
 
+def _get_search_ratios():
+    # the candidate thresholds of mse and emd are s * abs_max for
+    # s = 0.3, 0.32, ..., 1.0, accumulated the same way as a python loop
+    ratios = []
+    s = 0.3
+    while s <= 1.0:
+        ratios.append(s)
+        s += 0.02
+    return np.array(ratios)
+
+
+_SEARCH_RATIOS = _get_search_ratios()
+# The number of elements evaluated against all candidate thresholds at a
+# time, which keeps the [num_thresholds, block] intermediates in cache.
+_SEARCH_BLOCK_SIZE = 2**14
+
+
+def _search_act_threshold(var_tensor, bits, onnx_format, loss_type):
+    '''
+    Evaluate the quantization loss of all candidate thresholds of the flattened
+    activation `var_tensor` in one pass over the data, and return the minimal
+    loss together with its threshold. The last threshold is taken on ties.
+    '''
+    abs_max_value = float(np.max(np.abs(var_tensor)))
+    abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
+    scales = _SEARCH_RATIOS * abs_max_value
+    scale = scales[:, None].astype(var_tensor.dtype)
+    bins = 2 ** (bits - 1) - 1
+
+    # mse needs the sum of squared errors, and emd needs the first two
+    # moments of the quant-dequant values, all accumulated in float64
+    error_sum = np.zeros(len(scales))
+    quant_sum = np.zeros(len(scales))
+    quant_square_sum = np.zeros(len(scales))
+    for start in range(0, var_tensor.size, _SEARCH_BLOCK_SIZE):
+        block = var_tensor[start : start + _SEARCH_BLOCK_SIZE]
+        # the same formula as quant-dequant with a single threshold, computed
+        # in place for all thresholds to avoid temporaries
+        if onnx_format:
+            quant_dequant_var = np.divide(block, scale)
+            quant_dequant_var *= bins
+            np.round(quant_dequant_var, out=quant_dequant_var)
+            np.clip(quant_dequant_var, -bins - 1, bins, out=quant_dequant_var)
+        else:
+            quant_dequant_var = np.clip(block, 0.0, scale)
+            quant_dequant_var /= scale
+            quant_dequant_var *= bins
+            np.round(quant_dequant_var, out=quant_dequant_var)
+        quant_dequant_var /= bins
+        quant_dequant_var *= scale
+        if loss_type == "mse":
+            quant_dequant_var -= block
+            np.square(quant_dequant_var, out=quant_dequant_var)
+            error_sum += np.sum(quant_dequant_var, axis=1, dtype=np.float64)
+        else:
+            quant_sum += np.sum(quant_dequant_var, axis=1, dtype=np.float64)
+            np.square(quant_dequant_var, out=quant_dequant_var)
+            quant_square_sum += np.sum(
+                quant_dequant_var, axis=1, dtype=np.float64
+            )
+
+    numel = var_tensor.size
+    if loss_type == "mse":
+        losses = error_sum / numel
+    else:
+        quant_mean = quant_sum / numel
+        quant_std = np.sqrt(
+            np.maximum(quant_square_sum / numel - quant_mean**2, 0.0)
+        )
+        losses = np.abs(np.mean(var_tensor, dtype=np.float64) - quant_mean)
+        losses += np.abs(np.std(var_tensor, dtype=np.float64) - quant_std)
+    best = len(losses) - 1 - int(np.argmin(losses[::-1]))
+    return losses[best], float(scales[best])
+
+
 def _all_persistable_var_names(program):
     persistable_var_names = []
     for var in program.list_vars():
@@ -150,6 +226,7 @@ class PostTrainingQuantization:
         scale_dict=None,
         return_graph=False,
         deploy_backend=None,
+        num_threads=None,
     ):
         """
         Constructor.
@@ -243,6 +320,10 @@ class PostTrainingQuantization:
             deploy_backend(str, optional): Deploy backend, it can be None, `TensorRT`,
                 `MKLDNN`, `ARM`. And it will extend the new backend. Default is None,
                 which means to use the default general quantization configuration.
+            num_threads(int, optional): The number of threads used to calculate
+                the statistics and thresholds of different activations in
+                parallel when sampling. Default is None, which means to use
+                the number of CPU cores.
         Returns:
             None
 
@@ -344,6 +425,7 @@ class PostTrainingQuantization:
         self._clip_extra = True if self._onnx_format else False
         self._skip_tensor_list = skip_tensor_list
         self._optimize_model = optimize_model
+        self._num_threads = max(1, num_threads or os.cpu_count() or 1)
 
         # Define variables
         self._place = self._executor.place
@@ -731,6 +813,61 @@ class PostTrainingQuantization:
                 var.persistable = False
                 self._scope.find_var(var.name).get_tensor()._clear()
 
+    def _get_weight_reduce_axis(self, var_name, var_tensor):
+        '''
+        Get the axes to reduce for the channel-wise statistics of the weight.
+        '''
+        quant_axis = (
+            1
+            if self._weight_op_pairs[var_name]
+            in utils._channelwise_quant_axis1_ops
+            else 0
+        )
+        return tuple(i for i in range(var_tensor.ndim) if i != quant_axis)
+
+    def _get_weight_abs_max(self, var_name):
+        '''
+        Get the abs_max of the weight, which is a list of the abs_max of every
+        channel when weight_quantize_type is channel_wise_abs_max.
+        '''
+        var_tensor = utils.load_variable_data(self._scope, var_name)
+        if self._weight_quantize_type == "abs_max":
+            return float(np.max(np.abs(var_tensor)))
+        elif self._weight_quantize_type == "channel_wise_abs_max":
+            reduce_axis = self._get_weight_reduce_axis(var_name, var_tensor)
+            return (
+                np.max(np.abs(var_tensor), axis=reduce_axis)
+                .astype(np.float64)
+                .tolist()
+            )
+
+    def _map_activations(self, func, skip_var_names=()):
+        '''
+        Apply `func(var_name, var_tensor)` to the data of the quantized
+        activations in parallel and return the results in a dict. The data
+        is loaded from the scope in the calling thread, and at most
+        `num_threads` activations are held in memory at the same time.
+        Zero-size activations are recorded and skipped.
+        '''
+        var_names = [
+            var_name
+            for var_name in sorted(self._quantized_act_var_name)
+            if var_name not in skip_var_names
+        ]
+        results = {}
+        with ThreadPoolExecutor(self._num_threads) as pool:
+            for start in range(0, len(var_names), self._num_threads):
+                futures = {}
+                for var_name in var_names[start : start + self._num_threads]:
+                    var_tensor = utils.load_variable_data(self._scope, var_name)
+                    if var_tensor.size == 0:
+                        self._zero_size_var_names.add(var_name)
+                        continue
+                    futures[var_name] = pool.submit(func, var_name, var_tensor)
+                for var_name, future in futures.items():
+                    results[var_name] = future.result()
+        return results
+
     def _sampling(self):
         '''
         Sample the min/max, abs_max or histogram in every iterations.
@@ -751,137 +888,39 @@ class PostTrainingQuantization:
             self._sample_histogram()
 
     def _sample_mse(self):
-        if self._quantized_threshold == {}:
-            for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
-        _logger.info("MSE searching stage ...")
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = var_tensor.flatten()
-            abs_max_value = float(np.max(np.abs(var_tensor)))
-            abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
-            s = 0.3
-            if var_name not in self._best_calibration_loss:
-                self._best_calibration_loss[var_name] = float('inf')
-            while s <= 1.0:
-                scale = s * abs_max_value
-                s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
-                if self._onnx_format:
-                    quant_var = np.clip(
-                        np.round(var_tensor / scale * bins), -bins - 1, bins
-                    )
-                    quant_dequant_var = quant_var / bins * scale
-                else:
-                    quant_dequant_var = (
-                        np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
-                        / bins
-                        * scale
-                    )
-                mse_loss = ((var_tensor - quant_dequant_var) ** 2).mean()
-                if mse_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = mse_loss
-                    self._quantized_threshold[var_name] = scale
+        self._sample_search_threshold("mse")
 
     def _sample_emd(self):
+        self._sample_search_threshold("emd")
+
+    def _sample_search_threshold(self, loss_type):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
-        _logger.info("EMD searching stage ...")
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = var_tensor.flatten()
-            abs_max_value = float(np.max(np.abs(var_tensor)))
-            abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
-            s = 0.3
+                self._quantized_threshold[var_name] = self._get_weight_abs_max(
+                    var_name
+                )
+        _logger.info(f"{loss_type.upper()} searching stage ...")
+        results = self._map_activations(
+            lambda var_name, var_tensor: _search_act_threshold(
+                var_tensor.flatten(),
+                self._activation_bits,
+                self._onnx_format,
+                loss_type,
+            )
+        )
+        for var_name, (loss, threshold) in results.items():
             if var_name not in self._best_calibration_loss:
                 self._best_calibration_loss[var_name] = float('inf')
-            while s <= 1.0:
-                scale = s * abs_max_value
-                s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
-                if self._onnx_format:
-                    quant_var = np.clip(
-                        np.round(var_tensor / scale * bins), -bins - 1, bins
-                    )
-                    quant_dequant_var = quant_var / bins * scale
-                else:
-                    quant_dequant_var = (
-                        np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
-                        / bins
-                        * scale
-                    )
-                emd_loss = np.abs(
-                    np.mean(var_tensor) - np.mean(quant_dequant_var)
-                ) + np.abs(np.std(var_tensor) - np.std(quant_dequant_var))
-                if emd_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = emd_loss
-                    self._quantized_threshold[var_name] = scale
+            if loss <= self._best_calibration_loss[var_name]:
+                self._best_calibration_loss[var_name] = loss
+                self._quantized_threshold[var_name] = threshold
 
     def _sample_avg(self):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._get_weight_abs_max(
+                    var_name
+                )
 
         for var_name in self._quantized_act_var_name:
             var_tensor = utils.load_variable_data(self._scope, var_name)
@@ -904,25 +943,9 @@ class PostTrainingQuantization:
     def _sample_abs_max(self):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._get_weight_abs_max(
+                    var_name
+                )
 
         for var_name in self._quantized_act_var_name:
             var_tensor = utils.load_variable_data(self._scope, var_name)
@@ -943,19 +966,19 @@ class PostTrainingQuantization:
                     min_value = float(np.min(var_tensor))
                     max_value = float(np.max(var_tensor))
                 elif self._weight_quantize_type == "channel_wise_abs_max":
-                    min_value = []
-                    max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            min_value.append(float(np.min(var_tensor[:, i])))
-                            max_value.append(float(np.max(var_tensor[:, i])))
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            min_value.append(float(np.min(var_tensor[i])))
-                            max_value.append(float(np.max(var_tensor[i])))
+                    reduce_axis = self._get_weight_reduce_axis(
+                        var_name, var_tensor
+                    )
+                    min_value = (
+                        np.min(var_tensor, axis=reduce_axis)
+                        .astype(np.float64)
+                        .tolist()
+                    )
+                    max_value = (
+                        np.max(var_tensor, axis=reduce_axis)
+                        .astype(np.float64)
+                        .tolist()
+                    )
                 self._quantized_var_min[var_name] = min_value
                 self._quantized_var_max[var_name] = max_value
 
@@ -976,16 +999,20 @@ class PostTrainingQuantization:
                 self._quantized_var_max[var_name] = max_value
 
     def _sample_histogram(self):
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if (var_tensor.size == 0) or (
-                var_name not in self._sampling_act_histogram
-            ):
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor_abs = np.abs(var_tensor)
-            bins = self._sampling_act_histogram[var_name][1]
-            hist, _ = np.histogram(var_tensor_abs, bins=bins)
+        no_hist_var_names = {
+            var_name
+            for var_name in self._quantized_act_var_name
+            if var_name not in self._sampling_act_histogram
+        }
+        self._zero_size_var_names.update(no_hist_var_names)
+        results = self._map_activations(
+            lambda var_name, var_tensor: np.histogram(
+                np.abs(var_tensor),
+                bins=self._sampling_act_histogram[var_name][1],
+            )[0],
+            skip_var_names=no_hist_var_names,
+        )
+        for var_name, hist in results.items():
             self._sampling_act_histogram[var_name][0] += hist
 
     def _sample_ptf(self):
@@ -995,25 +1022,9 @@ class PostTrainingQuantization:
         """
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._get_weight_abs_max(
+                    var_name
+                )
 
         for var_name in self._quantized_act_var_name:
             var_tensor = utils.load_variable_data(self._scope, var_name)
@@ -1123,41 +1134,28 @@ class PostTrainingQuantization:
 
         # Abs_max threshold for weights
         for var_name in self._quantized_weight_var_name:
-            weight_data = utils.load_variable_data(self._scope, var_name)
-            if self._weight_quantize_type == "abs_max":
-                weight_threshold = float(np.max(np.abs(weight_data)))
-            elif self._weight_quantize_type == "channel_wise_abs_max":
-                weight_threshold = []
-                if (
-                    self._weight_op_pairs[var_name]
-                    in utils._channelwise_quant_axis1_ops
-                ):
-                    for i in range(weight_data.shape[1]):
-                        weight_threshold.append(
-                            float(np.max(np.abs(weight_data[:, i])))
-                        )
-                else:
-                    for i in range(weight_data.shape[0]):
-                        weight_threshold.append(
-                            float(np.max(np.abs(weight_data[i])))
-                        )
-            self._quantized_var_threshold[var_name] = weight_threshold
+            self._quantized_var_threshold[var_name] = self._get_weight_abs_max(
+                var_name
+            )
 
-        for var_name in self._quantized_act_var_name:
-            if (var_name in self._zero_size_var_names) and (
-                var_name not in self._sampling_act_histogram
-            ):
-                continue
+        def _calculate_threshold(var_name):
             hist, hist_edges = self._sampling_act_histogram[var_name]
             if self._algo == "KL":
                 bin_width = hist_edges[1] - hist_edges[0]
-                self._quantized_var_threshold[var_name] = cal_kl_threshold(
-                    hist, bin_width, self._activation_bits
-                )
-            elif self._algo == "hist":
-                self._quantized_var_threshold[var_name] = (
-                    self._get_hist_scaling_factor(hist, hist_edges)
-                )
+                return cal_kl_threshold(hist, bin_width, self._activation_bits)
+            else:
+                return self._get_hist_scaling_factor(hist, hist_edges)
+
+        var_names = [
+            var_name
+            for var_name in sorted(self._quantized_act_var_name)
+            if (var_name not in self._zero_size_var_names)
+            or (var_name in self._sampling_act_histogram)
+        ]
+        with ThreadPoolExecutor(self._num_threads) as pool:
+            thresholds = pool.map(_calculate_threshold, var_names)
+            for var_name, threshold in zip(var_names, thresholds):
+                self._quantized_var_threshold[var_name] = threshold
 
     def _update_program(self):
         '''
@@ -1509,6 +1507,7 @@ class PostTrainingQuantizationProgram(PostTrainingQuantization):
         cache_dir=None,
         scale_dict=None,
         return_graph=True,
+        num_threads=None,
     ):
         super().__init__(
             executor,
@@ -1541,6 +1540,7 @@ class PostTrainingQuantizationProgram(PostTrainingQuantization):
             cache_dir,
             scale_dict,
             return_graph,
+            num_threads=num_threads,
         )
         self.FLAG = False
         self._program = program
@@ -20,8 +20,10 @@ import os.path as osp
 import shutil
 import sys
 import tarfile
+import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 import httpx
@@ -60,6 +62,10 @@ WEIGHTS_HOME = osp.expanduser("~/.cache/paddle/hapi/weights")
 
 DOWNLOAD_RETRY_LIMIT = 3
 
+DOWNLOAD_CACHE_HOME = os.environ.get(
+    "PADDLE_DOWNLOAD_CACHE_HOME", osp.expanduser("~/.cache/paddle/download")
+)
+
 
 def is_url(path: str) -> bool:
     """
@@ -154,7 +160,9 @@ def get_path_from_url(
         logger.info(f"Found {fullpath}")
     else:
         if ParallelEnv().current_endpoint in unique_endpoints:
-            fullpath = _download(url, root_dir, md5sum, method=method)
+            fullpath = _download(
+                url, root_dir, md5sum, method=method, force=not check_exist
+            )
         else:
             while not os.path.exists(fullpath):
                 time.sleep(1)
@@ -204,14 +212,19 @@ def _get_download(url, fullname):
 _download_methods = {'get': _get_download}
 
 
-def _download(url, path, md5sum=None, method='get'):
+def _download(url, path, md5sum=None, method='get', force=False):
     """
     Download from url, save to path.
 
+    The file is fetched into the download cache first and then copied to
+    path, so that the same content downloaded for different paths is only
+    fetched once.
+
     url (str): download url
     path (str): download to given path
     md5sum (str): md5 sum of download package
     method (str): which download method to use. Support `wget` and `get`. Default is `get`.
+    force (bool): fetch from url even if the url is found in the download cache.
 
     """
     assert method in _download_methods, f'make sure `{method}` implemented'
@@ -221,23 +234,316 @@ def _download(url, path, md5sum=None, method='get'):
 
     fname = osp.split(url)[-1]
     fullname = osp.join(path, fname)
-    retry_cnt = 0
 
-    logger.info(f"Downloading {fname} from {url}")
-    while not (osp.exists(fullname) and _md5check(fullname, md5sum)):
-        logger.info(f"md5check {fullname} and {md5sum}")
-        if retry_cnt < DOWNLOAD_RETRY_LIMIT:
-            retry_cnt += 1
+    blob = _get_download_cache().fetch(url, md5sum, method=method, force=force)
+    _copy_file(blob, fullname)
+    return fullname
+
+
+def _copy_file(src, dst):
+    # copy instead of linking, so that modifying dst never corrupts the
+    # cached blob, and replace dst atomically so that waiting processes
+    # never see a partial file
+    tmp_dst = dst + "_tmp"
+    if osp.lexists(tmp_dst):
+        os.remove(tmp_dst)
+    shutil.copyfile(src, tmp_dst)
+    os.replace(tmp_dst, dst)
+
+
+class _FileLock:
+    """
+    An inter-process lock on a lock file, so that only one process on the
+    node downloads a url, while the others wait and reuse the result.
+    """
+
+    def __init__(self, path, poll_interval=0.5):
+        self._path = path
+        self._poll_interval = poll_interval
+        self._fd = None
+
+    def __enter__(self):
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None
+
+        if fcntl is not None:
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            return self
+
+        # no flock on this platform, fall back to an exclusively created file
+        while True:
+            try:
+                self._fd = os.open(
+                    self._path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644
+                )
+                return self
+            except FileExistsError:
+                time.sleep(self._poll_interval)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None
+
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
         else:
-            raise RuntimeError(
-                f"Download from {url} failed. " "Retry limit reached"
+            os.close(self._fd)
+            os.remove(self._path)
+        self._fd = None
+
+
+class _DownloadCache:
+    """
+    A content addressed cache of downloaded files.
+
+    Files are stored as ``blobs/<md5>`` and ``refs/<hash of url>`` records
+    the md5 of the content last fetched from the url. The md5 is computed
+    while the content is written, so a blob never needs to be verified
+    again, and identical files from different urls are stored once.
+
+    Fetching is resumable from the partial file of a previous attempt, and
+    large files are fetched as parallel ranges when the server supports it.
+
+    Args:
+        root (str): root dir of the cache.
+        num_workers (int): the number of parallel range requests.
+        chunk_size (int): the size in bytes of a range request.
+        parallel_min_size (int): files smaller than it are fetched in a
+            single stream.
+    """
+
+    def __init__(
+        self,
+        root,
+        num_workers=8,
+        chunk_size=16 * 1024 * 1024,
+        parallel_min_size=64 * 1024 * 1024,
+    ):
+        self.root = root
+        self.num_workers = num_workers
+        self.chunk_size = chunk_size
+        self.parallel_min_size = parallel_min_size
+        for sub_dir in ("blobs", "refs", "tmp", "locks"):
+            os.makedirs(osp.join(root, sub_dir), exist_ok=True)
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _blob_path(self, md5sum):
+        return osp.join(self.root, "blobs", md5sum)
+
+    def _ref_path(self, url):
+        return osp.join(self.root, "refs", self._key(url))
+
+    def lookup(self, url, md5sum=None):
+        """
+        Return the cached file of url, or None if it is not cached.
+        """
+        if md5sum is None:
+            try:
+                with open(self._ref_path(url)) as f:
+                    md5sum = f.read().strip()
+            except FileNotFoundError:
+                return None
+        blob = self._blob_path(md5sum)
+        return blob if osp.exists(blob) else None
+
+    def fetch(self, url, md5sum=None, method='get', force=False):
+        """
+        Return the cached file of url, download it if it is not cached.
+        """
+        if not force:
+            blob = self.lookup(url, md5sum)
+            if blob is not None:
+                logger.info(f"Found {url} in download cache {blob}")
+                return blob
+
+        lock_path = osp.join(self.root, "locks", self._key(url) + ".lock")
+        with _FileLock(lock_path):
+            if not force:
+                # another process may have fetched it while we were waiting
+                blob = self.lookup(url, md5sum)
+                if blob is not None:
+                    return blob
+
+            digest = self._fetch(url, md5sum, method)
+            ref_path = self._ref_path(url)
+            with open(ref_path + "_tmp", "w") as f:
+                f.write(digest)
+            os.replace(ref_path + "_tmp", ref_path)
+            return self._blob_path(digest)
+
+    def _fetch(self, url, md5sum, method):
+        fname = osp.split(url)[-1]
+        tmp_path = osp.join(self.root, "tmp", self._key(url) + ".part")
+        retry_cnt = 0
+
+        logger.info(f"Downloading {fname} from {url}")
+        while True:
+            if retry_cnt < DOWNLOAD_RETRY_LIMIT:
+                retry_cnt += 1
+            else:
+                # do not resume from the partial file of the failed attempts
+                # next time
+                if osp.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise RuntimeError(
+                    f"Download from {url} failed. " "Retry limit reached"
+                )
+
+            if method == 'get':
+                digest = self._get_fetch(url, tmp_path)
+            else:
+                digest = None
+                if _download_methods[method](url, tmp_path):
+                    digest = _md5sum(tmp_path)
+            if not digest:
+                time.sleep(1)
+                continue
+
+            logger.info(f"md5check {fname} and {md5sum}")
+            if md5sum is not None and digest != md5sum:
+                logger.info(
+                    f"File {fname} md5 check failed, {digest}(calc) != "
+                    f"{md5sum}(base)"
+                )
+                os.remove(tmp_path)
+                continue
+
+            os.replace(tmp_path, self._blob_path(digest))
+            return digest
+
+    def _get_fetch(self, url, tmp_path):
+        try:
+            with httpx.Client(timeout=None, follow_redirects=True) as client:
+                resp = client.head(url)
+                total_size = int(resp.headers.get('content-length') or 0)
+                accept_ranges = (
+                    resp.status_code == 200
+                    and resp.headers.get('accept-ranges') == 'bytes'
+                )
+                if accept_ranges and total_size >= self.parallel_min_size:
+                    return self._range_fetch(client, url, tmp_path, total_size)
+                return self._stream_fetch(
+                    client, url, tmp_path, resume=accept_ranges
+                )
+        except Exception as e:  # httpx.ConnectError
+            logger.info(
+                f"Downloading {osp.split(url)[-1]} from {url} failed with exception {e}"
             )
+            # only the bytes of an interrupted transfer are worth resuming
+            if not isinstance(e, httpx.TransportError) and osp.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+    def _stream_fetch(self, client, url, tmp_path, resume):
+        md5 = hashlib.md5()
+        offset = 0
+        headers = {}
+        if resume and osp.exists(tmp_path):
+            # hash the bytes fetched by the last attempt and fetch the rest
+            with open(tmp_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    md5.update(chunk)
+                    offset += len(chunk)
+            if offset > 0:
+                headers['Range'] = f"bytes={offset}-"
+
+        with client.stream("GET", url, headers=headers) as req:
+            if req.status_code == 200:
+                if offset:
+                    md5 = hashlib.md5()
+                    offset = 0
+            elif req.status_code == 416 and offset:
+                # the last attempt has fetched all the bytes
+                return md5.hexdigest()
+            elif req.status_code != 206 or not offset:
+                raise RuntimeError(
+                    f"Downloading from {url} failed with code "
+                    f"{req.status_code}!"
+                )
 
-        if not _download_methods[method](url, fullname):
-            time.sleep(1)
-            continue
+            total_size = req.headers.get('content-length')
+            with open(tmp_path, 'ab' if offset else 'wb') as f:
+                with tqdm(
+                    total=(
+                        (int(total_size) + 1023) // 1024 if total_size else None
+                    )
+                ) as pbar:
+                    for chunk in req.iter_bytes(chunk_size=1024 * 1024):
+                        if chunk:
+                            f.write(chunk)
+                            md5.update(chunk)
+                            pbar.update((len(chunk) + 1023) // 1024)
+        return md5.hexdigest()
+
+    def _range_fetch(self, client, url, tmp_path, total_size):
+        ranges = [
+            (start, min(start + self.chunk_size, total_size) - 1)
+            for start in range(0, total_size, self.chunk_size)
+        ]
+        lock = threading.Lock()
+
+        def fetch_range(fd, pbar, start, end):
+            headers = {'Range': f"bytes={start}-{end}"}
+            with client.stream("GET", url, headers=headers) as req:
+                if req.status_code != 206:
+                    raise RuntimeError(
+                        f"Downloading range {start}-{end} from {url} "
+                        f"failed with code {req.status_code}!"
+                    )
+                offset = start
+                for chunk in req.iter_bytes(chunk_size=1024 * 1024):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    with lock:
+                        pbar.update((len(chunk) + 1023) // 1024)
+            if offset != end + 1:
+                raise RuntimeError(
+                    f"Downloading range {start}-{end} from {url} is truncated"
+                )
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, total_size)
+            with tqdm(total=(total_size + 1023) // 1024) as pbar:
+                with ThreadPoolExecutor(self.num_workers) as pool:
+                    futures = [
+                        pool.submit(fetch_range, fd, pbar, start, end)
+                        for start, end in ranges
+                    ]
+                    for future in futures:
+                        future.result()
+        finally:
+            os.close(fd)
+        # the ranges arrive out of order, so the file is hashed once
+        # after all of them are written
+        return _md5sum(tmp_path)
+
+
+_download_cache = None
+
+
+def _get_download_cache():
+    global _download_cache
+    if _download_cache is None or _download_cache.root != DOWNLOAD_CACHE_HOME:
+        _download_cache = _DownloadCache(DOWNLOAD_CACHE_HOME)
+    return _download_cache
 
-    return fullname
+
+def _md5sum(fullname):
+    md5 = hashlib.md5()
+    with open(fullname, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
 
 
 def _md5check(fullname, md5sum=None):
@@ -245,11 +551,7 @@ def _md5check(fullname, md5sum=None):
         return True
 
     logger.info(f"File {fullname} md5 checking...")
-    md5 = hashlib.md5()
-    with open(fullname, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            md5.update(chunk)
-    calc_md5sum = md5.hexdigest()
+    calc_md5sum = _md5sum(fullname)
 
     if calc_md5sum != md5sum:
         logger.info(
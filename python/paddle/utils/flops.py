@@ -82,7 +82,7 @@ def _conv2d_flops(input_shapes, attrs):
 
     bias = (
         input_shapes.get('Bias')[0]
-        if len(input_shapes.get('Bias')) > 0
+        if len(input_shapes.get('Bias', [])) > 0
         else None
     )
     input = input_shapes.get('Input')[0]
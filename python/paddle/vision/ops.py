@@ -1931,14 +1931,39 @@ class ConvNormActivation(Sequential):
         super().__init__(*layers)
 
 
+@overload
 def nms(
     boxes: Tensor,
-    iou_threshold: float = 0.3,
-    scores: Tensor | None = None,
-    category_idxs: Tensor | None = None,
-    categories: Sequence[int] | None = None,
-    top_k: int | None = None,
-) -> Tensor:
+    iou_threshold: float = ...,
+    scores: Tensor | None = ...,
+    category_idxs: Tensor | None = ...,
+    categories: Sequence[int] | None = ...,
+    top_k: int | None = ...,
+    boxes_num: None = ...,
+) -> Tensor: ...
+
+
+@overload
+def nms(
+    boxes: Tensor,
+    iou_threshold: float = ...,
+    scores: Tensor | None = ...,
+    category_idxs: Tensor | None = ...,
+    categories: Sequence[int] | None = ...,
+    top_k: int | None = ...,
+    boxes_num: Tensor = ...,
+) -> tuple[Tensor, Tensor]: ...
+
+
+def nms(
+    boxes,
+    iou_threshold=0.3,
+    scores=None,
+    category_idxs=None,
+    categories=None,
+    top_k=None,
+    boxes_num=None,
+):
     r"""
     This operator implements non-maximum suppression. Non-maximum suppression (NMS)
     is used to select one bounding box out of many overlapping bounding boxes in object detection.
@@ -1954,7 +1979,13 @@ def nms(
 
     If category_idxs and categories are provided, NMS will be performed with a batched style,
     which means NMS will be applied to each category respectively and results of each category
-    will be concatenated and sorted by scores.
+    will be concatenated and sorted by scores. All the categories are suppressed in a single
+    NMS pass, by shifting the boxes of each category to a disjoint region so that boxes of
+    different categories never overlap.
+
+    If boxes_num is provided, boxes are the concatenated boxes of a batch of images, and NMS
+    will be applied to each image (and each category, if category_idxs is provided) respectively
+    in the same single pass.
 
     If K is provided, only the first k elements will be returned. Otherwise, all box indices sorted by scores will be returned.
 
@@ -1971,10 +2002,17 @@ def nms(
             it's a 1D-Tensor with shape of [num_boxes]. The data type is int64. Default: None.
         categories(list|tuple|None, optional): A list of unique id of all categories. The data type is int64. Default: None.
         top_k(int|None, optional): The top K boxes who has higher score and kept by NMS preds to
-            consider. top_k should be smaller equal than num_boxes. Default: None.
+            consider. top_k should be smaller equal than num_boxes. If boxes_num is provided,
+            top_k is applied to each image. Default: None.
+        boxes_num(Tensor|None, optional): The number of boxes of each image, it's a 1D-Tensor with
+            shape of [batch_size], and boxes of the images are concatenated in order in boxes.
+            scores is necessary if boxes_num is provided. The data type is int32 or int64. Default: None.
 
     Returns:
         Tensor: 1D-Tensor with the shape of [num_boxes]. Indices of boxes kept by NMS.
+        If boxes_num is provided, return a tuple of two Tensors, the indices of boxes kept by NMS,
+        grouped by image and sorted by scores in each image, and the number of kept boxes of each
+        image with the shape of [batch_size].
 
     Examples:
         .. code-block:: python
@@ -2009,6 +2047,18 @@ def nms(
             >>> print(out)
             Tensor(shape=[4], dtype=int64, place=Place(cpu), stop_gradient=True,
             [1, 0, 2, 3])
+
+            >>> boxes_num = paddle.to_tensor([2, 2], dtype="int64")
+            >>> out, out_num = paddle.vision.ops.nms(boxes,
+            ...                                      0.1,
+            ...                                      scores,
+            ...                                      boxes_num=boxes_num)
+            >>> print(out)
+            Tensor(shape=[3], dtype=int64, place=Place(cpu), stop_gradient=True,
+            [1, 0, 2])
+            >>> print(out_num)
+            Tensor(shape=[2], dtype=int64, place=Place(cpu), stop_gradient=True,
+            [2, 1])
     """
 
     def _nms(boxes, iou_threshold):
@@ -2027,79 +2077,107 @@ def nms(
             return out
 
     if scores is None:
+        assert boxes_num is None, "scores is necessary if boxes_num is given"
         return _nms(boxes, iou_threshold)
 
     import paddle
 
-    if category_idxs is None:
+    if category_idxs is None and boxes_num is None:
         sorted_global_indices = paddle.argsort(scores, descending=True)
         sorted_keep_boxes_indices = _nms(
             boxes[sorted_global_indices], iou_threshold
         )
         return sorted_global_indices[sorted_keep_boxes_indices]
 
-    if top_k is not None:
+    if top_k is not None and boxes_num is None:
         assert (
             top_k <= scores.shape[0]
         ), "top_k should be smaller equal than the number of boxes"
-    assert (
-        categories is not None
-    ), "if category_idxs is given, categories which is a list of unique id of all categories is necessary"
-
-    mask = paddle.zeros_like(scores, dtype='int32')
-
-    for category_id in categories:
-        cur_category_boxes_idxs = paddle.where(
-            paddle.equal(category_idxs, paddle.to_tensor(category_id))
-        )[0]
-        shape = cur_category_boxes_idxs.shape[0]
-        cur_category_boxes_idxs = paddle.reshape(
-            cur_category_boxes_idxs, [shape]
+
+    # group id of each box, boxes of different groups do not suppress
+    # each other
+    candidate_idxs = None
+    group_idxs = None
+    if category_idxs is not None:
+        assert (
+            categories is not None
+        ), "if category_idxs is given, categories which is a list of unique id of all categories is necessary"
+        min_category = min(categories)
+        num_categories = max(categories) - min_category + 1
+        # boxes of categories not in categories are dropped
+        in_categories = paddle.any(
+            paddle.equal(
+                category_idxs.unsqueeze(1),
+                paddle.to_tensor(categories, dtype=category_idxs.dtype),
+            ),
+            axis=1,
         )
-        if shape == 0:
-            continue
-        elif shape == 1:
-            mask[cur_category_boxes_idxs] = 1
-            continue
-        cur_category_boxes = boxes[cur_category_boxes_idxs]
-        cur_category_scores = scores[cur_category_boxes_idxs]
-        cur_category_sorted_indices = paddle.argsort(
-            cur_category_scores, descending=True
+        candidate_idxs = paddle.where(in_categories)[0]
+        candidate_idxs = paddle.reshape(
+            candidate_idxs, [candidate_idxs.shape[0]]
         )
-        cur_category_sorted_boxes = cur_category_boxes[
-            cur_category_sorted_indices
-        ]
+        group_idxs = category_idxs[candidate_idxs] - min_category
 
-        cur_category_keep_boxes_sub_idxs = cur_category_sorted_indices[
-            _nms(cur_category_sorted_boxes, iou_threshold)
-        ]
-
-        updates = paddle.ones_like(
-            cur_category_boxes_idxs[cur_category_keep_boxes_sub_idxs],
-            dtype='int32',
-        )
-        mask = paddle.scatter(
-            mask,
-            cur_category_boxes_idxs[cur_category_keep_boxes_sub_idxs],
-            updates,
-            overwrite=True,
+    if boxes_num is not None:
+        image_idxs = paddle.repeat_interleave(
+            paddle.arange(boxes_num.shape[0], dtype='int64'),
+            boxes_num.astype('int64'),
         )
-    keep_boxes_idxs = paddle.where(mask)[0]
-    shape = keep_boxes_idxs.shape[0]
-    keep_boxes_idxs = paddle.reshape(keep_boxes_idxs, [shape])
-    sorted_sub_indices = paddle.argsort(
-        scores[keep_boxes_idxs], descending=True
-    )
+        if candidate_idxs is None:
+            group_idxs = image_idxs
+        else:
+            image_offsets = image_idxs[candidate_idxs] * num_categories
+            group_idxs = image_offsets + group_idxs.astype('int64')
 
-    if top_k is None:
-        return keep_boxes_idxs[sorted_sub_indices]
+    if candidate_idxs is None:
+        candidate_boxes = boxes
+        candidate_scores = scores
+    else:
+        candidate_boxes = boxes[candidate_idxs]
+        candidate_scores = scores[candidate_idxs]
 
-    if in_dygraph_mode():
-        top_k = min(top_k, shape)
-        _, topk_sub_indices = paddle.topk(scores[keep_boxes_idxs], top_k)
-        return keep_boxes_idxs[topk_sub_indices]
+    if in_dygraph_mode() and candidate_boxes.shape[0] == 0:
+        keep_boxes_idxs = paddle.zeros([0], dtype='int64')
+    else:
+        # shift the boxes of each group by a multiple of the coordinate
+        # range, in float64 to keep the precision of shifted coordinates
+        candidate_boxes = candidate_boxes.astype('float64')
+        coordinate_range = candidate_boxes.max() - candidate_boxes.min() + 1
+        offsets = group_idxs.astype('float64') * coordinate_range
+        shifted_boxes = candidate_boxes + offsets.unsqueeze(1)
+
+        sorted_indices = paddle.argsort(candidate_scores, descending=True)
+        keep_boxes_idxs = sorted_indices[
+            _nms(shifted_boxes[sorted_indices], iou_threshold)
+        ]
+        if candidate_idxs is not None:
+            keep_boxes_idxs = candidate_idxs[keep_boxes_idxs]
+
+    if boxes_num is None:
+        if top_k is None:
+            return keep_boxes_idxs
+        if in_dygraph_mode():
+            top_k = min(top_k, keep_boxes_idxs.shape[0])
+        return keep_boxes_idxs[:top_k]
+
+    # keep boxes are sorted by scores, group them by image stably
+    keep_image_idxs = image_idxs[keep_boxes_idxs]
+    image_order = paddle.argsort(keep_image_idxs, stable=True)
+    keep_boxes_idxs = keep_boxes_idxs[image_order]
+    keep_image_idxs = keep_image_idxs[image_order]
+    keep_num = paddle.bincount(keep_image_idxs, minlength=boxes_num.shape[0])
+
+    if top_k is not None:
+        image_start = paddle.cumsum(keep_num) - keep_num
+        rank = (
+            paddle.cumsum(paddle.ones_like(keep_image_idxs))
+            - 1
+            - image_start[keep_image_idxs]
+        )
+        keep_boxes_idxs = keep_boxes_idxs[rank < top_k]
+        keep_num = paddle.clip(keep_num, max=top_k)
 
-    return keep_boxes_idxs[sorted_sub_indices][:top_k]
+    return keep_boxes_idxs, keep_num
 
 
 @overload
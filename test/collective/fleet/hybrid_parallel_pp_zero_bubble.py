@@ -0,0 +1,138 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+
+import numpy as np
+
+import paddle
+import paddle.distributed as dist
+from paddle import nn
+from paddle.distributed import fleet
+from paddle.distributed.fleet.meta_parallel import (
+    LayerDesc,
+    PipelineLayer,
+    PipelineParallelZeroBubble,
+    SplitBWLinear,
+)
+
+
+def set_random_seed(seed, dp_id, rank_id):
+    """Set random seed for reproducibility."""
+    random.seed(seed)
+    np.random.seed(seed + dp_id)
+    paddle.seed(seed + dp_id)
+
+
+batch_size = 8
+micro_batch_size = 2
+hidden_size = 32
+num_layers = 4
+
+
+class MLP(nn.Layer):
+    def __init__(self):
+        super().__init__()
+        layers = []
+        for _ in range(num_layers):
+            layers.append(nn.Linear(hidden_size, hidden_size))
+            layers.append(nn.Tanh())
+        self.layers = nn.Sequential(*layers)
+        self.loss_fn = nn.MSELoss()
+
+    def forward(self, x, y):
+        return self.loss_fn(self.layers(x), y)
+
+
+class MLPPipe(PipelineLayer):
+    def __init__(self, **kwargs):
+        layers = []
+        for _ in range(num_layers):
+            layers.append(LayerDesc(SplitBWLinear, hidden_size, hidden_size))
+            layers.append(LayerDesc(nn.Tanh))
+        super().__init__(layers=layers, loss_fn=nn.MSELoss(), **kwargs)
+
+
+class TestDistPPZeroBubbleTraining(unittest.TestCase):
+    def setUp(self):
+        strategy = fleet.DistributedStrategy()
+        self.pipeline_parallel_size = 2
+        strategy.hybrid_configs = {
+            "dp_degree": 1,
+            "mp_degree": 1,
+            "pp_degree": self.pipeline_parallel_size,
+            "pp_configs": {"use_zero_bubble": True},
+        }
+        strategy.pipeline_configs = {
+            "accumulate_steps": batch_size // micro_batch_size,
+            "micro_batch_size": micro_batch_size,
+        }
+        fleet.init(is_collective=True, strategy=strategy)
+
+    def test_pp_model(self):
+        hcg = fleet.get_hybrid_communicate_group()
+        dp_id = hcg.get_data_parallel_rank()
+        pp_id = hcg.get_stage_id()
+        rank_id = dist.get_rank()
+        set_random_seed(1024, dp_id, rank_id)
+
+        model_a = MLP()
+        optimizer_a = paddle.optimizer.SGD(
+            learning_rate=0.1, parameters=model_a.parameters()
+        )
+        parameters = [param.numpy() for param in model_a.parameters()]
+        param_len = len(parameters)
+
+        model_b = MLPPipe(num_stages=self.pipeline_parallel_size)
+        optimizer_b = paddle.optimizer.SGD(
+            learning_rate=0.1, parameters=model_b.parameters()
+        )
+        model_b = fleet.distributed_model(model_b)
+        optimizer_b = fleet.distributed_optimizer(optimizer_b)
+        self.assertIsInstance(model_b, PipelineParallelZeroBubble)
+        self.assertEqual(
+            model_b.get_static_scheduler(),
+            (
+                "f0;f1;b0;f2;b1;f3;b2;b3;"
+                if pp_id == 0
+                else "f0;b0;f1;b1;f2;b2;f3;b3;w0;"
+            ),
+        )
+
+        for idx, param in enumerate(model_b.parameters()):
+            param.set_value(parameters[idx + pp_id * (param_len // 2)])
+
+        for _ in range(5):
+            x = paddle.to_tensor(
+                np.random.randn(batch_size, hidden_size).astype('float32')
+            )
+            y = paddle.to_tensor(
+                np.random.randn(batch_size, hidden_size).astype('float32')
+            )
+
+            loss_a = model_a(x, y)
+            loss_a.backward()
+            optimizer_a.step()
+            optimizer_a.clear_grad()
+
+            loss_b = model_b.train_batch([x, y], optimizer_b)
+
+            np.testing.assert_allclose(
+                loss_a.numpy(), loss_b.numpy(), rtol=1e-5
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
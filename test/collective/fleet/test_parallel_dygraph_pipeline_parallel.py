@@ -15,6 +15,7 @@
 import os
 import unittest
 
+import numpy as np
 from legacy_test.test_parallel_dygraph_dataparallel import (
     TestMultipleAccelerators,
 )
@@ -65,6 +66,53 @@ class TestHybridPipeParallel(TestMultipleAccelerators):
             'hybrid_parallel_pp_return_micro_batch_loss.py'
         )
 
+    def test_hybrid_parallel_pp_zero_bubble(self):
+        self.run_mnist_2accelerators('hybrid_parallel_pp_zero_bubble.py')
+
+
+class TestSplitBWLinear(unittest.TestCase):
+    def test_deferred_weight_grad(self):
+        from paddle.distributed.fleet.meta_parallel import (
+            SplitBWLinear,
+            WeightGradStore,
+        )
+
+        paddle.seed(2024)
+        linear = paddle.nn.Linear(8, 4)
+        split_linear = SplitBWLinear(8, 4)
+        split_linear.weight.set_value(linear.weight)
+        split_linear.bias.set_value(linear.bias)
+
+        x = paddle.randn([2, 3, 8])
+        x.stop_gradient = False
+        linear(x).sum().backward()
+        expect_x_grad = x.grad.numpy()
+        x.clear_gradient()
+
+        for defer in [True, False]:
+            WeightGradStore.enabled = defer
+            split_linear(x).sum().backward()
+            WeightGradStore.enabled = False
+            np.testing.assert_allclose(x.grad.numpy(), expect_x_grad)
+            x.clear_gradient()
+            if defer:
+                self.assertIsNone(split_linear.weight.grad)
+                WeightGradStore.flush()
+                self.assertEqual(WeightGradStore.size(), 1)
+                WeightGradStore.pop()
+            self.assertEqual(WeightGradStore.size(), 0)
+            np.testing.assert_allclose(
+                split_linear.weight.grad.numpy(),
+                linear.weight.grad.numpy(),
+                rtol=1e-6,
+            )
+            np.testing.assert_allclose(
+                split_linear.bias.grad.numpy(),
+                linear.bias.grad.numpy(),
+                rtol=1e-6,
+            )
+            split_linear.clear_gradients()
+
 
 class TestFakeMicroDataSet(unittest.TestCase):
     def test_fake_micro_data_set(self):
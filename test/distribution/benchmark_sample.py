@@ -0,0 +1,69 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from benchmark import timeit_function
+
+import paddle
+
+# Micro benchmark of the batch sampling of distributions, reporting the
+# samples drawn per second by sample() and by chunked_sample().
+
+SAMPLE_SHAPE = [4096]
+CHUNK_SIZE = 1024
+
+
+def make_distributions():
+    probs = paddle.nn.functional.softmax(paddle.rand([16, 32]), axis=-1)
+    return {
+        'Normal': paddle.distribution.Normal(
+            paddle.zeros([16, 32]), paddle.ones([16, 32])
+        ),
+        'Multinomial': paddle.distribution.Multinomial(100, probs),
+        'Binomial': paddle.distribution.Binomial(
+            100, paddle.full([16, 32], 0.3)
+        ),
+        'Dirichlet': paddle.distribution.Dirichlet(paddle.rand([16, 32]) + 0.5),
+        'LKJCholesky': paddle.distribution.LKJCholesky(8, 2.0),
+    }
+
+
+class BenchmarkSample(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_timeit(self, iters=5):
+        num_samples = SAMPLE_SHAPE[0]
+        for name, dist in make_distributions().items():
+            single = num_samples / timeit_function(
+                dist.sample, iters, SAMPLE_SHAPE, warmup=1
+            )
+            chunked = num_samples / timeit_function(
+                paddle.distribution.chunked_sample,
+                iters,
+                dist,
+                SAMPLE_SHAPE,
+                CHUNK_SIZE,
+                2024,
+                warmup=1,
+            )
+            print(
+                f"{name:<12} sample: {single:12.1f} samples/s, "
+                f"chunked_sample: {chunked:12.1f} samples/s"
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.distribution import lkj_cholesky
+
+
+class TestChunkedSample(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self._dist = paddle.distribution.Normal(
+            paddle.zeros([3]), paddle.ones([3])
+        )
+
+    def test_shape(self):
+        x = paddle.distribution.chunked_sample(self._dist, [10, 2], 4, 2024)
+        self.assertEqual(x.shape, [10, 2, 3])
+
+    def test_same_seed(self):
+        x = paddle.distribution.chunked_sample(self._dist, [10, 2], 4, 2024)
+        y = paddle.distribution.chunked_sample(self._dist, [10, 2], 4, 2024)
+        z = paddle.distribution.chunked_sample(self._dist, [10, 2], 4, 2025)
+        np.testing.assert_array_equal(x.numpy(), y.numpy())
+        self.assertFalse(np.array_equal(x.numpy(), z.numpy()))
+
+    def test_chunk_indices(self):
+        x = paddle.distribution.chunked_sample(self._dist, [10, 2], 4, 2024)
+        for index, (start, stop) in enumerate([(0, 4), (4, 8), (8, 10)]):
+            y = paddle.distribution.chunked_sample(
+                self._dist, [10, 2], 4, 2024, chunk_indices=[index]
+            )
+            np.testing.assert_array_equal(x.numpy()[start:stop], y.numpy())
+        y = paddle.distribution.chunked_sample(
+            self._dist, [10, 2], 4, 2024, chunk_indices=[2, 0]
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([x.numpy()[8:], x.numpy()[:4]]), y.numpy()
+        )
+
+    def test_rng_state_recovered(self):
+        paddle.seed(2024)
+        expected = paddle.rand([5]).numpy()
+        paddle.seed(2024)
+        paddle.distribution.chunked_sample(self._dist, [10], 4, 1)
+        np.testing.assert_array_equal(paddle.rand([5]).numpy(), expected)
+
+    def test_multinomial(self):
+        dist = paddle.distribution.Multinomial(
+            10, paddle.to_tensor([0.2, 0.3, 0.5])
+        )
+        x = paddle.distribution.chunked_sample(dist, [7, 2], 3, 2024)
+        self.assertEqual(x.shape, [7, 2, 3])
+        np.testing.assert_array_equal(x.sum(-1).numpy(), np.full([7, 2], 10))
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            paddle.distribution.chunked_sample(self._dist, [], 4, 2024)
+        with self.assertRaises(ValueError):
+            paddle.distribution.chunked_sample(self._dist, [10], 0, 2024)
+        with self.assertRaises(ValueError):
+            paddle.distribution.chunked_sample(
+                self._dist, [10], 4, 2024, chunk_indices=[3]
+            )
+        with self.assertRaises(ValueError):
+            paddle.distribution.chunked_sample(
+                self._dist, [10], 4, 2024, chunk_indices=[]
+            )
+
+
+class TestVecToTrilMatrix(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_row_major(self):
+        dim, last_dim, sample_shape = 4, 6, (2, 3)
+        vec = np.arange(2 * 3 * last_dim, dtype='float32') + 1
+        matrix = lkj_cholesky.vec_to_tril_matrix(
+            paddle.to_tensor(vec), dim, last_dim, vec.size, sample_shape, -1
+        ).numpy()
+        self.assertEqual(matrix.shape, (2, 3, dim, dim))
+        rows, cols = np.tril_indices(dim, -1)
+        expected = np.zeros([2, 3, dim, dim], dtype='float32')
+        expected[..., rows, cols] = vec.reshape([2, 3, last_dim])
+        np.testing.assert_array_equal(matrix, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from benchmark import timeit_function
+
+import paddle
+from paddle.base.variable_index import _parse_index, parse_index
+
+# Micro benchmark of parsing the index of __getitem__/__setitem__ in static
+# graph, comparing the cached basic indexing with parsing it every time.
+
+INDEX_PATTERNS = {
+    # q[..., :half], q[..., half:] in rotary position embedding
+    'rope_half': (Ellipsis, slice(0, 32)),
+    # x[..., ::2] in interleaved rotary position embedding
+    'rope_interleave': (Ellipsis, slice(None, None, 2)),
+    # cache[:, :, :seq_len] in kv cache update
+    'kv_cache': (slice(None), slice(None), slice(0, 128)),
+    # mask[:, None, None, :]
+    'mask_unsqueeze': (slice(None), None, None, slice(None)),
+    # logits[:, -1]
+    'last_token': (slice(None), -1),
+}
+
+
+class BenchmarkIndexParse(unittest.TestCase):
+    def setUp(self):
+        paddle.enable_static()
+
+    def tearDown(self):
+        paddle.disable_static()
+
+    def test_timeit(self, iters=10000):
+        with paddle.static.program_guard(
+            paddle.static.Program(), paddle.static.Program()
+        ):
+            x = paddle.static.data(
+                name='x', shape=[-1, 32, 1024, 64], dtype='float32'
+            )
+            for name, indices in INDEX_PATTERNS.items():
+                cached = timeit_function(parse_index, iters, x, indices) * 1e6
+                uncached = (
+                    timeit_function(
+                        _parse_index, iters, x.shape, False, indices
+                    )
+                    * 1e6
+                )
+                self.assertEqual(
+                    parse_index(x, indices),
+                    _parse_index(x.shape, False, indices),
+                )
+                print(
+                    f"{name:<16} cached: {cached:8.2f} us, "
+                    f"uncached: {uncached:8.2f} us, "
+                    f"speedup: {uncached / cached:5.2f}x"
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,7 +19,11 @@ from op_test import convert_float_to_uint16, convert_uint16_to_float
 
 import paddle
 from paddle.base import core
-from paddle.base.variable_index import _getitem_static
+from paddle.base.variable_index import (
+    _getitem_static,
+    _parse_index,
+    parse_index,
+)
 from paddle.pir_utils import test_with_pir_api
 
 
@@ -1186,6 +1190,89 @@ class TestGetitemBasicIndexOutputView(unittest.TestCase):
         np.testing.assert_allclose(x.numpy(), np_data)
 
 
+class TestGetitemBasicIndexCache(unittest.TestCase):
+    def setUp(self):
+        paddle.enable_static()
+        self.exe = paddle.static.Executor()
+
+    def tearDown(self):
+        paddle.disable_static()
+
+    @test_with_pir_api
+    def test_same_as_uncached(self):
+        indices_list = [
+            (slice(None), slice(None), slice(0, 2)),
+            (Ellipsis, slice(None, None, 2)),
+            (0, None, slice(1, 100)),
+            (slice(None, None, -1), -1),
+            (Ellipsis, None),
+            1,
+        ]
+        with paddle.static.program_guard(
+            paddle.static.Program(), paddle.static.Program()
+        ):
+            x = paddle.static.data(name='x', shape=[3, -1, 5], dtype='float32')
+            for indices in indices_list:
+                expected = _parse_index(
+                    x.shape,
+                    False,
+                    indices if isinstance(indices, tuple) else (indices,),
+                )
+                for _ in range(2):
+                    result = parse_index(x, indices)
+                    self.assertEqual(result, expected)
+                    # modifying the result does not change the cached one
+                    result[4].append(100)
+
+            with self.assertRaises(IndexError):
+                parse_index(x, (3,))
+
+    @test_with_pir_api
+    def test_getitem_result(self):
+        np_data = np.random.randn(3, 4, 5, 6)
+        indices_list = [
+            (slice(None), slice(None), slice(0, 2)),
+            (Ellipsis, slice(None, None, 2)),
+            (1, None, slice(1, 3), -1),
+            (1, None, slice(1, 3), -1),
+            (slice(None, None, -2), Ellipsis, None),
+        ]
+        with paddle.static.program_guard(
+            paddle.static.Program(), paddle.static.Program()
+        ):
+            x = paddle.to_tensor(np_data)
+            outs = [_getitem_static(x, indices) for indices in indices_list]
+            res = self.exe.run(fetch_list=outs)
+
+        for indices, out in zip(indices_list, res):
+            np.testing.assert_allclose(out, np_data[indices])
+
+    def test_pir_tensor_array(self):
+        np_x = np.random.randn(2, 2).astype('float32')
+        np_y = np.random.randn(1, 2).astype('float32')
+        with paddle.pir_utils.IrGuard():
+            main_program = paddle.static.Program()
+            with paddle.static.program_guard(main_program):
+                x = paddle.static.data('x', shape=[2, 2], dtype='float32')
+                y = paddle.static.data('y', shape=[1, 2], dtype='float32')
+                arr = paddle.tensor.create_array('float32')
+                zero = paddle.tensor.creation.fill_constant([], 'int64', 0)
+                paddle.tensor.array_write(x, zero, array=arr)
+                paddle.tensor.array_write(y, zero + 1, array=arr)
+
+                item = arr[1]
+                self.assertTrue(item.is_dense_tensor_type())
+                self.assertTrue(arr[0:1].is_dense_tensor_array_type())
+
+            exe = paddle.static.Executor()
+            (res,) = exe.run(
+                main_program,
+                feed={'x': np_x, 'y': np_y},
+                fetch_list=[item],
+            )
+        np.testing.assert_allclose(res, np_y)
+
+
 class TestGetItemErrorCase(unittest.TestCase):
     def setUp(self):
         paddle.disable_static()
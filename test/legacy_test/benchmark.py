@@ -18,15 +18,37 @@ import numpy as np
 from op import Operator
 from op_test import OpTest
 
+import paddle
+
+
+def _synchronize():
+    # the kernels on CPU run synchronously
+    place = paddle.framework._current_expected_place_()
+    if not isinstance(place, paddle.CPUPlace):
+        paddle.device.synchronize()
+
+
+def timeit_function(callback, iters, *args, warmup=0, **kwargs):
+    """
+    Return the average seconds of calling callback(*args, **kwargs) for
+    `iters` times, after `warmup` calls which are not timed. The device is
+    synchronized before reading the clock, so that the asynchronous kernels
+    are counted.
+    """
+    assert iters != 0, "Iters should >= 1"
+    for i in range(warmup):
+        callback(*args, **kwargs)
+    _synchronize()
+    start = time.perf_counter()
+    for i in range(iters):
+        callback(*args, **kwargs)
+    _synchronize()
+    return (time.perf_counter() - start) / iters
+
 
 class BenchmarkSuite(OpTest):
     def timeit_function(self, callback, iters, *args, **kwargs):
-        assert iters != 0, "Iters should >= 1"
-        start = time.time()
-        for i in range(iters):
-            callback(*args, **kwargs)
-        elapse = time.time() - start
-        return elapse / iters
+        return timeit_function(callback, iters, *args, **kwargs)
 
     def _assert_cpu_gpu_same(self, cpu_outs, gpu_outs, fetch_list, atol):
         for item_cpu_out, item_gpu_out, variable in zip(
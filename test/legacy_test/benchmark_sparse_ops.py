@@ -0,0 +1,95 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from benchmark import timeit_function
+
+import paddle
+from paddle.sparse.conversion import _converted_tensors
+
+# Micro benchmark of sparse matmul and conv3d across densities. matmul is
+# timed for the COO, the CSR and the cached CSR format of a constant sparse
+# matrix, the cached one is what paddle.sparse.matmul selects for COO inputs.
+
+DENSITIES = [0.001, 0.01, 0.05, 0.2]
+
+
+def random_dense(shape, density):
+    mask = paddle.rand(shape) < density
+    return paddle.rand(shape) * mask.astype('float32')
+
+
+@unittest.skipIf(
+    not paddle.is_compiled_with_cuda(), "sparse matmul only supports GPU"
+)
+class BenchmarkSparseOps(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_matmul(self, iters=20):
+        y = paddle.rand([4096, 64])
+        for density in DENSITIES:
+            dense_x = random_dense([4096, 4096], density)
+            coo = dense_x.to_sparse_coo(2)
+
+            def convert_every_call():
+                _converted_tensors.clear()
+                return paddle.sparse.matmul(coo, y)
+
+            csr = coo.to_sparse_csr()
+            coo_ms = 1e3 * timeit_function(
+                paddle._C_ops.sparse_matmul, iters, coo, y, warmup=1
+            )
+            csr_ms = 1e3 * timeit_function(
+                paddle.sparse.matmul, iters, csr, y, warmup=1
+            )
+            convert_ms = 1e3 * timeit_function(
+                convert_every_call, iters, warmup=1
+            )
+            cached_ms = 1e3 * timeit_function(
+                paddle.sparse.matmul, iters, coo, y, warmup=1
+            )
+            print(
+                f"matmul density {density:<6} coo: {coo_ms:8.3f} ms, "
+                f"csr: {csr_ms:8.3f} ms, "
+                f"coo->csr per call: {convert_ms:8.3f} ms, "
+                f"cached coo->csr: {cached_ms:8.3f} ms"
+            )
+
+    def test_conv3d(self, iters=20):
+        weight = paddle.rand([3, 3, 3, 16, 32])
+        for density in DENSITIES:
+            # the sites are sparse, and the channels of a site are dense
+            mask = paddle.rand([2, 32, 32, 32, 1]) < density
+            x = paddle.rand([2, 32, 32, 32, 16]) * mask.astype('float32')
+            x = x.to_sparse_coo(4)
+            conv_ms = 1e3 * timeit_function(
+                paddle.sparse.nn.functional.conv3d, iters, x, weight, warmup=1
+            )
+            subm_ms = 1e3 * timeit_function(
+                paddle.sparse.nn.functional.subm_conv3d,
+                iters,
+                x,
+                weight,
+                warmup=1,
+            )
+            print(
+                f"conv3d density {density:<6} conv3d: {conv_ms:8.3f} ms, "
+                f"subm_conv3d: {subm_ms:8.3f} ms"
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
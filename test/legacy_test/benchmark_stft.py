@@ -0,0 +1,83 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from benchmark import timeit_function
+
+import paddle
+from paddle.fft import fft_r2c
+
+# Micro benchmark of stft on long signals, comparing with the former
+# implementation, which copied the signal into the frame matrix with frame
+# before windowing it, while stft now windows a strided view of the signal.
+
+SAMPLE_RATE = 16000
+DURATIONS = [60, 600]  # seconds
+N_FFT = 512
+HOP_LENGTHS = [128, 512]
+
+
+def stft_framed(x, n_fft, hop_length, window):
+    x = paddle.nn.functional.pad(
+        x.unsqueeze(-1),
+        pad=[n_fft // 2, n_fft // 2],
+        mode='reflect',
+        data_format="NLC",
+    ).squeeze(-1)
+    x_frames = paddle.signal.frame(x, n_fft, hop_length, axis=-1)
+    x_frames = x_frames.transpose([0, 2, 1])
+    x_frames = paddle.multiply(x_frames, window)
+    out = fft_r2c(x_frames, None, -1, 'backward', True, True, None)
+    return out.transpose([0, 2, 1])
+
+
+class BenchmarkStft(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_timeit(self, iters=3):
+        window = paddle.audio.functional.get_window(
+            'hann', N_FFT, dtype='float32'
+        )
+        for duration in DURATIONS:
+            x = paddle.rand([1, duration * SAMPLE_RATE])
+            for hop_length in HOP_LENGTHS:
+
+                def stft():
+                    return paddle.signal.stft(
+                        x, N_FFT, hop_length, window=window
+                    )
+
+                def framed():
+                    return stft_framed(x, N_FFT, hop_length, window)
+
+                np.testing.assert_allclose(
+                    stft().numpy(), framed().numpy(), rtol=1e-4, atol=1e-4
+                )
+                num_frames = 1 + x.shape[-1] // hop_length
+                frames_mb = num_frames * N_FFT * 4 / 2**20
+                stft_ms = 1e3 * timeit_function(stft, iters, warmup=1)
+                framed_ms = 1e3 * timeit_function(framed, iters, warmup=1)
+                print(
+                    f"stft {duration:>4}s hop {hop_length:<4} "
+                    f"frame matrix: {frames_mb:8.1f} MB, "
+                    f"time: {stft_ms:9.2f} ms, "
+                    f"framed: {framed_ms:9.2f} ms"
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -396,5 +396,52 @@ class TestAudioFuncitons(unittest.TestCase):
         )
 
 
+class TestAudioFunctionCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_window_cached(self):
+        paddle.audio.functional.get_window.cache_clear()
+        window = paddle.audio.functional.get_window('hann', 64)
+        hits = paddle.audio.functional.get_window.cache_info().hits
+        window_again = paddle.audio.functional.get_window('hann', 64)
+        self.assertEqual(
+            paddle.audio.functional.get_window.cache_info().hits, hits + 1
+        )
+        self.assertIsNot(window, window_again)
+        np.testing.assert_array_equal(window.numpy(), window_again.numpy())
+
+        # the result is a copy of the cached window
+        expected = window.numpy()
+        window.scale_(0.0)
+        np.testing.assert_array_equal(
+            paddle.audio.functional.get_window('hann', 64).numpy(), expected
+        )
+        np.testing.assert_array_almost_equal(
+            paddle.audio.functional.get_window(('gaussian', 7), 64).numpy(),
+            signal.get_window(('gaussian', 7), 64),
+            decimal=5,
+        )
+
+    def test_fbank_and_dct_cached(self):
+        fbank = paddle.audio.functional.compute_fbank_matrix(16000, 512, 40)
+        np.testing.assert_array_almost_equal(
+            paddle.audio.functional.compute_fbank_matrix(
+                16000, 512, 40
+            ).numpy(),
+            fbank.numpy(),
+        )
+        np.testing.assert_array_almost_equal(
+            fbank.numpy(),
+            librosa.filters.mel(sr=16000, n_fft=512, n_mels=40),
+            decimal=5,
+        )
+        dct = paddle.audio.functional.create_dct(20, 40)
+        self.assertEqual(dct.shape, [40, 20])
+        np.testing.assert_array_equal(
+            paddle.audio.functional.create_dct(20, 40).numpy(), dct.numpy()
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
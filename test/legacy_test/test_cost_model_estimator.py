@@ -0,0 +1,114 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import paddle
+from paddle.cost_model import LatencyTable, estimate_cost
+from paddle.static import InputSpec
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.fc1 = paddle.nn.Linear(16, 32)
+        self.fc2 = paddle.nn.Linear(32, 8)
+
+    def forward(self, x):
+        return self.fc2(paddle.nn.functional.relu(self.fc1(x)))
+
+
+class TestEstimateCost(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_layer(self):
+        net = SimpleNet()
+        cost = estimate_cost(
+            net, [InputSpec([None, 16], 'float32')], batch_size=4
+        )
+        matmuls = [op for op in cost.ops if op.op_type == 'matmul']
+        self.assertEqual(
+            [op.flops for op in matmuls], [2 * 4 * 16 * 32, 2 * 4 * 32 * 8]
+        )
+        self.assertEqual(cost.parameter_memory, (16 * 32 + 32 + 32 * 8 + 8) * 4)
+        # the input and the output of fc1 are alive at the same time
+        self.assertGreaterEqual(cost.peak_memory, (4 * 16 + 4 * 32) * 4)
+        self.assertGreater(cost.latency, 0)
+        self.assertIn('matmul', cost.by_op_type())
+        self.assertIn('peak activation memory', cost.summary())
+
+        # the cost grows with the batch size
+        large = estimate_cost(
+            net, [InputSpec([None, 16], 'float32')], batch_size=64
+        )
+        self.assertEqual(large.flops, cost.flops * 16)
+        self.assertGreater(large.peak_memory, cost.peak_memory)
+
+    def test_program(self):
+        paddle.enable_static()
+        main_program = paddle.static.Program()
+        with paddle.static.program_guard(main_program):
+            x = paddle.static.data('x', [-1, 3, 32, 32], 'float32')
+            out = paddle.static.nn.conv2d(x, 8, 3, padding=1)
+            paddle.mean(out)
+        paddle.disable_static()
+        cost = estimate_cost(main_program, batch_size=2)
+        conv = [op for op in cost.ops if op.op_type == 'conv2d']
+        self.assertEqual(len(conv), 1)
+        self.assertEqual(conv[0].flops, 2 * 2 * 32 * 32 * 8 * 3 * 3 * 3)
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            estimate_cost(SimpleNet())
+        with self.assertRaises(ValueError):
+            estimate_cost(SimpleNet(), [InputSpec([None, 16])], batch_size=0)
+
+
+class TestLatencyTable(unittest.TestCase):
+    def test_fit(self):
+        coef = (1e-5, 2e-11, 1e-10)
+        sizes = [(1e6, 1e4), (1e8, 1e5), (1e9, 3e6), (5e7, 1e7)]
+        samples = [
+            ('matmul', f, b, coef[0] + f * coef[1] + b * coef[2])
+            for f, b in sizes
+        ]
+        table = LatencyTable().fit(samples)
+        for expected, actual in zip(coef, table.coefficients['matmul']):
+            self.assertAlmostEqual(actual / expected, 1.0, places=5)
+        self.assertAlmostEqual(
+            table.latency('matmul', 1e9, 0) / (coef[0] + 1e9 * coef[1]),
+            1.0,
+            places=5,
+        )
+
+    def test_save_and_load(self):
+        table = LatencyTable({'relu': (1e-6, 0.0, 1e-10)})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'latency.json')
+            table.save(path)
+            loaded = LatencyTable.load(path)
+        self.assertEqual(loaded.coefficients, table.coefficients)
+        self.assertEqual(loaded.default, table.default)
+
+    def test_calibrate(self):
+        table = LatencyTable().calibrate(repeat=2)
+        self.assertIn('matmul', table.coefficients)
+        self.assertGreater(table.latency('matmul', 1e9, 1e6), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,9 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
+import os
+import struct
+import tempfile
 import unittest
 
 from paddle.distributed import fleet
@@ -118,6 +121,15 @@ class MyMultiSlotDataGenerator_zip(fleet.MultiSlotDataGenerator):
         return data_iter
 
 
+class MyMultiSlotLineDataGenerator(fleet.MultiSlotDataGenerator):
+    def generate_sample(self, line):
+        def data_iter():
+            words = [int(x) for x in line.split()]
+            yield ("words", words), ("label", [0.5])
+
+        return data_iter
+
+
 class TestMultiSlotDataGenerator(unittest.TestCase):
     def test_MultiSlotDataGenerator_basic(self):
         my_ms_dg = MyMultiSlotDataGenerator()
@@ -186,5 +198,77 @@ class TestMultiSlotDataGeneratorZip(unittest.TestCase):
         my_ms_dg.run_from_memory()
 
 
+class TestMultiSlotDataGeneratorBinary(unittest.TestCase):
+    def test_gen_bytes(self):
+        my_ms_dg = MyMultiSlotDataGenerator()
+        my_ms_dg.set_binary(True)
+        data = my_ms_dg._gen([("words", [1, 2, 3, 4]), ("label", [0])])
+        expected = struct.pack("<H4Q", 4, 1, 2, 3, 4) + struct.pack("<HQ", 1, 0)
+        self.assertEqual(data, expected)
+        self.assertEqual(
+            my_ms_dg._proto_info, [("words", "uint64"), ("label", "uint64")]
+        )
+
+    def test_gen_bytes_float(self):
+        my_ms_dg = MyMultiSlotDataGenerator()
+        my_ms_dg.set_binary(True)
+        data = my_ms_dg._gen([("words", [1, 2]), ("label", [0.5])])
+        expected = struct.pack("<H2Q", 2, 1, 2) + struct.pack("<Hf", 1, 0.5)
+        self.assertEqual(data, expected)
+        with self.assertRaises(ValueError):
+            my_ms_dg._gen([("words", [1.5, 2]), ("label", [0.5])])
+
+    def test_gen_bytes_error(self):
+        with self.assertRaises(ValueError):
+            my_ms_dg = MyMultiSlotDataGenerator_error_5()
+            my_ms_dg.set_binary(True)
+            my_ms_dg.set_batch(1)
+            my_ms_dg.run_from_memory()
+
+
+class TestMultiSlotDataGeneratorRunFromFiles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filelist = []
+        for i in range(4):
+            filename = os.path.join(self.temp_dir.name, f"part-{i}")
+            with open(filename, "w") as f:
+                f.write("1 2 3\n4 5\n")
+            self.filelist.append(filename)
+        self.output_dir = os.path.join(self.temp_dir.name, "output")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_run_from_files_text(self):
+        my_ms_dg = MyMultiSlotLineDataGenerator()
+        output_files = my_ms_dg.run_from_files(
+            self.filelist, self.output_dir, num_workers=2
+        )
+        self.assertEqual(len(output_files), len(self.filelist))
+        for output_file in output_files:
+            with open(output_file) as f:
+                self.assertEqual(f.read(), "3 1 2 3 1 0.5\n2 4 5 1 0.5\n")
+        self.assertEqual(
+            my_ms_dg._proto_info, [("words", "uint64"), ("label", "float")]
+        )
+
+    def test_run_from_files_binary(self):
+        my_ms_dg = MyMultiSlotLineDataGenerator()
+        my_ms_dg.set_binary(True)
+        output_files = my_ms_dg.run_from_files(
+            self.filelist, self.output_dir, num_workers=2
+        )
+        expected = (
+            struct.pack("<H3Q", 3, 1, 2, 3)
+            + struct.pack("<Hf", 1, 0.5)
+            + struct.pack("<H2Q", 2, 4, 5)
+            + struct.pack("<Hf", 1, 0.5)
+        )
+        for output_file in output_files:
+            with open(output_file, "rb") as f:
+                self.assertEqual(f.read(), expected)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,132 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import (
+    DataLoader,
+    Dataset,
+    DistributedBatchSampler,
+    IterableDataset,
+)
+
+SAMPLE_NUM = 40
+BATCH_SIZE = 4
+
+
+class RandomTransformDataset(Dataset):
+    def __getitem__(self, idx):
+        noise = np.random.random([2]).astype('float32')
+        return np.array([idx], dtype='int64'), noise
+
+    def __len__(self):
+        return SAMPLE_NUM
+
+
+class RandomIterableDataset(IterableDataset):
+    def __iter__(self):
+        for i in range(SAMPLE_NUM):
+            yield np.array([i], dtype='int64')
+
+
+class TestDataLoaderState(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def build_loader(self, num_workers, persistent_workers=False):
+        dataset = RandomTransformDataset()
+        sampler = DistributedBatchSampler(
+            dataset, batch_size=BATCH_SIZE, shuffle=True
+        )
+        return DataLoader(
+            dataset,
+            batch_sampler=sampler,
+            num_workers=num_workers,
+            persistent_workers=persistent_workers,
+            sample_seed=2024 if num_workers > 0 else None,
+        )
+
+    def read_epoch(self, loader):
+        return [
+            (idx.numpy().flatten().tolist(), noise.numpy())
+            for idx, noise in loader
+        ]
+
+    def check_resume(self, num_workers, persistent_workers=False):
+        loader = self.build_loader(num_workers, persistent_workers)
+        self.read_epoch(loader)
+        expected = self.read_epoch(loader)
+
+        loader = self.build_loader(num_workers, persistent_workers)
+        self.read_epoch(loader)
+        for i, _ in enumerate(loader):
+            if i == 3:
+                state = loader.state_dict()
+                break
+        self.assertEqual(state["epoch"], 1)
+        self.assertEqual(state["num_yielded"], 4)
+
+        new_loader = self.build_loader(num_workers, persistent_workers)
+        new_loader.set_state_dict(state)
+        resumed = self.read_epoch(new_loader)
+
+        self.assertEqual(len(resumed), len(expected) - 4)
+        for (idx, noise), (expected_idx, expected_noise) in zip(
+            resumed, expected[4:]
+        ):
+            self.assertEqual(idx, expected_idx)
+            if num_workers > 0:
+                np.testing.assert_allclose(noise, expected_noise)
+
+        # the next epoch after resuming is the same as usual
+        self.assertEqual(new_loader._epoch, 2)
+
+    def test_single_process(self):
+        self.check_resume(num_workers=0)
+
+    def test_multi_process(self):
+        self.check_resume(num_workers=2)
+
+    def test_persistent_workers(self):
+        self.check_resume(num_workers=2, persistent_workers=True)
+
+    def test_sample_seed_independent_of_workers(self):
+        loader_1 = self.build_loader(num_workers=1)
+        loader_3 = self.build_loader(num_workers=3)
+        for (idx_1, noise_1), (idx_3, noise_3) in zip(
+            self.read_epoch(loader_1), self.read_epoch(loader_3)
+        ):
+            self.assertEqual(idx_1, idx_3)
+            np.testing.assert_allclose(noise_1, noise_3)
+
+    def test_errors(self):
+        dataset = RandomTransformDataset()
+        with self.assertRaises(ValueError):
+            DataLoader(dataset, num_workers=0, sample_seed=1)
+        with self.assertRaises(ValueError):
+            DataLoader(
+                RandomIterableDataset(),
+                batch_size=BATCH_SIZE,
+                num_workers=1,
+                sample_seed=1,
+            )
+        with self.assertRaises(ValueError):
+            DataLoader(dataset).set_state_dict({"epoch": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from paddle.utils.download import _DownloadCache
+
+FILES = {
+    "/small.pdparams": b"paddle" * 50,
+    "/large.pdparams": os.urandom(1000),
+    "/large_copy.pdparams": None,
+}
+FILES["/large_copy.pdparams"] = FILES["/large.pdparams"]
+
+
+class RangeHTTPRequestHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body_only):
+        data = FILES.get(self.path)
+        if data is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.requests.append((self.command, self.path, self.headers["Range"]))
+        range_header = self.headers["Range"]
+        if range_header:
+            start, end = range_header[len("bytes=") :].split("-")
+            start = int(start)
+            end = int(end) if end else len(data) - 1
+            if start >= len(data):
+                self.send_response(416)
+                self.end_headers()
+                return
+            data = data[start : end + 1]
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if not body_only:
+            self.wfile.write(data)
+
+    def do_HEAD(self):
+        self._send(body_only=True)
+
+    def do_GET(self):
+        self._send(body_only=False)
+
+
+class TestDownloadCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), RangeHTTPRequestHandler
+        )
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = _DownloadCache(
+            self.temp_dir.name,
+            num_workers=4,
+            chunk_size=128,
+            parallel_min_size=512,
+        )
+        RangeHTTPRequestHandler.requests = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_stream_fetch(self):
+        data = FILES["/small.pdparams"]
+        md5sum = hashlib.md5(data).hexdigest()
+        url = self.base_url + "/small.pdparams"
+        blob = self.cache.fetch(url, md5sum)
+        self.assertEqual(os.path.basename(blob), md5sum)
+        self.assertEqual(self._read(blob), data)
+
+        # hit the cache without any request
+        RangeHTTPRequestHandler.requests = []
+        self.assertEqual(self.cache.fetch(url), blob)
+        self.assertEqual(self.cache.fetch(url, md5sum), blob)
+        self.assertEqual(RangeHTTPRequestHandler.requests, [])
+
+    def test_range_fetch_and_dedup(self):
+        data = FILES["/large.pdparams"]
+        md5sum = hashlib.md5(data).hexdigest()
+        blob = self.cache.fetch(self.base_url + "/large.pdparams")
+        self.assertEqual(self._read(blob), data)
+        ranges = [
+            r for m, _, r in RangeHTTPRequestHandler.requests if m == "GET"
+        ]
+        self.assertEqual(len(ranges), 8)
+
+        # the same content from another url is stored once
+        blob_copy = self.cache.fetch(
+            self.base_url + "/large_copy.pdparams", force=True
+        )
+        self.assertEqual(blob_copy, blob)
+        self.assertEqual(
+            os.listdir(os.path.join(self.temp_dir.name, "blobs")), [md5sum]
+        )
+
+    def test_resume(self):
+        data = FILES["/small.pdparams"]
+        url = self.base_url + "/small.pdparams"
+        tmp_path = os.path.join(
+            self.temp_dir.name, "tmp", self.cache._key(url) + ".part"
+        )
+        with open(tmp_path, "wb") as f:
+            f.write(data[:100])
+        blob = self.cache.fetch(url)
+        self.assertEqual(self._read(blob), data)
+        self.assertIn(
+            ("GET", "/small.pdparams", "bytes=100-"),
+            RangeHTTPRequestHandler.requests,
+        )
+
+    def test_resume_from_empty_partial_file(self):
+        data = FILES["/small.pdparams"]
+        url = self.base_url + "/small.pdparams"
+        tmp_path = os.path.join(
+            self.temp_dir.name, "tmp", self.cache._key(url) + ".part"
+        )
+        open(tmp_path, "wb").close()
+        blob = self.cache.fetch(url)
+        self.assertEqual(self._read(blob), data)
+        self.assertIn(
+            ("GET", "/small.pdparams", None),
+            RangeHTTPRequestHandler.requests,
+        )
+
+    def test_fetch_errors(self):
+        with self.assertRaises(RuntimeError):
+            self.cache.fetch(
+                self.base_url + "/small.pdparams",
+                "8ff74f291f72533f2a7956a4eftttttt",
+            )
+        url = self.base_url + "/not_exist.pdparams"
+        tmp_path = os.path.join(
+            self.temp_dir.name, "tmp", self.cache._key(url) + ".part"
+        )
+        with open(tmp_path, "wb") as f:
+            f.write(b"paddle")
+        with self.assertRaises(RuntimeError):
+            self.cache.fetch(url)
+        self.assertFalse(os.path.exists(tmp_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
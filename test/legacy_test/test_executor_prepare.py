@@ -0,0 +1,106 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.pir_utils import test_with_pir_api
+
+
+class TestExecutorPrepare(unittest.TestCase):
+    def setUp(self):
+        paddle.enable_static()
+
+    def tearDown(self):
+        paddle.disable_static()
+
+    def build_program(self):
+        main_program = paddle.static.Program()
+        startup_program = paddle.static.Program()
+        with paddle.static.program_guard(main_program, startup_program):
+            x = paddle.static.data(name='x', shape=[None, 4], dtype='float32')
+            y = paddle.static.data(name='y', shape=[None, 4], dtype='float32')
+            out = paddle.static.nn.fc(x + y, 3)
+        return main_program, startup_program, out
+
+    @test_with_pir_api
+    def test_same_as_run(self):
+        main_program, startup_program, out = self.build_program()
+        scope = paddle.static.Scope()
+        exe = paddle.static.Executor(paddle.CPUPlace())
+        with paddle.static.scope_guard(scope):
+            exe.run(startup_program)
+            prepared = exe.prepare(
+                main_program, ['x', 'y'], fetch_list=[out], scope=scope
+            )
+            self.assertEqual(prepared.feed_names, ['x', 'y'])
+            for batch_size in [1, 5, 5]:
+                x = np.random.random([batch_size, 4]).astype('float32')
+                y = np.random.random([batch_size, 4]).astype('float32')
+                (expected,) = exe.run(
+                    main_program, feed={'x': x, 'y': y}, fetch_list=[out]
+                )
+                (by_dict,) = prepared.run({'x': x, 'y': y})
+                (by_list,) = prepared.run([x, y])
+                np.testing.assert_allclose(by_dict, expected, rtol=1e-6)
+                np.testing.assert_allclose(by_list, expected, rtol=1e-6)
+
+    @test_with_pir_api
+    def test_invalid_feed(self):
+        main_program, startup_program, out = self.build_program()
+        scope = paddle.static.Scope()
+        exe = paddle.static.Executor(paddle.CPUPlace())
+        with paddle.static.scope_guard(scope):
+            exe.run(startup_program)
+            prepared = exe.prepare(
+                main_program, ['x', 'y'], fetch_list=[out], scope=scope
+            )
+            x = np.random.random([2, 4]).astype('float32')
+            with self.assertRaises(ValueError):
+                prepared.run({'x': x})
+            with self.assertRaises(ValueError):
+                prepared.run([x])
+            with self.assertRaises(ValueError):
+                prepared.run([x, np.random.random([2, 3]).astype('float32')])
+
+    def test_cache_info(self):
+        main_program, startup_program, out = self.build_program()
+        scope = paddle.static.Scope()
+        exe = paddle.static.Executor(paddle.CPUPlace())
+        exe.set_cache_size(1)
+        feed = {
+            'x': np.ones([2, 4], dtype='float32'),
+            'y': np.ones([2, 4], dtype='float32'),
+        }
+        with paddle.static.scope_guard(scope):
+            exe.run(startup_program)
+            exe.run(main_program, feed=feed, fetch_list=[out])
+            exe.run(main_program, feed=feed, fetch_list=[out])
+            info = exe.cache_info()
+            self.assertEqual(info.maxsize, 1)
+            self.assertEqual(info.hits, 1)
+            self.assertEqual(info.misses, 2)
+            self.assertEqual(info.currsize, 1)
+
+        exe.set_cache_size(4)
+        info = exe.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+        with self.assertRaises(ValueError):
+            exe.set_cache_size(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+class TestMessagePassingPlan(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        np.random.seed(2024)
+        # node 7 and 8 have no incoming edges
+        self.num_nodes = 9
+        self.src_index = np.random.randint(0, 9, size=[40]).astype("int64")
+        self.dst_index = np.random.randint(0, 7, size=[40]).astype("int64")
+        self.x = np.random.rand(9, 4).astype("float32")
+        self.y = np.random.rand(40, 4).astype("float32")
+        self.plan = paddle.geometric.MessagePassingPlan(
+            paddle.to_tensor(self.src_index),
+            paddle.to_tensor(self.dst_index),
+            num_nodes=self.num_nodes,
+        )
+
+    def test_layout(self):
+        np.testing.assert_array_equal(
+            self.plan.in_degree.numpy(),
+            np.bincount(self.dst_index, minlength=9),
+        )
+        sorted_dst = self.plan.sorted_dst_index.numpy()
+        np.testing.assert_array_equal(sorted_dst, np.sort(self.dst_index))
+        perm = self.plan.perm.numpy()
+        np.testing.assert_array_equal(self.dst_index[perm], sorted_dst)
+        np.testing.assert_array_equal(
+            self.plan.sorted_src_index.numpy(), self.src_index[perm]
+        )
+        offsets = self.plan.dst_offsets.numpy()
+        np.testing.assert_array_equal(
+            offsets, np.searchsorted(sorted_dst, np.arange(10))
+        )
+        plan = paddle.geometric.MessagePassingPlan(
+            paddle.to_tensor(self.src_index), paddle.to_tensor(self.dst_index)
+        )
+        self.assertEqual(plan.num_nodes, self.dst_index.max() + 1)
+
+    def test_send_u_recv(self):
+        src_index = paddle.to_tensor(self.src_index)
+        dst_index = paddle.to_tensor(self.dst_index)
+        for reduce_op in ["sum", "mean", "max", "min"]:
+            for dtype in ["float32", "int64"]:
+                x = paddle.to_tensor((self.x * 10).astype(dtype))
+                expect = paddle.geometric.send_u_recv(
+                    x, src_index, dst_index, reduce_op, out_size=9
+                )
+                out = self.plan.send_u_recv(x, reduce_op)
+                np.testing.assert_allclose(
+                    out.numpy(), expect.numpy(), rtol=1e-5
+                )
+
+    def test_send_ue_recv(self):
+        x = paddle.to_tensor(self.x)
+        y = paddle.to_tensor(self.y)
+        src_index = paddle.to_tensor(self.src_index)
+        dst_index = paddle.to_tensor(self.dst_index)
+        sorted_y = self.plan.sort_edges(y)
+        for message_op in ["add", "sub", "mul", "div"]:
+            for reduce_op in ["sum", "mean", "max", "min"]:
+                expect = paddle.geometric.send_ue_recv(
+                    x, y, src_index, dst_index, message_op, reduce_op, 9
+                )
+                out = self.plan.send_ue_recv(x, y, message_op, reduce_op)
+                np.testing.assert_allclose(
+                    out.numpy(), expect.numpy(), rtol=1e-5
+                )
+                out = self.plan.send_ue_recv(
+                    x, sorted_y, message_op, reduce_op, edges_sorted=True
+                )
+                np.testing.assert_allclose(
+                    out.numpy(), expect.numpy(), rtol=1e-5
+                )
+
+    def test_send_uv(self):
+        x = paddle.to_tensor(self.x)
+        y = paddle.to_tensor(self.x)
+        expect = paddle.geometric.send_uv(
+            x,
+            y,
+            paddle.to_tensor(self.src_index),
+            paddle.to_tensor(self.dst_index),
+            "mul",
+        )
+        np.testing.assert_allclose(
+            self.plan.send_uv(x, y, "mul").numpy(), expect.numpy()
+        )
+        np.testing.assert_allclose(
+            self.plan.send_uv(x, y, "mul", edges_sorted=True).numpy(),
+            self.plan.sort_edges(expect).numpy(),
+        )
+
+    def test_nodes_without_edges(self):
+        # node 1 is between the destinations, node 4 is after them
+        src_index = paddle.to_tensor([0, 1, 2, 3, 3], dtype="int64")
+        dst_index = paddle.to_tensor([2, 0, 0, 3, 2], dtype="int64")
+        x = paddle.to_tensor(-self.x[:5])
+        plan = paddle.geometric.MessagePassingPlan(
+            src_index, dst_index, num_nodes=5
+        )
+        for reduce_op in ["sum", "mean", "max", "min"]:
+            expect = paddle.geometric.send_u_recv(
+                x, src_index, dst_index, reduce_op, out_size=5
+            )
+            out = plan.send_u_recv(x, reduce_op)
+            np.testing.assert_allclose(out.numpy(), expect.numpy(), rtol=1e-5)
+
+    def test_mean_grad(self):
+        x = paddle.to_tensor(self.x, stop_gradient=False)
+        out = paddle.geometric.send_u_recv(
+            x,
+            paddle.to_tensor(self.src_index),
+            paddle.to_tensor(self.dst_index),
+            "mean",
+            out_size=9,
+        )
+        (expect_grad,) = paddle.grad(out.sum(), x)
+        out = self.plan.send_u_recv(x, "mean")
+        (grad,) = paddle.grad(out.sum(), x)
+        np.testing.assert_allclose(grad.numpy(), expect_grad.numpy(), rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+
+class NodeDataset(Dataset):
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def __getitem__(self, idx):
+        return self.nodes[idx]
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+class TestNeighborSampler(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        np.random.seed(2024)
+        self.num_nodes = 50
+        edges = np.random.randint(self.num_nodes, size=(300, 2))
+        self.edges = np.unique(edges, axis=0).astype("int64")
+        self.edge_set = {tuple(e) for e in self.edges}
+        self.node_feat = np.random.rand(self.num_nodes, 3).astype("float32")
+        self.input_nodes = np.array([0, 7, 12, 33], dtype="int64")
+
+    def check_subgraph(self, subgraph, input_nodes, sample_sizes):
+        nodes = subgraph.nodes.numpy()
+        np.testing.assert_array_equal(nodes[: len(input_nodes)], input_nodes)
+        self.assertEqual(len(np.unique(nodes)), len(nodes))
+        self.assertEqual(len(subgraph.edges), len(sample_sizes))
+        num_dst = len(input_nodes)
+        for (src, dst), sample_size in zip(subgraph.edges, sample_sizes):
+            src, dst = src.numpy(), dst.numpy()
+            # every hop samples for the nodes reached by the previous hops
+            self.assertTrue(np.all(dst < num_dst))
+            counts = np.bincount(dst, minlength=num_dst)
+            self.assertTrue(np.all(counts <= sample_size))
+            for s, d in zip(nodes[src], nodes[dst]):
+                self.assertIn((s, d), self.edge_set)
+            num_dst = len(np.unique(np.concatenate([np.arange(num_dst), src])))
+        np.testing.assert_allclose(subgraph.feat.numpy(), self.node_feat[nodes])
+
+    def test_sample(self):
+        for node_feat in [self.node_feat, paddle.to_tensor(self.node_feat)]:
+            sampler = paddle.geometric.NeighborSampler.from_edges(
+                self.edges, self.num_nodes, [3, 2], node_feat=node_feat
+            )
+            subgraph = sampler.sample(self.input_nodes)
+            self.assertIsNone(subgraph.eids)
+            self.check_subgraph(subgraph, self.input_nodes, [3, 2])
+
+    def test_weighted_sample_with_eids(self):
+        edge_weight = np.random.rand(len(self.edges)).astype("float32")
+        sampler = paddle.geometric.NeighborSampler.from_edges(
+            self.edges,
+            self.num_nodes,
+            [4, 4],
+            edge_weight=edge_weight,
+            node_feat=self.node_feat,
+            return_eids=True,
+        )
+        subgraph = sampler.sample(paddle.to_tensor(self.input_nodes))
+        self.check_subgraph(subgraph, self.input_nodes, [4, 4])
+        nodes = subgraph.nodes.numpy()
+        for (src, dst), eids in zip(subgraph.edges, subgraph.eids):
+            np.testing.assert_array_equal(
+                self.edges[eids.numpy()],
+                np.stack([nodes[src.numpy()], nodes[dst.numpy()]], axis=1),
+            )
+
+    def test_save_load_mmap(self):
+        sampler = paddle.geometric.NeighborSampler.from_edges(
+            self.edges, self.num_nodes, [2], node_feat=self.node_feat
+        )
+        with tempfile.TemporaryDirectory() as path:
+            sampler.save(os.path.join(path, "graph"))
+            loaded = paddle.geometric.NeighborSampler.load(
+                os.path.join(path, "graph"), [-1, 2]
+            )
+            self.assertIsInstance(loaded.node_feat, np.memmap)
+            np.testing.assert_array_equal(
+                loaded.colptr.numpy(), sampler.colptr.numpy()
+            )
+            self.check_subgraph(
+                loaded.sample(self.input_nodes), self.input_nodes, [100, 2]
+            )
+            del loaded
+
+    def test_batches(self):
+        sampler = paddle.geometric.NeighborSampler.from_edges(
+            self.edges, self.num_nodes, [2, 2], node_feat=self.node_feat
+        )
+        all_nodes = np.arange(self.num_nodes, dtype="int64")
+        for prefetch in [0, 2]:
+            seen = []
+            for subgraph in sampler.batches(
+                all_nodes, batch_size=16, shuffle=True, prefetch=prefetch
+            ):
+                batch = subgraph.nodes.numpy()[: min(16, 50 - len(seen))]
+                seen.extend(batch.tolist())
+                self.check_subgraph(subgraph, batch, [2, 2])
+            self.assertEqual(sorted(seen), all_nodes.tolist())
+
+        # stop early, the background thread should exit
+        for subgraph in sampler.batches(all_nodes, batch_size=4, prefetch=1):
+            break
+        batches = list(
+            sampler.batches(all_nodes, batch_size=16, drop_last=True)
+        )
+        self.assertEqual(len(batches), 3)
+
+    def test_collate_fn(self):
+        sampler = paddle.geometric.NeighborSampler.from_edges(
+            self.edges, self.num_nodes, [2, 2], node_feat=self.node_feat
+        )
+        loader = DataLoader(
+            NodeDataset(np.arange(self.num_nodes, dtype="int64")),
+            batch_size=8,
+            collate_fn=sampler,
+        )
+        num_batches = 0
+        # DataLoader returns the fields of SampledSubgraph as a list
+        for nodes, edges, _, feat in loader:
+            num_batches += 1
+            self.assertEqual(len(edges), 2)
+            np.testing.assert_allclose(
+                feat.numpy(), self.node_feat[nodes.numpy()]
+            )
+        self.assertEqual(num_batches, 7)
+
+    def test_errors(self):
+        row = np.array([1, 0], dtype="int64")
+        colptr = np.array([0, 1, 2], dtype="int64")
+        with self.assertRaises(ValueError):
+            paddle.geometric.NeighborSampler(row, colptr, [2], return_eids=True)
+        with self.assertRaises(ValueError):
+            paddle.geometric.NeighborSampler(row, colptr, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
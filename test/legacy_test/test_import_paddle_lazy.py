@@ -0,0 +1,55 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import unittest
+
+LAZY_SUBMODULES = ['audio', 'onnx', 'quantization', 'sparse', 'text', 'vision']
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestLazySubmodules(unittest.TestCase):
+    def test_not_imported_by_default(self):
+        proc = run_python(
+            'import sys, paddle\n'
+            f'print([m for m in {LAZY_SUBMODULES!r} '
+            'if "paddle." + m in sys.modules])'
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(proc.stdout.strip(), '[]')
+
+    def test_attribute_access(self):
+        import paddle
+
+        for name in LAZY_SUBMODULES:
+            module = getattr(paddle, name)
+            self.assertEqual(module.__name__, f'paddle.{name}')
+            self.assertIs(module, sys.modules[f'paddle.{name}'])
+            self.assertIn(name, dir(paddle))
+
+        self.assertTrue(hasattr(paddle.vision, 'transforms'))
+        with self.assertRaises(AttributeError):
+            paddle.not_a_submodule  # noqa: B018
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.inference import BatchingServer, Config, create_predictor
+
+
+class TestNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.fc = paddle.nn.Linear(4, 3)
+
+    def forward(self, x):
+        return paddle.nn.functional.relu(self.fc(x))
+
+
+class TestBatchingServer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'batching/inference')
+        net = paddle.jit.to_static(
+            TestNet(),
+            input_spec=[
+                paddle.static.InputSpec(shape=[None, 4], dtype='float32')
+            ],
+            full_graph=True,
+        )
+        paddle.jit.save(net, self.path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_config(self):
+        if os.path.exists(self.path + '.json'):
+            model_file = self.path + '.json'
+        else:
+            model_file = self.path + '.pdmodel'
+        config = Config(model_file, self.path + '.pdiparams')
+        config.disable_gpu()
+        return config
+
+    def predict_one(self, predictor, x):
+        handle = predictor.get_input_handle(predictor.get_input_names()[0])
+        handle.reshape(x.shape)
+        handle.copy_from_cpu(x)
+        predictor.run()
+        output = predictor.get_output_handle(predictor.get_output_names()[0])
+        return output.copy_to_cpu()
+
+    def test_concurrent_requests(self):
+        predictor = create_predictor(self.create_config())
+        inputs = [
+            np.random.random([i % 3 + 1, 4]).astype('float32')
+            for i in range(32)
+        ]
+        expected = [self.predict_one(predictor, x) for x in inputs]
+
+        results = [None] * len(inputs)
+        with BatchingServer(
+            self.create_config(),
+            num_workers=2,
+            max_batch_size=8,
+            max_delay_ms=5,
+        ) as server:
+
+            def client(start):
+                for i in range(start, len(inputs), 4):
+                    results[i] = server.submit(inputs[i])
+
+            threads = [
+                threading.Thread(target=client, args=(i,)) for i in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for future, out in zip(results, expected):
+                (result,) = future.result()
+                np.testing.assert_allclose(result, out, rtol=1e-5, atol=1e-6)
+
+            metrics = server.metrics()
+            self.assertEqual(metrics['requests'], len(inputs))
+            self.assertEqual(metrics['errors'], 0)
+            self.assertLessEqual(metrics['batches'], len(inputs))
+            self.assertGreaterEqual(metrics['avg_batch_size'], 1.0)
+            self.assertGreaterEqual(
+                metrics['latency_ms']['p99'], metrics['latency_ms']['p50']
+            )
+        self.assertFalse(server.running)
+
+    def test_invalid_inputs(self):
+        server = BatchingServer(self.create_config())
+        with self.assertRaises(ValueError):
+            server.submit({'not_an_input': np.ones([1, 4], dtype='float32')})
+        with self.assertRaises(ValueError):
+            server.submit([np.ones([1, 4]), np.ones([1, 4])])
+        with self.assertRaises(ValueError):
+            BatchingServer(self.create_config(), max_batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -212,5 +212,66 @@ class TestXavierUniform(TestUniform):
         self.b_initializer = XavierUniform()
 
 
+class RaiseInitializer(Constant):
+    def forward(self, var, block=None):
+        raise AssertionError("initializer should not be run")
+
+
+class TestLazySetStateDict(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        unique_name.dygraph_parameter_name_checker._name_set = set()
+
+    def test_set_state_dict(self):
+        with LazyGuard():
+            base_model = Linear(
+                10,
+                10,
+                weight_attr=paddle.ParamAttr(initializer=RaiseInitializer()),
+                bias_attr=paddle.ParamAttr(initializer=RaiseInitializer()),
+            )
+            model = NestModel(base_model)
+
+        state_dict = {
+            'base_model.weight': np.random.random([10, 10]).astype('float32'),
+            'base_model.bias': np.random.random([10]).astype('float32'),
+            'fc.weight': paddle.rand([10, 10]),
+        }
+        missing_keys, unexpected_keys = model.set_state_dict(state_dict)
+        self.assertEqual(missing_keys, ['fc.bias'])
+        self.assertEqual(unexpected_keys, [])
+
+        np.testing.assert_array_equal(
+            model.base_model.weight.numpy(), state_dict['base_model.weight']
+        )
+        np.testing.assert_array_equal(
+            model.base_model.bias.numpy(), state_dict['base_model.bias']
+        )
+        np.testing.assert_array_equal(
+            model.fc.weight.numpy(), state_dict['fc.weight'].numpy()
+        )
+        # the loaded parameters won't be initialized again
+        self.assertIsNone(model.base_model.weight._init_func)
+        self.assertIsNone(model.base_model.bias._init_func)
+        for param in model.base_model.parameters():
+            param.initialize()
+        np.testing.assert_array_equal(
+            model.base_model.weight.numpy(), state_dict['base_model.weight']
+        )
+        # the parameter not in state_dict is still lazy
+        self.assertFalse(model.fc.bias._is_initialized())
+        model.fc.bias.initialize()
+
+        out = model(paddle.randn([2, 10]))
+        self.assertEqual(out.shape, [2, 10])
+
+    def test_shape_mismatch(self):
+        with LazyGuard():
+            model = Linear(10, 10)
+        with self.assertWarns(UserWarning):
+            model.set_state_dict({'weight': np.ones([10, 4], 'float32')})
+        self.assertFalse(model.weight._is_initialized())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -250,6 +250,94 @@ class TestRecall(unittest.TestCase):
         self.assertEqual(m.accumulate(), 0.0)
 
 
+class TestConfusionMetrics(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2024)
+        self.num_classes = 5
+        self.scores = np.random.rand(200, self.num_classes).astype('float32')
+        self.labels = np.random.randint(0, self.num_classes, (200, 1))
+
+    def per_class(self):
+        pred = self.scores.argmax(-1)
+        label = self.labels.reshape(-1)
+        precision, recall = [], []
+        for c in range(self.num_classes):
+            tp = np.sum((pred == c) & (label == c))
+            precision.append(tp / max(np.sum(pred == c), 1))
+            recall.append(tp / max(np.sum(label == c), 1))
+        return precision, recall, np.mean(pred == label)
+
+    def test_multi_class(self):
+        precision, recall, acc = self.per_class()
+        for metric, expect in [
+            (paddle.metric.Precision, precision),
+            (paddle.metric.Recall, recall),
+        ]:
+            m = metric(num_classes=self.num_classes, average=None)
+            m.update(self.scores, self.labels)
+            np.testing.assert_allclose(m.accumulate(), expect)
+
+            m = metric(num_classes=self.num_classes)
+            m.update(self.scores, self.labels)
+            self.assertAlmostEqual(m.accumulate(), np.mean(expect))
+
+            m = metric(num_classes=self.num_classes, average='micro')
+            m.update(self.scores, self.labels)
+            self.assertAlmostEqual(m.accumulate(), acc)
+
+    def test_tensor(self):
+        precision, recall, _ = self.per_class()
+        for metric, expect in [
+            (paddle.metric.Precision, precision),
+            (paddle.metric.Recall, recall),
+        ]:
+            m = metric(num_classes=self.num_classes, average=None)
+            for i in range(0, 200, 64):
+                m.update(
+                    paddle.to_tensor(self.scores[i : i + 64]),
+                    paddle.to_tensor(self.labels[i : i + 64]),
+                )
+            self.assertIsInstance(m.state()['tp'], paddle.Tensor)
+            np.testing.assert_allclose(m.accumulate(), expect, rtol=1e-6)
+
+    def test_multi_label(self):
+        preds = np.random.rand(100, 3)
+        labels = np.random.randint(0, 2, (100, 3))
+        m = paddle.metric.Precision(
+            num_classes=3, multi_label=True, average=None
+        )
+        m.update(paddle.to_tensor(preds), labels)
+        for c in range(3):
+            m_c = paddle.metric.Precision()
+            m_c.update(preds[:, c], labels[:, c])
+            self.assertAlmostEqual(m.accumulate()[c], m_c.accumulate())
+
+    def test_merge(self):
+        for metric in [paddle.metric.Precision, paddle.metric.Recall]:
+            full = metric(num_classes=self.num_classes)
+            full.update(self.scores, self.labels)
+            states = []
+            for i in range(0, 200, 50):
+                m = metric(num_classes=self.num_classes)
+                m.update(self.scores[i : i + 50], self.labels[i : i + 50])
+                states.append(m.state())
+            m.reset()
+            for state in states:
+                m.merge(state)
+            self.assertAlmostEqual(m.accumulate(), full.accumulate())
+
+        x = paddle.to_tensor(self.scores)
+        y = paddle.to_tensor(self.labels)
+        full = paddle.metric.Accuracy(topk=(1, 2))
+        full.update(full.compute(x, y))
+        m = paddle.metric.Accuracy(topk=(1, 2))
+        m.update(m.compute(x[:100], y[:100]))
+        other = paddle.metric.Accuracy(topk=(1, 2))
+        other.update(other.compute(x[100:], y[100:]))
+        m.merge(other.state())
+        np.testing.assert_allclose(m.accumulate(), full.accumulate())
+
+
 class TestAuc(unittest.TestCase):
     def test_auc_numpy(self):
         x = np.array(
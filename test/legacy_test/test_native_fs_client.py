@@ -0,0 +1,144 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+import unittest
+
+from paddle.distributed.fleet.utils.fs import (
+    FSFileExistsError,
+    FSFileNotExistsError,
+    LocalFSBackend,
+    NativeFSClient,
+)
+
+
+class NativeFSClientTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        # a small chunk size to exercise the parallel byte range download
+        self.fs = NativeFSClient(LocalFSBackend(), num_threads=4, chunk_size=7)
+
+    def tearDown(self):
+        self.fs.close()
+        self.temp_dir.cleanup()
+
+    def _path(self, *names):
+        return os.path.join(self.root, *names)
+
+    def _make_local_dir(self):
+        local_dir = self._path("local")
+        os.makedirs(os.path.join(local_dir, "sub"))
+        with open(os.path.join(local_dir, "a"), "w") as f:
+            f.write("hello world 1234567890")
+        with open(os.path.join(local_dir, "sub", "b"), "w") as f:
+            f.write("xyz")
+        return local_dir
+
+    def test_dirs(self):
+        dir_path = self._path("test_dir")
+        self.assertFalse(self.fs.is_exist(dir_path))
+        self.fs.mkdirs(dir_path)
+        self.assertTrue(self.fs.is_exist(dir_path))
+        self.assertTrue(self.fs.is_dir(dir_path))
+        self.assertFalse(self.fs.is_file(dir_path))
+
+        new_dir_path = self._path("new_test_dir")
+        with self.assertRaises(FSFileNotExistsError):
+            self.fs.mv(new_dir_path, dir_path)
+        self.fs.mv(dir_path, new_dir_path)
+        self.assertFalse(self.fs.is_exist(dir_path))
+        self.assertTrue(self.fs.is_exist(new_dir_path))
+
+        self.fs.mkdirs(dir_path)
+        with self.assertRaises(FSFileExistsError):
+            self.fs.mv(dir_path, new_dir_path)
+        self.fs.mv(dir_path, new_dir_path, overwrite=True)
+        self.assertFalse(self.fs.is_exist(dir_path))
+
+        self.fs.delete(new_dir_path)
+        self.assertFalse(self.fs.is_exist(new_dir_path))
+        self.assertEqual(self.fs.ls_dir(new_dir_path), ([], []))
+
+    def test_touch_and_cat(self):
+        file_path = self._path("test_file")
+        self.fs.touch(file_path)
+        self.assertTrue(self.fs.is_file(file_path))
+        self.assertEqual(self.fs.cat(file_path), "")
+        with self.assertRaises(FSFileExistsError):
+            self.fs.touch(file_path, exist_ok=False)
+
+        local_dir = self._make_local_dir()
+        self.assertEqual(
+            self.fs.cat(os.path.join(local_dir, "a")), "hello world 1234567890"
+        )
+        self.assertEqual(
+            self.fs.read_range(os.path.join(local_dir, "a"), 6, 5), b"world"
+        )
+
+    def test_upload_download(self):
+        local_dir = self._make_local_dir()
+        remote_dir = self._path("remote")
+        self.fs.upload(local_dir, remote_dir)
+        self.assertEqual(self.fs.ls_dir(remote_dir), (["sub"], ["a"]))
+        self.assertEqual(self.fs.list_dirs(remote_dir), ["sub"])
+
+        infos = self.fs.list_files_info(
+            [remote_dir, self._path("remote", "sub", "b")]
+        )
+        self.assertEqual(
+            sorted((os.path.basename(i['path']), i['size']) for i in infos),
+            [("a", 22), ("b", 3)],
+        )
+
+        download_dir = self._path("download")
+        self.fs.download(remote_dir, download_dir)
+        with open(os.path.join(download_dir, "a")) as f:
+            self.assertEqual(f.read(), "hello world 1234567890")
+        with open(os.path.join(download_dir, "sub", "b")) as f:
+            self.assertEqual(f.read(), "xyz")
+
+        with self.assertRaises(FSFileNotExistsError):
+            self.fs.download(self._path("not_exist"), download_dir)
+
+        self.fs.upload_dir(local_dir, self._path("remote"), overwrite=True)
+        self.assertTrue(self.fs.is_file(self._path("remote", "local", "a")))
+
+    def test_permanent_errors(self):
+        file_path = self._path("test_file")
+        self.fs.touch(file_path)
+        # not retried until the timeout
+        start = time.time()
+        with self.assertRaises(NotADirectoryError):
+            self.fs.ls_dir(file_path)
+        self.assertLess(time.time() - start, 10)
+
+        local_dir = self._make_local_dir()
+        with self.assertRaises(OSError):
+            LocalFSBackend().delete(local_dir, recursive=False)
+        self.assertTrue(self.fs.is_dir(local_dir))
+
+    def test_close(self):
+        local_dir = self._make_local_dir()
+        self.fs.upload(local_dir, self._path("remote"))
+        self.fs.close()
+        self.assertIsNone(self.fs._pool)
+        self.fs.download(self._path("remote"), self._path("download"))
+        self.assertTrue(os.path.isfile(self._path("download", "sub", "b")))
+
+
+if __name__ == '__main__':
+    unittest.main()
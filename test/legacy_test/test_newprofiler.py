@@ -414,5 +414,51 @@ class TestTimerOnly(unittest.TestCase):
         p.stop()
 
 
+class TestTimerSampling(unittest.TestCase):
+    def test_sampling(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        dump_path = os.path.join(temp_dir.name, 'sampling.jsonl')
+        benchmark = profiler.timer.benchmark()
+        benchmark.enable_sampling(
+            interval=5, window=8, top_k=2, dump_interval=10, dump_path=dump_path
+        )
+        x = paddle.to_tensor(np.random.randn(10, 10))
+        y = paddle.to_tensor(np.random.randn(10, 10))
+        p = profiler.Profiler(timer_only=True)
+        p.start()
+        for i in range(20):
+            out = paddle.matmul(x, y) + y
+            p.step()
+        stats = benchmark.sampling_stats()
+        p.stop()
+        benchmark.disable_sampling()
+
+        self.assertEqual(stats['num_steps'], 20)
+        # steps 6, 11 and 16 are sampled, 20 is sampled after stop
+        self.assertEqual(stats['num_op_samples'], 3)
+        self.assertEqual(len(benchmark.sampling_stats()), 0)
+        step_cost = stats['step_cost']
+        self.assertLessEqual(step_cost['min'], step_cost['p50'])
+        self.assertLessEqual(step_cost['p50'], step_cost['p99'])
+        self.assertLessEqual(step_cost['p99'], step_cost['max'])
+        self.assertLessEqual(len(stats['ops']), 2)
+        with open(dump_path) as f:
+            lines = f.readlines()
+        # dumped at step 10, 20 and stop
+        self.assertEqual(len(lines), 3)
+        temp_dir.cleanup()
+
+    def test_rolling_window(self):
+        hook = profiler.timer.SamplingHook(interval=0, window=4)
+        for cost in [100.0, 1.0, 2.0, 3.0, 4.0]:
+            hook.step_costs.append(cost)
+        stats = hook.stats()['step_cost']
+        self.assertEqual(stats['max'], 4.0)
+        self.assertEqual(stats['min'], 1.0)
+        self.assertAlmostEqual(stats['p50'], 2.5)
+        self.assertAlmostEqual(stats['avg'], 2.5)
+        self.assertFalse(hook.need_op_sample())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -142,6 +142,78 @@ class TestOpsNMS(unittest.TestCase):
                     err_msg=f'paddle out: {out}\n py out: {out_py}\n',
                 )
 
+    def test_batched_multiclass_nms_dynamic(self):
+        boxes_nums = [20, 0, 31, 13]
+        for device in self.devices:
+            for dtype in self.dtypes:
+                boxes, scores, category_idxs, categories = gen_args(
+                    sum(boxes_nums), dtype
+                )
+                paddle.set_device(device)
+                out, out_num = paddle.vision.ops.nms(
+                    paddle.to_tensor(boxes),
+                    self.threshold,
+                    paddle.to_tensor(scores),
+                    paddle.to_tensor(category_idxs),
+                    categories,
+                    5,
+                    boxes_num=paddle.to_tensor(boxes_nums, dtype='int64'),
+                )
+
+                out_py = []
+                out_num_py = []
+                start = 0
+                for num in boxes_nums:
+                    end = start + num
+                    keep = (
+                        multiclass_nms(
+                            boxes[start:end],
+                            scores[start:end],
+                            category_idxs[start:end],
+                            self.threshold,
+                            5,
+                        )
+                        if num > 0
+                        else np.array([], dtype='int64')
+                    )
+                    out_py.extend((keep + start).tolist())
+                    out_num_py.append(len(keep))
+                    start = end
+
+                np.testing.assert_array_equal(out.numpy(), out_py)
+                np.testing.assert_array_equal(out_num.numpy(), out_num_py)
+
+    def test_batched_nms_dynamic(self):
+        boxes_nums = [32, 32]
+        for device in self.devices:
+            for dtype in self.dtypes:
+                boxes, scores, _, _ = gen_args(sum(boxes_nums), dtype)
+                paddle.set_device(device)
+                out, out_num = paddle.vision.ops.nms(
+                    paddle.to_tensor(boxes),
+                    self.threshold,
+                    paddle.to_tensor(scores),
+                    boxes_num=paddle.to_tensor(boxes_nums, dtype='int64'),
+                )
+
+                out_py = []
+                for start in [0, 32]:
+                    sorted_idxs = np.argsort(-scores[start : start + 32])
+                    keep = sorted_idxs[
+                        nms(
+                            boxes[start : start + 32][sorted_idxs],
+                            self.threshold,
+                        )
+                    ]
+                    out_py.append(keep + start)
+
+                np.testing.assert_array_equal(
+                    out.numpy(), np.concatenate(out_py)
+                )
+                np.testing.assert_array_equal(
+                    out_num.numpy(), [len(k) for k in out_py]
+                )
+
     @test_with_pir_api
     def test_multiclass_nms_static(self):
         for device in self.devices:
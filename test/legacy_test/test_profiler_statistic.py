@@ -1045,5 +1045,193 @@ class TestProfilerStatistic(unittest.TestCase):
             )
 
 
+class TestOperatorSummary(unittest.TestCase):
+    def build_window(self, offset):
+        root_node = HostPythonNode(
+            'Root Node',
+            profiler.TracerEventType.UserDefined,
+            0,
+            float('inf'),
+            1000,
+            1001,
+        )
+        profilerstep_node = HostPythonNode(
+            'ProfileStep#1',
+            profiler.TracerEventType.ProfileStep,
+            offset,
+            offset + 200,
+            1000,
+            1001,
+        )
+        matmul_node = HostPythonNode(
+            'matmul',
+            profiler.TracerEventType.Operator,
+            offset + 10,
+            offset + 60,
+            1000,
+            1001,
+        )
+        # an operator nested in another operator, e.g. a composite op
+        cast_node = HostPythonNode(
+            'cast',
+            profiler.TracerEventType.Operator,
+            offset + 15,
+            offset + 25,
+            1000,
+            1001,
+        )
+        matmul_compute = HostPythonNode(
+            'matmul::compute',
+            profiler.TracerEventType.OperatorInner,
+            offset + 30,
+            offset + 60,
+            1000,
+            1001,
+        )
+        matmul_launchkernel = HostPythonNode(
+            'cudalaunchkernel',
+            profiler.TracerEventType.CudaRuntime,
+            offset + 30,
+            offset + 40,
+            1000,
+            1001,
+        )
+        cast_launchkernel = HostPythonNode(
+            'cudalaunchkernel',
+            profiler.TracerEventType.CudaRuntime,
+            offset + 16,
+            offset + 20,
+            1000,
+            1001,
+        )
+        cast_memcpy = HostPythonNode(
+            'cudaMemcpy',
+            profiler.TracerEventType.CudaRuntime,
+            offset + 20,
+            offset + 24,
+            1000,
+            1001,
+        )
+        relu_node = HostPythonNode(
+            'relu',
+            profiler.TracerEventType.Operator,
+            offset + 70,
+            offset + 75 + offset // 100,
+            1000,
+            1001,
+        )
+        root_node.children_node.append(profilerstep_node)
+        profilerstep_node.children_node.extend([matmul_node, relu_node])
+        matmul_node.children_node.extend([cast_node, matmul_compute])
+        matmul_compute.runtime_node.append(matmul_launchkernel)
+        cast_node.runtime_node.extend([cast_launchkernel, cast_memcpy])
+        matmul_launchkernel.device_node.append(
+            DevicePythonNode(
+                'matmul_kernel',
+                profiler.TracerEventType.Kernel,
+                offset + 40,
+                offset + 90,
+                0,
+                0,
+                0,
+            )
+        )
+        cast_launchkernel.device_node.append(
+            DevicePythonNode(
+                'cast_kernel',
+                profiler.TracerEventType.Kernel,
+                offset + 20,
+                offset + 28,
+                0,
+                0,
+                0,
+            )
+        )
+        cast_memcpy.device_node.append(
+            DevicePythonNode(
+                'cast_memcpy',
+                profiler.TracerEventType.Memcpy,
+                offset + 28,
+                offset + 31,
+                0,
+                0,
+                0,
+            )
+        )
+        return {'thread1001': root_node}
+
+    def check_items(self, items, expect_items):
+        self.assertEqual(sorted(items.keys()), sorted(expect_items.keys()))
+        for name, expect in expect_items.items():
+            item = items[name]
+            for attr in [
+                'call',
+                'cpu_time',
+                'max_cpu_time',
+                'min_cpu_time',
+                'gpu_time',
+                'max_gpu_time',
+                'min_gpu_time',
+                'general_gpu_time',
+                'max_general_gpu_time',
+                'min_general_gpu_time',
+            ]:
+                self.assertEqual(
+                    getattr(item, attr), getattr(expect, attr), (name, attr)
+                )
+
+    def test_same_as_event_summary(self):
+        window = self.build_window(0)
+        event_summary = profiler_statistic.EventSummary()
+        event_summary.parse(window)
+        operator_summary = profiler_statistic.OperatorSummary()
+        operator_summary.parse(window)
+        self.check_items(operator_summary.items, event_summary.items)
+        self.check_items(
+            operator_summary.thread_items[1001],
+            event_summary.thread_items[1001],
+        )
+        self.assertEqual(operator_summary.items['matmul'].gpu_time, 58)
+        self.assertEqual(operator_summary.items['matmul'].general_gpu_time, 61)
+
+    def test_fold_windows(self):
+        windows = [self.build_window(offset) for offset in [0, 300, 600]]
+        operator_summary = profiler_statistic.OperatorSummary()
+        for window in windows:
+            operator_summary.parse(window)
+        self.assertEqual(operator_summary.num_windows, 3)
+        self.assertEqual(operator_summary.items['relu'].call, 3)
+        self.assertEqual(operator_summary.items['relu'].cpu_time, 5 + 8 + 11)
+        self.assertEqual(operator_summary.items['relu'].max_cpu_time, 11)
+        self.assertEqual(operator_summary.items['relu'].min_cpu_time, 5)
+
+        # merging partial summaries gives the same aggregates
+        first = profiler_statistic.OperatorSummary()
+        first.parse(windows[0])
+        rest = profiler_statistic.OperatorSummary()
+        rest.parse(windows[1])
+        rest.parse(windows[2])
+        merged = first.merge(rest)
+        self.assertEqual(merged.num_windows, 3)
+        self.check_items(merged.items, operator_summary.items)
+        self.check_items(
+            merged.thread_items[1001], operator_summary.thread_items[1001]
+        )
+
+        self.assertEqual(
+            [
+                item.name
+                for item in operator_summary.sorted_items(
+                    profiler.SortedKeys.CPUTotal
+                )
+            ],
+            ['matmul', 'cast', 'relu'],
+        )
+        self.assertEqual(
+            operator_summary.sorted_items(profiler.SortedKeys.CPUMin)[0].name,
+            'relu',
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
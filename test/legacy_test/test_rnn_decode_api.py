@@ -705,5 +705,61 @@ class TestDynamicDecode(ModuleApiTest):
             self.check_output()
 
 
+class TestBeamSearchStateReorder(unittest.TestCase):
+    def test_gather_beams(self):
+        with base.dygraph.guard(base.CPUPlace()):
+            batch_size, beam_size, hidden_size = 3, 4, 5
+            decoder = BeamSearchDecoder(
+                LSTMCell(hidden_size, hidden_size),
+                start_token=0,
+                end_token=1,
+                beam_size=beam_size,
+            )
+            decoder.initialize(
+                paddle.zeros([batch_size, hidden_size], dtype="float32")
+            )
+            x = paddle.rand([batch_size, beam_size, hidden_size])
+            finished = paddle.to_tensor(
+                np.random.rand(batch_size, beam_size) > 0.5
+            )
+            beam_indices = paddle.to_tensor(
+                np.random.randint(0, beam_size, (batch_size, beam_size)),
+                dtype="int64",
+            )
+            flat_indices = paddle.reshape(
+                beam_indices + decoder.batch_beam_offsets, [-1, 1]
+            )
+            np.testing.assert_array_equal(
+                decoder._gather_beams(x, flat_indices).numpy(),
+                decoder._gather(x, beam_indices, decoder.batch_size).numpy(),
+            )
+            np.testing.assert_array_equal(
+                decoder._gather_beams(finished, flat_indices).numpy(),
+                decoder._gather(
+                    finished, beam_indices, decoder.batch_size
+                ).numpy(),
+            )
+
+    def test_maybe_copy(self):
+        with base.dygraph.guard(base.CPUPlace()):
+            step_mask = paddle.to_tensor([True, False, True])
+            state = paddle.rand([3, 2, 4])
+            new_state = paddle.rand([3, 2, 4])
+            out = paddle.nn.decode._maybe_copy(state, new_state, step_mask)
+            expected = np.where(
+                step_mask.numpy()[:, None, None],
+                state.numpy(),
+                new_state.numpy(),
+            )
+            np.testing.assert_array_equal(out.numpy(), expected)
+
+            state = paddle.to_tensor([[True], [True], [False]])
+            new_state = paddle.to_tensor([[False], [False], [True]])
+            out = paddle.nn.decode._maybe_copy(state, new_state, step_mask)
+            np.testing.assert_array_equal(
+                out.numpy(), [[True], [False], [False]]
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+def get_cuda_version():
+    result = os.popen("nvcc --version").read()
+    regex = r'release (\S+),'
+    match = re.search(regex, result)
+    if match:
+        num = str(match.group(1))
+        integer, decimal = num.split('.')
+        return int(integer) * 1000 + int(float(decimal) * 10)
+    else:
+        return -1
+
+
+def random_dense(shape, density=0.5):
+    mask = paddle.rand(shape) < density
+    return paddle.rand(shape) * mask.astype('float32')
+
+
+class TestSparseFormatCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.dense = random_dense([8, 6])
+        self.coo = self.dense.to_sparse_coo(2)
+
+    def test_cached(self):
+        csr = paddle.sparse.as_sparse_csr(self.coo)
+        self.assertTrue(csr.is_sparse_csr())
+        np.testing.assert_allclose(csr.to_dense().numpy(), self.dense.numpy())
+        self.assertIs(paddle.sparse.as_sparse_csr(self.coo), csr)
+        self.assertIs(paddle.sparse.as_sparse_csr(csr), csr)
+
+        coo = paddle.sparse.as_sparse_coo(csr)
+        self.assertTrue(coo.is_sparse_coo())
+        np.testing.assert_allclose(coo.to_dense().numpy(), self.dense.numpy())
+        self.assertIs(paddle.sparse.as_sparse_coo(csr), coo)
+        self.assertIs(paddle.sparse.as_sparse_coo(self.coo), self.coo)
+
+    def test_dense_input(self):
+        csr = paddle.sparse.as_sparse_csr(self.dense)
+        np.testing.assert_allclose(csr.to_dense().numpy(), self.dense.numpy())
+        self.assertIs(paddle.sparse.as_sparse_csr(self.dense), csr)
+
+    def test_invalidated_by_inplace(self):
+        csr = paddle.sparse.as_sparse_csr(self.coo)
+        self.coo.values().scale_(2.0)
+        new_csr = paddle.sparse.as_sparse_csr(self.coo)
+        self.assertIsNot(new_csr, csr)
+        np.testing.assert_allclose(
+            new_csr.to_dense().numpy(), self.dense.numpy() * 2.0
+        )
+
+    def test_not_cached_with_gradient(self):
+        self.coo.stop_gradient = False
+        csr = paddle.sparse.as_sparse_csr(self.coo)
+        self.assertIsNot(paddle.sparse.as_sparse_csr(self.coo), csr)
+
+    def test_released_with_input(self):
+        from paddle.sparse.conversion import _converted_tensors
+
+        key = id(self.coo)
+        paddle.sparse.as_sparse_csr(self.coo)
+        self.assertIn(key, _converted_tensors)
+        del self.coo
+        self.assertNotIn(key, _converted_tensors)
+
+
+class TestMatmulFormatSelection(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_same_operand_twice(self):
+        from paddle.sparse.conversion import _select_matmul_format
+
+        dense_x = random_dense([16, 12])
+        coo = dense_x.to_sparse_coo(2)
+        y = paddle.rand([12, 4])
+        x1, _, _ = _select_matmul_format(coo, y)
+        x2, _, _ = _select_matmul_format(coo, y)
+        self.assertIs(x2, x1)
+        if paddle.is_compiled_with_cuda() and get_cuda_version() >= 11000:
+            for _ in range(2):
+                out = paddle.sparse.matmul(coo, y)
+                np.testing.assert_allclose(
+                    out.numpy(), paddle.matmul(dense_x, y).numpy(), rtol=1e-05
+                )
+
+    @unittest.skipIf(
+        not paddle.is_compiled_with_cuda() or get_cuda_version() < 11000,
+        "only support cuda>=11.0",
+    )
+    def test_coo_dense(self):
+        dense_x = random_dense([16, 12])
+        coo = dense_x.to_sparse_coo(2)
+        y = paddle.rand([12, 4])
+        y.stop_gradient = False
+        for _ in range(2):
+            out = paddle.sparse.matmul(coo, y)
+            np.testing.assert_allclose(
+                out.numpy(), paddle.matmul(dense_x, y).numpy(), rtol=1e-05
+            )
+        out.backward()
+        expected_grad = paddle.matmul(
+            dense_x, paddle.ones([16, 4]), transpose_x=True
+        )
+        np.testing.assert_allclose(
+            y.grad.numpy(), expected_grad.numpy(), rtol=1e-05
+        )
+
+        vec = paddle.rand([12])
+        np.testing.assert_allclose(
+            paddle.sparse.mv(coo, vec).numpy(),
+            paddle.mv(dense_x, vec).numpy(),
+            rtol=1e-05,
+        )
+
+    @unittest.skipIf(
+        not paddle.is_compiled_with_cuda() or get_cuda_version() < 11000,
+        "only support cuda>=11.0",
+    )
+    def test_coo_coo(self):
+        dense_x = random_dense([16, 12])
+        dense_y = random_dense([12, 4])
+        out = paddle.sparse.matmul(
+            dense_x.to_sparse_coo(2), dense_y.to_sparse_coo(2)
+        )
+        self.assertTrue(out.is_sparse_coo())
+        np.testing.assert_allclose(
+            out.to_dense().numpy(),
+            paddle.matmul(dense_x, dense_y).numpy(),
+            rtol=1e-05,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1063,6 +1063,93 @@ class TestTransformer(unittest.TestCase):
         )
         mask = transformer.generate_square_subsequent_mask(length)
 
+    def test_multi_head_attention_preallocated_cache(self):
+        batch_size, embed_dim, num_heads, max_length = 3, 16, 4, 8
+        with base.dygraph.guard(base.CPUPlace()):
+            paddle.seed(2024)
+            attn = MultiHeadAttention(embed_dim, num_heads)
+            attn.eval()
+            query = paddle.rand((batch_size, 1, embed_dim))
+            cache = attn.gen_cache(query, type=attn.Cache)
+            prealloc = attn.gen_cache(
+                query, type=attn.PreallocatedCache, max_length=max_length
+            )
+            buffer_k = prealloc.k
+            for _ in range(4):
+                step = paddle.rand((batch_size, 1, embed_dim))
+                out, cache = attn(step, cache=cache)
+                out_prealloc, prealloc = attn(step, cache=prealloc)
+                np.testing.assert_allclose(
+                    out.numpy(), out_prealloc.numpy(), rtol=1e-5, atol=1e-6
+                )
+            # keys and values are written in place
+            self.assertIs(prealloc.k, buffer_k)
+            np.testing.assert_array_equal(prealloc.seq_lens.numpy(), [4] * 3)
+            np.testing.assert_allclose(
+                prealloc.k.numpy()[:, :, :4], cache.k.numpy(), rtol=1e-6
+            )
+
+    def test_multi_head_attention_preallocated_cache_ragged(self):
+        embed_dim, num_heads, max_length = 16, 4, 8
+        with base.dygraph.guard(base.CPUPlace()):
+            paddle.seed(2024)
+            attn = MultiHeadAttention(embed_dim, num_heads)
+            attn.eval()
+            lengths = [1, 3]
+            prefix = paddle.rand((2, 3, embed_dim))
+            prealloc = attn.gen_cache(
+                prefix, type=attn.PreallocatedCache, max_length=max_length
+            )
+            # fill the slots with prefixes of different lengths
+            k, v = attn.compute_kv(prefix, prefix)
+            prealloc = attn._update_preallocated_cache(prealloc, k, v)
+            prealloc = attn.PreallocatedCache(
+                prealloc.k,
+                prealloc.v,
+                paddle.to_tensor(lengths, dtype='int64'),
+            )
+            step = paddle.rand((2, 1, embed_dim))
+            out_prealloc, prealloc = attn(step, cache=prealloc)
+            np.testing.assert_array_equal(prealloc.seq_lens.numpy(), [2, 4])
+
+            for i, length in enumerate(lengths):
+                cache = attn.gen_cache(
+                    k[i : i + 1, :, :length], v[i : i + 1, :, :length]
+                )
+                out, _ = attn(step[i : i + 1], cache=cache)
+                np.testing.assert_allclose(
+                    out.numpy(),
+                    out_prealloc.numpy()[i : i + 1],
+                    rtol=1e-5,
+                    atol=1e-6,
+                )
+
+    def test_decoder_preallocated_cache(self):
+        batch_size, d_model, n_head, dim_feedforward = 2, 8, 2, 16
+        source_length, max_length = 5, 6
+        with base.dygraph.guard(base.CPUPlace()):
+            paddle.seed(2024)
+            decoder_layer = TransformerDecoderLayer(
+                d_model, n_head, dim_feedforward, dropout=0.0
+            )
+            decoder = TransformerDecoder(decoder_layer, 2)
+            decoder.eval()
+            memory = paddle.rand((batch_size, source_length, d_model))
+            caches = decoder.gen_cache(memory)
+            prealloc_caches = decoder.gen_cache(memory, max_length=max_length)
+            self.assertIsInstance(
+                prealloc_caches[0][0], MultiHeadAttention.PreallocatedCache
+            )
+            for _ in range(3):
+                tgt = paddle.rand((batch_size, 1, d_model))
+                out, caches = decoder(tgt, memory, cache=caches)
+                out_prealloc, prealloc_caches = decoder(
+                    tgt, memory, cache=prealloc_caches
+                )
+                np.testing.assert_allclose(
+                    out.numpy(), out_prealloc.numpy(), rtol=1e-5, atol=1e-6
+                )
+
 
 class TestPirMultiHeadAttention(unittest.TestCase):
     def run_program(self):
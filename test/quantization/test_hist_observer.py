@@ -0,0 +1,127 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.nn import Linear, Sequential
+from paddle.quantization import PTQ, QuantConfig
+from paddle.quantization.observers import AbsmaxObserver, HistObserver
+from paddle.quantization.observers.hist import (
+    HistObserverLayer,
+    rebin_histogram,
+)
+
+
+class TestHistObserver(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2024)
+        # the range of the batches grows, so the histogram is re-binned
+        self.batches = [
+            (np.random.randn(64, 32) * scale).astype('float32')
+            for scale in [0.5, 1.0, 3.0, 2.0, 7.0]
+        ]
+        self.data = np.abs(np.concatenate([b.ravel() for b in self.batches]))
+
+    def observe(self, batches, **kwargs):
+        observer = HistObserverLayer(None, **kwargs)
+        for batch in batches:
+            observer(paddle.to_tensor(batch))
+        return observer
+
+    def test_streaming_histogram(self):
+        observer = self.observe(self.batches, method="percent", percent=0.99)
+        self.assertEqual(observer._hist.shape, (2048,))
+        self.assertAlmostEqual(observer._hist.sum(), self.data.size)
+        self.assertGreaterEqual(observer._hist_max, self.data.max())
+        bin_width = observer._hist_max / 2048
+        np.testing.assert_allclose(
+            float(observer.scales()),
+            np.percentile(self.data, 99),
+            atol=2 * bin_width,
+        )
+
+    def test_methods(self):
+        abs_max = self.data.max()
+        for method in ["percent", "mse", "kl"]:
+            observer = self.observe(self.batches, method=method)
+            scale = float(observer.scales())
+            self.assertGreater(scale, 0.0)
+            self.assertLessEqual(scale, observer._hist_max)
+            self.assertEqual(float(observer.zero_points()), 0.0)
+        # mse clips the long tail of the gaussian data
+        mse_observer = self.observe(self.batches, method="mse")
+        self.assertLess(float(mse_observer.scales()), abs_max)
+
+    def test_merge(self):
+        observer = self.observe(self.batches)
+        first = self.observe(self.batches[:2])
+        second = self.observe(self.batches[2:])
+        first.merge(second)
+        self.assertGreaterEqual(first._hist_max, self.data.max())
+        np.testing.assert_allclose(first._hist.sum(), observer._hist.sum())
+        np.testing.assert_allclose(
+            float(first.scales()), float(observer.scales()), rtol=0.02
+        )
+
+    def test_zero_input(self):
+        observer = self.observe([np.zeros([4, 4], dtype='float32')])
+        self.assertEqual(observer._hist[0], 16)
+        self.assertAlmostEqual(
+            float(observer.scales()), HistObserverLayer.INIT_ABS_MAX
+        )
+        observer(paddle.to_tensor(self.batches[0]))
+        self.assertEqual(observer._hist.sum(), 16 + self.batches[0].size)
+
+    def test_rebin(self):
+        hist = np.random.rand(16)
+        rebinned = rebin_histogram(hist, 1.0, 4.0)
+        np.testing.assert_allclose(rebinned[:4], hist.reshape([4, 4]).sum(1))
+        np.testing.assert_allclose(rebinned[4:], 0.0, atol=1e-12)
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            HistObserverLayer(None, method="max")
+
+
+class LinearDygraph(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.fc = Sequential(Linear(16, 16), Linear(16, 16))
+
+    def forward(self, inputs):
+        return self.fc(inputs)
+
+
+class TestPTQWithHistObserver(unittest.TestCase):
+    def test_quantize(self):
+        model = LinearDygraph()
+        model.eval()
+        q_config = QuantConfig(
+            activation=HistObserver(bins=512, method="kl"),
+            weight=AbsmaxObserver(),
+        )
+        ptq = PTQ(q_config)
+        quant_model = ptq.quantize(model)
+        for _ in range(4):
+            quant_model(paddle.rand([8, 16], dtype="float32"))
+        converted_model = ptq.convert(quant_model)
+        out = converted_model(paddle.rand([8, 16], dtype="float32"))
+        self.assertEqual(out.shape, [8, 16])
+
+
+if __name__ == '__main__':
+    unittest.main()
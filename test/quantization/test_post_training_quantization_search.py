@@ -0,0 +1,146 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from paddle.static.quantization.cal_kl_threshold import (
+    cal_kl_threshold,
+    expand_quantized_bins,
+    safe_entropy,
+)
+from paddle.static.quantization.post_training_quantization import (
+    _search_act_threshold,
+)
+
+
+def search_threshold_loop(var_tensor, bits, onnx_format, loss_type):
+    abs_max_value = float(np.max(np.abs(var_tensor)))
+    abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
+    best_loss, best_scale = float('inf'), None
+    s = 0.3
+    while s <= 1.0:
+        scale = s * abs_max_value
+        s += 0.02
+        bins = 2 ** (bits - 1) - 1
+        if onnx_format:
+            quant_var = np.clip(
+                np.round(var_tensor / scale * bins), -bins - 1, bins
+            )
+            quant_dequant_var = quant_var / bins * scale
+        else:
+            quant_dequant_var = (
+                np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
+                / bins
+                * scale
+            )
+        if loss_type == "mse":
+            loss = ((var_tensor - quant_dequant_var) ** 2).mean()
+        else:
+            loss = np.abs(
+                np.mean(var_tensor) - np.mean(quant_dequant_var)
+            ) + np.abs(np.std(var_tensor) - np.std(quant_dequant_var))
+        if loss <= best_loss:
+            best_loss, best_scale = loss, scale
+    return best_loss, best_scale
+
+
+def cal_kl_threshold_loop(hist, bin_width, bits):
+    hist_bins = hist.shape[0]
+    starting_iter = int((hist_bins - 1) * 0.5)
+    quant_range = 2 ** (bits - 1) - 1
+    P_sum = np.sum(np.array(hist).ravel())
+    min_kl_divergence, min_kl_index = 0, 0
+    kl_inited = False
+    for i in range(starting_iter, hist_bins):
+        reference_distr_P = hist[0:i].tolist()
+        outliers_count = sum(hist[i:])
+        if reference_distr_P[i - 1] == 0:
+            continue
+        reference_distr_P[i - 1] += outliers_count
+        reference_distr_bins = reference_distr_P[:]
+        candidate_distr_Q = hist[0:i].tolist()
+        num_merged_bins = int(i / quant_range)
+        candidate_distr_Q_quantized = [0] * quant_range
+        j_start, j_end = 0, num_merged_bins
+        for idx in range(quant_range):
+            candidate_distr_Q_quantized[idx] = sum(
+                candidate_distr_Q[j_start:j_end]
+            )
+            j_start += num_merged_bins
+            j_end += num_merged_bins
+            if (idx + 1) == quant_range - 1:
+                j_end = i
+        candidate_distr_Q = expand_quantized_bins(
+            candidate_distr_Q_quantized, reference_distr_bins
+        )
+        Q_sum = sum(candidate_distr_Q)
+        kl_divergence = safe_entropy(
+            reference_distr_P, P_sum, candidate_distr_Q, Q_sum
+        )
+        if not kl_inited or kl_divergence < min_kl_divergence:
+            min_kl_divergence, min_kl_index = kl_divergence, i
+            kl_inited = True
+    if min_kl_index == 0:
+        while starting_iter > 0 and hist[starting_iter] == 0:
+            starting_iter -= 1
+        min_kl_index = starting_iter
+    return (min_kl_index + 0.5) * bin_width
+
+
+class TestSearchActThreshold(unittest.TestCase):
+    def test_same_as_loop(self):
+        np.random.seed(2024)
+        for numel in [7, 1000, 50000]:
+            var_tensor = (np.random.randn(numel) * 3).astype('float32')
+            for onnx_format in [False, True]:
+                for loss_type in ["mse", "emd"]:
+                    expect_loss, expect_scale = search_threshold_loop(
+                        var_tensor, 8, onnx_format, loss_type
+                    )
+                    loss, scale = _search_act_threshold(
+                        var_tensor, 8, onnx_format, loss_type
+                    )
+                    self.assertEqual(scale, expect_scale)
+                    np.testing.assert_allclose(
+                        loss, expect_loss, rtol=1e-3, atol=1e-6
+                    )
+
+    def test_zero_tensor(self):
+        var_tensor = np.zeros([16], dtype='float32')
+        loss, scale = _search_act_threshold(var_tensor, 8, False, "mse")
+        _, expect_scale = search_threshold_loop(var_tensor, 8, False, "mse")
+        self.assertEqual(loss, 0.0)
+        # the last threshold is taken on ties
+        self.assertEqual(scale, expect_scale)
+        self.assertGreater(scale, 0.9e-8)
+
+
+class TestCalKLThreshold(unittest.TestCase):
+    def test_same_as_loop(self):
+        np.random.seed(2024)
+        for bins in [64, 300, 2048]:
+            data = np.abs(np.random.randn(100000))
+            hist, hist_edges = np.histogram(data, bins=bins)
+            bin_width = hist_edges[1] - hist_edges[0]
+            for bits in [4, 8]:
+                self.assertAlmostEqual(
+                    cal_kl_threshold(hist, bin_width, bits),
+                    cal_kl_threshold_loop(hist, bin_width, bits),
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
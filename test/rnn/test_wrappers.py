@@ -193,6 +193,77 @@ class TestBiRNNWrapper(unittest.TestCase):
         self.test_with_input_lengths()
 
 
+class TestRNNFusedInputProjection(unittest.TestCase):
+    def __init__(self, cell_type, place="cpu"):
+        super().__init__("runTest")
+        self.cell_type = cell_type
+        self.place = (
+            paddle.CPUPlace() if place == "cpu" else paddle.CUDAPlace(0)
+        )
+
+    def setUp(self):
+        paddle.disable_static(self.place)
+
+        class StepwiseCell(self.cell_type):
+            # overriding forward disables the hoisted input projection
+            def forward(self, inputs, states=None):
+                return super().forward(inputs, states)
+
+        cell1 = self.cell_type(16, 32)
+        cell2 = StepwiseCell(16, 32)
+        cell2.set_state_dict(cell1.state_dict())
+        self.rnn1 = paddle.nn.RNN(cell1)
+        self.rnn2 = paddle.nn.RNN(cell2)
+
+    def runTest(self):
+        x = paddle.to_tensor(np.random.randn(4, 12, 16))
+        sequence_length = paddle.to_tensor([12, 10, 9, 8], dtype="int64")
+        for seq_len in [None, sequence_length]:
+            y1, h1 = self.rnn1(x, sequence_length=seq_len)
+            y2, h2 = self.rnn2(x, sequence_length=seq_len)
+            np.testing.assert_allclose(
+                y1.numpy(), y2.numpy(), atol=1e-8, rtol=1e-5
+            )
+            for s1, s2 in zip(
+                paddle.utils.flatten(h1), paddle.utils.flatten(h2)
+            ):
+                np.testing.assert_allclose(
+                    s1.numpy(), s2.numpy(), atol=1e-8, rtol=1e-5
+                )
+
+
+class TestRNNCellWithWeightNorm(unittest.TestCase):
+    def __init__(self, cell_type, place="cpu"):
+        super().__init__("runTest")
+        self.cell_type = cell_type
+        self.place = (
+            paddle.CPUPlace() if place == "cpu" else paddle.CUDAPlace(0)
+        )
+
+    def setUp(self):
+        paddle.disable_static(self.place)
+
+        class StepwiseCell(self.cell_type):
+            def forward(self, inputs, states=None):
+                return super().forward(inputs, states)
+
+        cell1 = self.cell_type(16, 32)
+        cell2 = StepwiseCell(16, 32)
+        cell2.set_state_dict(cell1.state_dict())
+        for cell in [cell1, cell2]:
+            paddle.nn.utils.weight_norm(cell, name="weight_ih")
+            # the weight is only updated by the forward pre hook
+            cell.weight_ih_g.set_value(cell.weight_ih_g * 2.0)
+        self.rnn1 = paddle.nn.RNN(cell1)
+        self.rnn2 = paddle.nn.RNN(cell2)
+
+    def runTest(self):
+        x = paddle.to_tensor(np.random.randn(4, 12, 16).astype("float32"))
+        y1, _ = self.rnn1(x)
+        y2, _ = self.rnn2(x)
+        np.testing.assert_allclose(y1.numpy(), y2.numpy(), atol=1e-6, rtol=1e-5)
+
+
 def load_tests(loader, tests, pattern):
     suite = unittest.TestSuite()
     devices = ["cpu", "gpu"] if paddle.base.is_compiled_with_cuda() else ["cpu"]
@@ -201,4 +272,12 @@ def load_tests(loader, tests, pattern):
             for time_major in [False]:
                 suite.addTest(TestRNNWrapper(time_major, direction, device))
             suite.addTest(TestBiRNNWrapper(time_major, device))
+    for cell_type in [
+        paddle.nn.SimpleRNNCell,
+        paddle.nn.LSTMCell,
+        paddle.nn.GRUCell,
+    ]:
+        for device in devices:
+            suite.addTest(TestRNNFusedInputProjection(cell_type, device))
+            suite.addTest(TestRNNCellWithWeightNorm(cell_type, device))
     return suite
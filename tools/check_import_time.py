@@ -0,0 +1,158 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the time spent in ``import paddle``, broken down by subpackage.
+
+Usage:
+    python tools/check_import_time.py --repeat 5 --output import_time.json
+    python tools/check_import_time.py --baseline import_time.json --threshold 0.1
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+TOTAL = "<total>"
+
+
+def parse_importtime(log):
+    """Parse ``python -X importtime`` output.
+
+    Returns a dict which maps each ``paddle.xxx`` subpackage to the self time
+    (in us) of all modules under it, plus the cumulative time of ``paddle``
+    itself under the ``<total>`` key. Modules that are directly in ``paddle``
+    (e.g. ``paddle.version``) are counted under their own name, and the self
+    time of ``paddle/__init__.py`` under ``paddle``.
+    """
+    result = defaultdict(int)
+    for line in log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        name = name.strip()
+        if not self_us.strip().isdigit():
+            # header line
+            continue
+        if name == "paddle":
+            result[TOTAL] = int(cumulative_us)
+        parts = name.split(".")
+        if parts[0] != "paddle":
+            continue
+        result[".".join(parts[:2])] += int(self_us)
+    return dict(result)
+
+
+def measure(python, repeat):
+    """Run ``import paddle`` in fresh interpreters and keep the fastest run
+    of each subpackage, which is the least disturbed by the system noise."""
+    best = {}
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [python, "-X", "importtime", "-c", "import paddle"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=env,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"import paddle failed:\n{proc.stderr}")
+        for name, us in parse_importtime(proc.stderr).items():
+            best[name] = min(us, best.get(name, us))
+    return best
+
+
+def compare(baseline, current, threshold, min_us):
+    """Return the entries of ``current`` that are slower than ``baseline``
+    by more than ``threshold`` (relative) and ``min_us`` (absolute)."""
+    regressions = []
+    for name, us in sorted(current.items()):
+        base_us = baseline.get(name, 0)
+        if us - base_us <= min_us:
+            continue
+        if base_us > 0 and (us - base_us) / base_us <= threshold:
+            continue
+        regressions.append((name, base_us, us))
+    return regressions
+
+
+def print_breakdown(result, top_k):
+    total = result.get(TOTAL, 0)
+    print(f"import paddle: {total / 1e3:.1f} ms")
+    items = sorted(
+        ((k, v) for k, v in result.items() if k != TOTAL),
+        key=lambda x: x[1],
+        reverse=True,
+    )
+    for name, us in items[:top_k]:
+        ratio = us / total * 100 if total else 0.0
+        print(f"  {name:<32} {us / 1e3:>10.1f} ms {ratio:>6.1f}%")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--python", default=sys.executable)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top_k", type=int, default=20)
+    parser.add_argument(
+        "--output", default=None, help="save the breakdown as json"
+    )
+    parser.add_argument(
+        "--baseline", default=None, help="json saved by a previous run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed relative slowdown compared with the baseline",
+    )
+    parser.add_argument(
+        "--min_us",
+        type=int,
+        default=20000,
+        help="slowdowns smaller than this (in us) are ignored as noise",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    result = measure(args.python, args.repeat)
+    print_breakdown(result, args.top_k)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, result, args.threshold, args.min_us)
+        for name, base_us, us in regressions:
+            logging.error(
+                f"{name} import time regressed: {base_us / 1e3:.1f} ms -> {us / 1e3:.1f} ms"
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+TestCases for check_import_time.py
+"""
+import unittest
+
+from check_import_time import TOTAL, compare, parse_importtime
+
+LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   numpy.version
+import time:      3000 |       3120 | numpy
+import time:       200 |        200 |       paddle.base.core
+import time:       800 |       1000 |     paddle.base
+import time:       500 |        500 |       paddle.nn.functional
+import time:       300 |        800 |     paddle.nn
+import time:        50 |         50 |     paddle.version
+import time:       100 |       1950 |   paddle
+"""
+
+
+class TestParseImportTime(unittest.TestCase):
+    def test_parse(self):
+        result = parse_importtime(LOG)
+        self.assertEqual(result[TOTAL], 1950)
+        self.assertEqual(result['paddle.base'], 1000)
+        self.assertEqual(result['paddle.nn'], 800)
+        self.assertEqual(result['paddle.version'], 50)
+        self.assertEqual(result['paddle'], 100)
+        self.assertNotIn('numpy', result)
+
+    def test_compare(self):
+        baseline = {TOTAL: 100000, 'paddle.nn': 50000, 'paddle.io': 1000}
+        current = {
+            TOTAL: 105000,
+            'paddle.nn': 80000,
+            'paddle.io': 3000,
+            'paddle.text': 40000,
+        }
+        regressions = compare(baseline, current, 0.1, 20000)
+        self.assertEqual(
+            regressions,
+            [('paddle.nn', 50000, 80000), ('paddle.text', 0, 40000)],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()